@@ -0,0 +1,374 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import time
+from collections import namedtuple
+
+from Tuleap.RestClient.Filter import FilterQuery, LogicalOperation, Negation, NumericFilterItem, \
+    NumericInRangeFilterItem, NumericOutOfRangeFilterItem, StringComparisonOperation, \
+    StringFilterItem
+
+# Public -------------------------------------------------------------------------------------------
+
+
+NodeStatistics = namedtuple("NodeStatistics", ["depth",
+                                               "description",
+                                               "evaluations",
+                                               "passes",
+                                               "pass_rate",
+                                               "average_cost"])
+
+
+class AdaptiveFilterQuery(object):
+    """
+    Filter query that reorders the items of its "and" and "or" (sub)queries while it is executed.
+
+    The result of an "and" query is known as soon as one item does not match, and the result of an
+    "or" query as soon as one item matches. For every query item the pass rate and the (sampled)
+    execution time are tracked, and the items are periodically reordered so that the items that
+    are cheap and most likely decide the result are executed first.
+
+    The results are the same as the results of the original query, as long as the query items do
+    not raise exceptions (an exception of an item is only raised if the item is executed, which
+    depends on the order of the items).
+
+    The statistics of all query items can be inspected with "get_statistics" and the reordered
+    query can be converted back to a FilterQuery (e.g. to compile it).
+
+    Fields type information:
+    :type _root: _QueryNode
+    """
+
+    def __init__(self, query, reorder_interval=1000, sample_interval=16):
+        """
+        Constructor
+
+        :param FilterQuery query: filter query
+        :param int reorder_interval: Number of executions of a (sub)query after which its items
+                                     are reordered
+        :param int sample_interval: Only every N-th execution of a query item is timed
+        """
+        if (reorder_interval < 1) or (sample_interval < 1):
+            raise ValueError("Error: the intervals must be at least 1")
+
+        self._root = _QueryNode(query, reorder_interval, sample_interval)
+
+    def execute(self, item):
+        """
+        execute query
+
+        :param dict item: Dictionary object that should be filtered
+
+        :return: Query execution result (item either matches or does not match the filter query)
+        :rtype: bool
+        """
+        return self._root.evaluate(item)
+
+    def filter(self, items):
+        """
+        execute query on all items
+
+        :param items: Dictionary objects that should be filtered
+        :type items: collections.Iterable[dict]
+
+        :return: generator of the matching items
+        :rtype: collections.Iterable[dict]
+        """
+        evaluate = self._root.evaluate
+
+        for item in items:
+            if evaluate(item):
+                yield item
+
+    def get_statistics(self):
+        """
+        Get the statistics of the query and all its items (depth first, in the current order)
+
+        :return: statistics of all nodes, the average cost is in seconds (None if the node was not
+                 timed yet)
+        :rtype: list[NodeStatistics]
+        """
+        statistics = []
+        self._root.collect_statistics(0, statistics)
+
+        return statistics
+
+    def format_statistics(self):
+        """
+        :return: statistics of all nodes as text (one line per node)
+        :rtype: str
+        """
+        lines = []
+
+        for node in self.get_statistics():
+            lines.append("{:}{:} evaluations: {:}, pass rate: {:.3f}, average cost: {:}".format(
+                "  " * node.depth,
+                node.description,
+                node.evaluations,
+                node.pass_rate,
+                "{:.0f} ns".format(node.average_cost * 1e9) if node.average_cost is not None
+                else "-"))
+
+        return "\n".join(lines)
+
+    def reset_statistics(self):
+        """
+        Reset the statistics (the current order is kept)
+        """
+        self._root.reset()
+
+    def to_filter_query(self):
+        """
+        Convert the query (with the items in the current order) to a FilterQuery
+
+        :rtype: FilterQuery
+        """
+        return self._root.to_filter_query()
+
+
+def describe_query_item(query_item):
+    """
+    Get a short description of a filter item or a (sub)query
+
+    :param query_item: filter item or filter query
+
+    :return: description (e.g. "points GreaterThan 3" or "Or")
+    :rtype: str
+    """
+    if isinstance(query_item, FilterQuery):
+        description = query_item.get_logical_operation().name
+
+        if query_item.get_negation() == Negation.Enabled:
+            description = "Not " + description
+
+        return description
+
+    if isinstance(query_item, (NumericFilterItem, StringFilterItem)):
+        return "{:} {:} {!r}".format(query_item.get_key(),
+                                     query_item.get_comparison_operation().name,
+                                     query_item.get_value())
+
+    if isinstance(query_item, NumericOutOfRangeFilterItem):
+        return "not " + describe_query_item(query_item.get_in_range_filter())
+
+    if isinstance(query_item, NumericInRangeFilterItem):
+        return "{:} in {:}{!r}, {!r}{:}".format(query_item.get_key(),
+                                                "[" if query_item.is_lower_limit_included()
+                                                else "(",
+                                                query_item.get_lower_limit(),
+                                                query_item.get_upper_limit(),
+                                                "]" if query_item.is_upper_limit_included()
+                                                else ")")
+
+    return type(query_item).__name__
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+# Relative cost estimates used before a node has been timed
+_NUMERIC_COST = 1.0
+_RANGE_COST = 1.5
+_STRING_COST = 2.0
+_STRING_SEARCH_COST = 3.0
+
+
+def _estimated_cost(query_item):
+    """
+    Static cost estimate of a query item (relative units)
+    """
+    if isinstance(query_item, FilterQuery):
+        return sum(_estimated_cost(child) for child in query_item.get_query_items()) + 0.5
+
+    if isinstance(query_item, NumericFilterItem):
+        return _NUMERIC_COST
+
+    if isinstance(query_item, (NumericInRangeFilterItem, NumericOutOfRangeFilterItem)):
+        return _RANGE_COST
+
+    if isinstance(query_item, StringFilterItem):
+        if query_item.get_comparison_operation() in (StringComparisonOperation.EqualTo,
+                                                     StringComparisonOperation.NotEqualTo):
+            return _STRING_COST
+
+        return _STRING_SEARCH_COST
+
+    return _STRING_SEARCH_COST
+
+
+class _Node(object):
+    """
+    Query item with its execution statistics
+    """
+
+    def __init__(self, query_item, sample_interval):
+        self.query_item = query_item
+        self.sample_interval = sample_interval
+        self.countdown = sample_interval
+        self.estimated_cost = _estimated_cost(query_item)
+        self.evaluations = 0
+        self.passes = 0
+        self.timed_evaluations = 0
+        self.time = 0.0
+
+    def evaluate(self, item):
+        self.evaluations += 1
+        self.countdown -= 1
+
+        if self.countdown == 0:
+            self.countdown = self.sample_interval
+            start = time.perf_counter()
+            result = self.evaluate_item(item)
+            self.time += time.perf_counter() - start
+            self.timed_evaluations += 1
+        else:
+            result = self.evaluate_item(item)
+
+        if result:
+            self.passes += 1
+
+        return result
+
+    def evaluate_item(self, item):
+        raise NotImplementedError()
+
+    def get_pass_rate(self):
+        if self.evaluations == 0:
+            return 0.5
+
+        return float(self.passes) / self.evaluations
+
+    def get_average_cost(self):
+        if self.timed_evaluations == 0:
+            return None
+
+        return self.time / self.timed_evaluations
+
+    def reset(self):
+        self.evaluations = 0
+        self.passes = 0
+        self.timed_evaluations = 0
+        self.time = 0.0
+
+    def collect_statistics(self, depth, statistics):
+        statistics.append(NodeStatistics(depth,
+                                         describe_query_item(self.query_item),
+                                         self.evaluations,
+                                         self.passes,
+                                         self.get_pass_rate(),
+                                         self.get_average_cost()))
+
+    def to_filter_query(self):
+        return self.query_item
+
+
+class _ItemNode(_Node):
+    """
+    Filter item node
+    """
+
+    def __init__(self, query_item, sample_interval):
+        _Node.__init__(self, query_item, sample_interval)
+        self.evaluate_item = query_item.compile()
+
+
+class _QueryNode(_Node):
+    """
+    (Sub)query node, reorders its children
+    """
+
+    def __init__(self, query, reorder_interval, sample_interval):
+        _Node.__init__(self, query, sample_interval)
+        self.reorder_interval = reorder_interval
+        self.until_reorder = reorder_interval
+        self.is_and = (query.get_logical_operation() == LogicalOperation.And)
+        self.negated = (query.get_negation() == Negation.Enabled)
+        self.children = []
+
+        if query.get_logical_operation() not in (LogicalOperation.And, LogicalOperation.Or):
+            raise Exception("Error: invalid logical operation!")
+
+        for query_item in query.get_query_items():
+            if isinstance(query_item, FilterQuery):
+                self.children.append(_QueryNode(query_item, reorder_interval, sample_interval))
+            else:
+                self.children.append(_ItemNode(query_item, sample_interval))
+
+    def evaluate_item(self, item):
+        self.until_reorder -= 1
+
+        if self.until_reorder == 0:
+            self.until_reorder = self.reorder_interval
+            self.reorder()
+
+        if self.is_and:
+            matches = True
+
+            for child in self.children:
+                if not child.evaluate(item):
+                    matches = False
+                    break
+        else:
+            matches = False
+
+            for child in self.children:
+                if child.evaluate(item):
+                    matches = True
+                    break
+
+        if self.negated:
+            return not matches
+
+        return matches
+
+    def reorder(self):
+        """
+        Order the children by their expected cost per decision: an "and" query is decided by a
+        child that does not match, an "or" query by a child that matches.
+        """
+        # Use the measured costs only if all children were timed (mixing the relative estimates
+        # with measured times would not be meaningful)
+        measured = all(child.timed_evaluations > 0 for child in self.children)
+
+        def rank(child):
+            cost = child.get_average_cost() if measured else child.estimated_cost
+            decisive_rate = (1.0 - child.get_pass_rate()) if self.is_and else child.get_pass_rate()
+
+            return cost / max(decisive_rate, 1e-6)
+
+        self.children.sort(key=rank)
+
+    def reset(self):
+        _Node.reset(self)
+
+        for child in self.children:
+            child.reset()
+
+    def collect_statistics(self, depth, statistics):
+        _Node.collect_statistics(self, depth, statistics)
+
+        for child in self.children:
+            child.collect_statistics(depth + 1, statistics)
+
+    def to_filter_query(self):
+        return FilterQuery([child.to_filter_query() for child in self.children],
+                           self.query_item.get_logical_operation(),
+                           self.query_item.get_negation())
@@ -0,0 +1,278 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.ArtifactStore import zip_link_types
+from Tuleap.RestClient.Artifacts import Artifacts
+from Tuleap.RestClient.Commons import FieldValuesFormat
+from Tuleap.RestClient.Trackers import Tracker
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class ArtifactCloner(object):
+    """
+    Clones a set of artifacts (e.g. a whole artifact hierarchy) into a tracker.
+
+    The copies are created concurrently with "Artifacts.create_artifact_from". Afterwards the
+    "art_link" field of every copy whose original linked to other cloned artifacts is rewritten,
+    so that the copies link to each other instead of to the originals. The links of the original
+    artifact are the base of the rewritten field, so links to artifacts that were not cloned are
+    kept. Every copy gets at most one update and the updates are executed concurrently in batches.
+
+    The links of all original artifacts are requested and the artifact link field of the tracker
+    is resolved before the first copy is created. Artifacts whose links could not be requested are
+    not cloned.
+
+    Fields type information:
+    :type _connection: Tuleap.RestClient.Connection.Connection
+    :type _maxWorkers: int
+    :type _batchSize: int
+    :type _data: dict[int, int]
+    :type _failedArtifactIds: list[int]
+    """
+
+    def __init__(self, connection, max_workers=8, batch_size=50):
+        """
+        Constructor
+
+        :param connection: connection object (must already be logged in)
+        :type connection: Tuleap.RestClient.Connection.Connection
+        :param int max_workers: maximum number of concurrent requests
+        :param int batch_size: number of link updates executed per batch
+        """
+        self._connection = connection
+        self._maxWorkers = max_workers
+        self._batchSize = batch_size
+        self._data = None
+        self._failedArtifactIds = []
+        self._threadData = threading.local()
+
+    def get_data(self):
+        """
+        Get the mapping of the original artifacts to their copies created by the last clone.
+
+        :return: dictionary of original artifact_id: copy artifact_id
+        :rtype: dict[int, int]
+
+        :note: The clone method should be executed before this method is called!
+        """
+        return self._data
+
+    def get_failed_artifact_ids(self):
+        """
+        Get the IDs of the original artifacts that could not be cloned or whose copies could not
+        be updated.
+
+        :return: Artifact IDs
+        :rtype: list[int]
+        """
+        return self._failedArtifactIds
+
+    def clone_artifacts(self, tracker_id, artifact_ids=None, graph=None):
+        """
+        Clone the artifacts into the tracker.
+
+        :param int tracker_id: Tracker ID where the copies will be created
+        :param artifact_ids: IDs of the artifacts to clone
+        :type artifact_ids: collections.Iterable[int]
+        :param graph: Optional parameter for an already crawled artifact graph (e.g. a subtree),
+                      all of its artifacts are cloned
+        :type graph: Tuleap.RestClient.ArtifactGraph.ArtifactGraph
+
+        :return: success: Success or failure (False if any of the artifacts could not be cloned,
+                 its links could not be requested or its copy could not be updated)
+        :rtype: bool
+
+        :note: An exception is raised before any copy is created if the links between the cloned
+               artifacts have to be rewritten but the tracker has no artifact link field.
+        """
+        # Check if we are logged in
+        if not self._connection.is_logged_in():
+            return False
+
+        if graph is not None:
+            source_ids = graph.get_artifact_ids()
+        elif artifact_ids is not None:
+            source_ids = list(artifact_ids)
+        else:
+            raise Exception("Error: either artifact_ids or graph has to be provided")
+
+        self._data = dict()
+        self._failedArtifactIds = []
+
+        link_field_id = self._request_link_field_id(tracker_id)
+
+        with ThreadPoolExecutor(max_workers=self._maxWorkers) as executor:
+            # Get the links of the original artifacts (the whole "art_link" value, not only the
+            # links between the cloned artifacts)
+            source_links = dict()
+
+            for source_id, links in zip(source_ids, executor.map(self._request_links,
+                                                                 source_ids)):
+                if links is None:
+                    self._failedArtifactIds.append(source_id)
+                else:
+                    source_links[source_id] = links
+
+            source_ids = [source_id for source_id in source_ids if source_id in source_links]
+
+            if (link_field_id is None) and \
+                    any(target_id in source_links
+                        for links in source_links.values() for target_id, _ in links):
+                raise Exception("Error: tracker {:} has no artifact link field".format(tracker_id))
+
+            # Create the copies
+            clone_ids = executor.map(lambda source_id: self._create_copy(tracker_id, source_id),
+                                     source_ids)
+
+            for source_id, clone_id in zip(source_ids, clone_ids):
+                if clone_id is None:
+                    self._failedArtifactIds.append(source_id)
+                else:
+                    self._data[source_id] = clone_id
+
+            # Rewrite the links between the copies
+            updates = []
+
+            for source_id in source_ids:
+                links = source_links[source_id]
+
+                if (source_id not in self._data) or \
+                        (not any(target_id in self._data for target_id, _ in links)):
+                    continue
+
+                updates.append((source_id, self._data[source_id], self._remap_links(links)))
+
+            for start in range(0, len(updates), self._batchSize):
+                batch = updates[start:start + self._batchSize]
+                results = executor.map(lambda update: self._update_links(update[1],
+                                                                         link_field_id,
+                                                                         update[2]),
+                                       batch)
+
+                for update, success in zip(batch, results):
+                    if not success:
+                        self._failedArtifactIds.append(update[0])
+
+        return len(self._failedArtifactIds) == 0
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _artifacts(self):
+        """
+        Get the artifacts object of the current (worker) thread
+
+        :rtype: Tuleap.RestClient.Artifacts.Artifacts
+        """
+        artifacts = getattr(self._threadData, "artifacts", None)
+
+        if artifacts is None:
+            artifacts = Artifacts(self._connection.clone())
+            self._threadData.artifacts = artifacts
+
+        return artifacts
+
+    def _request_link_field_id(self, tracker_id):
+        """
+        Request the tracker structure and find its artifact link field
+
+        :param int tracker_id: Tracker ID
+
+        :return: Field ID of the "art_link" field or None if the tracker has no such field
+        :rtype: int | None
+        """
+        tracker = Tracker(self._connection.clone())
+
+        if not tracker.request_tracker(tracker_id):
+            raise Exception("Error: tracker {:} could not be requested".format(tracker_id))
+
+        for field in tracker.get_data().get("fields", []):
+            if field.get("type") == "art_link":
+                return field["field_id"]
+
+        return None
+
+    def _request_links(self, artifact_id):
+        """
+        Request the links of an original artifact
+
+        :param int artifact_id: Artifact ID
+
+        :return: list of (target artifact ID, link type) tuples or None if the artifact could
+                 not be requested
+        :rtype: list[(int, str)] | None
+        """
+        artifacts = self._artifacts()
+
+        if not artifacts.request_artifact(artifact_id, values_format=FieldValuesFormat.Collection):
+            return None
+
+        artifact = ArtifactParser(artifacts.get_data())
+
+        return list(zip_link_types(artifact.get_links(), artifact.get_links_types()))
+
+    def _create_copy(self, tracker_id, artifact_id):
+        """
+        Create a copy of the artifact
+
+        :return: Artifact ID of the copy or None if it could not be created
+        :rtype: int | None
+        """
+        artifacts = self._artifacts()
+
+        if not artifacts.create_artifact_from(tracker_id, artifact_id):
+            return None
+
+        return artifacts.get_data().get("id")
+
+    def _remap_links(self, links):
+        """
+        Replace the links to the original artifacts with links to their copies
+
+        :param list[(int, str)] links: links of the original artifact
+
+        :return: links in the format expected by "Artifacts.update_artifact"
+        :rtype: list[dict]
+        """
+        remapped_links = []
+
+        for target_id, link_type in links:
+            link = {"id": self._data.get(target_id, target_id)}
+
+            if link_type:
+                link["type"] = link_type
+
+            remapped_links.append(link)
+
+        return remapped_links
+
+    def _update_links(self, artifact_id, link_field_id, links):
+        """
+        Replace the links of the copy
+
+        :return: success: Success or failure
+        :rtype: bool
+        """
+        return self._artifacts().update_artifact(artifact_id,
+                                                 [{"field_id": link_field_id, "links": links}])
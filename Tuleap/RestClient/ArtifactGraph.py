@@ -0,0 +1,538 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+import threading
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.ArtifactStore import zip_link_types
+from Tuleap.RestClient.Artifacts import Artifacts
+from Tuleap.RestClient.Commons import FieldValuesFormat
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class ArtifactGraph(object):
+    """
+    Compact adjacency structure of artifact links.
+
+    The artifact IDs are mapped to consecutive node indexes and the links are stored in CSR
+    (compressed sparse row) form: for node "n" the targets of its links are stored in
+    "_targets[_offsets[n]:_offsets[n + 1]]" and the link types (as indexes into "_typeNames") at
+    the same positions in "_types". The same structure is also kept for the reverse direction.
+
+    Untyped links have the link type None. Methods that accept the "link_types" parameter follow
+    only links of the listed types, or all links if the parameter is None.
+
+    Fields type information:
+    :type _artifactIds: array
+    :type _nodeIndexes: dict[int, int]
+    :type _typeNames: list[str]
+    :type _offsets: array
+    :type _targets: array
+    :type _types: array
+    :type _reverseOffsets: array
+    :type _reverseSources: array
+    :type _reverseTypes: array
+    """
+
+    def __init__(self, edges, artifact_ids=None):
+        """
+        Constructor
+
+        :param edges: links as (source artifact ID, target artifact ID, link type) tuples
+        :type edges: collections.Iterable[(int, int, str)]
+        :param artifact_ids: Optional parameter for artifacts without any links
+        :type artifact_ids: collections.Iterable[int]
+        """
+        edge_list = []
+        nodes = set()
+        type_codes = dict()
+        self._typeNames = []
+
+        for source_id, target_id, link_type in edges:
+            if link_type == "":
+                link_type = None
+
+            if link_type not in type_codes:
+                type_codes[link_type] = len(self._typeNames)
+                self._typeNames.append(link_type)
+
+            edge_list.append((source_id, target_id, type_codes[link_type]))
+            nodes.add(source_id)
+            nodes.add(target_id)
+
+        if artifact_ids is not None:
+            nodes.update(artifact_ids)
+
+        self._artifactIds = array('q', sorted(nodes))
+        self._nodeIndexes = dict((artifact_id, index)
+                                 for index, artifact_id in enumerate(self._artifactIds))
+
+        # Remove duplicate edges and build the CSR arrays for both directions
+        edge_list = sorted(set((self._nodeIndexes[source_id], self._nodeIndexes[target_id], code)
+                               for source_id, target_id, code in edge_list))
+        self._offsets, self._targets, self._types = \
+            _build_csr(len(self._artifactIds), edge_list)
+
+        reverse_edge_list = sorted((target, source, code) for source, target, code in edge_list)
+        self._reverseOffsets, self._reverseSources, self._reverseTypes = \
+            _build_csr(len(self._artifactIds), reverse_edge_list)
+
+    def get_artifact_ids(self):
+        """
+        Get the IDs of all artifacts in the graph
+
+        :return: artifact IDs (sorted)
+        :rtype: list[int]
+        """
+        return self._artifactIds.tolist()
+
+    def has_artifact(self, artifact_id):
+        """
+        Check whether the artifact is in the graph
+
+        :param int artifact_id: Artifact ID
+
+        :return: True if the artifact is in the graph
+        :rtype: bool
+        """
+        return artifact_id in self._nodeIndexes
+
+    def get_edge_count(self):
+        """
+        Get the number of links in the graph
+
+        :return: number of links
+        :rtype: int
+        """
+        return len(self._targets)
+
+    def get_edges(self):
+        """
+        Get all links in the graph
+
+        :return: list of (source artifact ID, target artifact ID, link type) tuples
+        :rtype: list[(int, int, str)]
+        """
+        edges = []
+
+        for node in range(len(self._artifactIds)):
+            for position in range(self._offsets[node], self._offsets[node + 1]):
+                edges.append((self._artifactIds[node],
+                              self._artifactIds[self._targets[position]],
+                              self._typeNames[self._types[position]]))
+
+        return edges
+
+    def get_links(self, artifact_id, link_types=None):
+        """
+        Get the links from the artifact to other artifacts
+
+        :param int artifact_id: Artifact ID
+        :param link_types: Optional parameter for the link types to follow (e.g. ["_is_child"])
+
+        :return: list of (target artifact ID, link type) tuples
+        :rtype: list[(int, str)]
+        """
+        return self._neighbours(artifact_id, self._offsets, self._targets, self._types, link_types)
+
+    def get_reverse_links(self, artifact_id, link_types=None):
+        """
+        Get the links from other artifacts to the artifact
+
+        :param int artifact_id: Artifact ID
+        :param link_types: Optional parameter for the link types to follow (e.g. ["_is_child"])
+
+        :return: list of (source artifact ID, link type) tuples
+        :rtype: list[(int, str)]
+        """
+        return self._neighbours(artifact_id,
+                                self._reverseOffsets,
+                                self._reverseSources,
+                                self._reverseTypes,
+                                link_types)
+
+    def get_descendants(self, artifact_id, link_types=None, max_depth=None):
+        """
+        Get all artifacts that can be reached from the artifact by following its links
+
+        :param int artifact_id: Artifact ID
+        :param link_types: Optional parameter for the link types to follow (e.g. ["_is_child"])
+        :param int max_depth: Optional parameter for the maximum number of followed links
+
+        :return: artifact IDs in breadth-first order (without the artifact itself)
+        :rtype: list[int]
+        """
+        return self._traverse(artifact_id,
+                              self._offsets,
+                              self._targets,
+                              self._types,
+                              link_types,
+                              max_depth)
+
+    def get_ancestors(self, artifact_id, link_types=None, max_depth=None):
+        """
+        Get all artifacts that reach the artifact by following their links
+
+        :param int artifact_id: Artifact ID
+        :param link_types: Optional parameter for the link types to follow (e.g. ["_is_child"])
+        :param int max_depth: Optional parameter for the maximum number of followed links
+
+        :return: artifact IDs in breadth-first order (without the artifact itself)
+        :rtype: list[int]
+        """
+        return self._traverse(artifact_id,
+                              self._reverseOffsets,
+                              self._reverseSources,
+                              self._reverseTypes,
+                              link_types,
+                              max_depth)
+
+    def get_subtree(self, artifact_id, link_types=None, max_depth=None):
+        """
+        Get the part of the graph that contains the artifact and all of its descendants
+
+        :param int artifact_id: Artifact ID
+        :param link_types: Optional parameter for the link types to follow (e.g. ["_is_child"])
+        :param int max_depth: Optional parameter for the maximum number of followed links
+
+        :return: subgraph
+        :rtype: ArtifactGraph
+        """
+        if artifact_id not in self._nodeIndexes:
+            return ArtifactGraph([])
+
+        nodes = set(self.get_descendants(artifact_id, link_types, max_depth))
+        nodes.add(artifact_id)
+        type_codes = self._type_codes(link_types)
+        edges = []
+
+        for source_id in nodes:
+            node = self._nodeIndexes[source_id]
+
+            for position in range(self._offsets[node], self._offsets[node + 1]):
+                target_id = self._artifactIds[self._targets[position]]
+
+                if (target_id in nodes) and \
+                        ((type_codes is None) or (self._types[position] in type_codes)):
+                    edges.append((source_id, target_id, self._typeNames[self._types[position]]))
+
+        return ArtifactGraph(edges, nodes)
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _type_codes(self, link_types):
+        """
+        Convert the link types to a set of link type codes
+
+        :param link_types: link types or None for all link types
+
+        :return: set of link type codes or None for all link types
+        :rtype: set[int] | None
+        """
+        if link_types is None:
+            return None
+
+        return set(code for code, name in enumerate(self._typeNames) if name in link_types)
+
+    def _neighbours(self, artifact_id, offsets, neighbours, types, link_types):
+        """
+        Get the direct neighbours of the artifact in one direction
+        """
+        node = self._nodeIndexes.get(artifact_id)
+
+        if node is None:
+            return []
+
+        type_codes = self._type_codes(link_types)
+        result = []
+
+        for position in range(offsets[node], offsets[node + 1]):
+            if (type_codes is None) or (types[position] in type_codes):
+                result.append((self._artifactIds[neighbours[position]],
+                               self._typeNames[types[position]]))
+
+        return result
+
+    def _traverse(self, artifact_id, offsets, neighbours, types, link_types, max_depth):
+        """
+        Breadth-first traversal in one direction (cycles are visited only once)
+        """
+        start = self._nodeIndexes.get(artifact_id)
+
+        if start is None:
+            return []
+
+        type_codes = self._type_codes(link_types)
+        visited = set([start])
+        queue = deque([(start, 0)])
+        result = []
+
+        while queue:
+            node, depth = queue.popleft()
+
+            if (max_depth is not None) and (depth >= max_depth):
+                continue
+
+            for position in range(offsets[node], offsets[node + 1]):
+                neighbour = neighbours[position]
+
+                if (neighbour not in visited) and \
+                        ((type_codes is None) or (types[position] in type_codes)):
+                    visited.add(neighbour)
+                    result.append(self._artifactIds[neighbour])
+                    queue.append((neighbour, depth + 1))
+
+        return result
+
+
+class ArtifactGraphCrawler(object):
+    """
+    Crawls the artifact links starting from a set of seed artifacts.
+
+    The graph is expanded breadth-first: all artifacts of the current frontier are requested
+    concurrently and the artifacts they link to (which were not requested yet) form the next
+    frontier. Each worker thread uses its own copy of the connection.
+
+    Fields type information:
+    :type _connection: Tuleap.RestClient.Connection.Connection
+    :type _maxWorkers: int
+    :type _data: ArtifactGraph
+    :type _failedArtifactIds: list[int]
+    """
+
+    def __init__(self, connection, max_workers=8):
+        """
+        Constructor
+
+        :param connection: connection object (must already be logged in)
+        :type connection: Tuleap.RestClient.Connection.Connection
+        :param int max_workers: maximum number of concurrent requests
+        """
+        self._connection = connection
+        self._maxWorkers = max_workers
+        self._data = None
+        self._failedArtifactIds = []
+        self._threadData = threading.local()
+
+    def get_data(self):
+        """
+        Get the graph created by the last crawl.
+
+        :return: Artifact graph
+        :rtype: ArtifactGraph
+
+        :note: The crawl method should be executed before this method is called!
+        """
+        return self._data
+
+    def get_failed_artifact_ids(self):
+        """
+        Get the IDs of the artifacts that could not be requested during the last crawl.
+
+        :return: Artifact IDs
+        :rtype: list[int]
+        """
+        return self._failedArtifactIds
+
+    def crawl(self, seed_ids, max_depth=None, link_types=None, follow_reverse_links=False,
+              checkpoint=None, checkpoint_interval=100):
+        """
+        Crawl the artifact links starting from the seed artifacts.
+
+        With a checkpoint the visited artifacts (with their depth), the artifacts that were already
+        requested and their links are stored while crawling. When the crawl is started again with
+        the same checkpoint and parameters it continues with the artifacts that were not requested
+        yet (including the ones that failed), and a completed crawl only rebuilds the graph from
+        the checkpoint without any requests.
+
+        :param seed_ids: IDs of the artifacts to start from
+        :type seed_ids: collections.Iterable[int]
+        :param int max_depth: Optional parameter for the maximum number of followed links
+        :param link_types: Optional parameter for the link types to follow (e.g. ["_is_child"]),
+                           all links are followed if not set
+        :param bool follow_reverse_links: Also follow the links from other artifacts to the
+                                          requested artifacts
+        :param checkpoint: Optional parameter for the checkpoint that makes the crawl resumable
+        :type checkpoint: Tuleap.RestClient.CrawlCheckpoint.CrawlCheckpoint
+        :param int checkpoint_interval: number of requested artifacts between checkpoint commits
+                                        (the checkpoint is also committed after every level)
+
+        :return: success: Success or failure (False if any of the artifacts could not be requested)
+        :rtype: bool
+        """
+        # Check if we are logged in
+        if not self._connection.is_logged_in():
+            return False
+
+        self._failedArtifactIds = []
+        seed_ids = list(seed_ids)
+        crawl_key = None
+        visited = set()
+        edges = set()
+        pending = dict()
+
+        if checkpoint is not None:
+            crawl_key = checkpoint.make_key(
+                "ArtifactGraphCrawler.crawl",
+                sorted(set(seed_ids)),
+                max_depth=max_depth,
+                link_types=sorted(link_types, key=str) if link_types is not None else None,
+                follow_reverse_links=follow_reverse_links)
+            state = checkpoint.get_visited(crawl_key)
+            edges.update(checkpoint.get_edges(crawl_key))
+
+            if checkpoint.is_complete(crawl_key):
+                self._data = ArtifactGraph(edges, state)
+                return True
+
+            for artifact_id in sorted(state):
+                depth, done = state[artifact_id]
+                visited.add(artifact_id)
+
+                if not done:
+                    pending.setdefault(depth, []).append(artifact_id)
+
+        if not visited:
+            for artifact_id in seed_ids:
+                if artifact_id not in visited:
+                    visited.add(artifact_id)
+                    pending.setdefault(0, []).append(artifact_id)
+
+            if checkpoint is not None:
+                checkpoint.add_visited(crawl_key, pending.get(0, []), 0)
+                checkpoint.commit()
+
+        requested = 0
+
+        with ThreadPoolExecutor(max_workers=self._maxWorkers) as executor:
+            while pending:
+                depth = min(pending)
+
+                if (max_depth is not None) and (depth >= max_depth):
+                    break
+
+                frontier = pending.pop(depth)
+                next_frontier = []
+
+                for artifact_id, links in zip(frontier, executor.map(self._request_links,
+                                                                      frontier)):
+                    if links is None:
+                        self._failedArtifactIds.append(artifact_id)
+                        continue
+
+                    forward_links, reverse_links = links
+                    artifact_edges = []
+                    neighbours = []
+
+                    for target_id, link_type in forward_links:
+                        if (link_types is None) or (link_type in link_types):
+                            artifact_edges.append((artifact_id, target_id, link_type))
+                            neighbours.append(target_id)
+
+                    if follow_reverse_links:
+                        for source_id, link_type in reverse_links:
+                            if (link_types is None) or (link_type in link_types):
+                                artifact_edges.append((source_id, artifact_id, link_type))
+                                neighbours.append(source_id)
+
+                    edges.update(artifact_edges)
+                    new_neighbours = []
+
+                    for neighbour in neighbours:
+                        if neighbour not in visited:
+                            visited.add(neighbour)
+                            new_neighbours.append(neighbour)
+
+                    next_frontier.extend(new_neighbours)
+
+                    if checkpoint is not None:
+                        checkpoint.add_visited(crawl_key, new_neighbours, depth + 1)
+                        checkpoint.set_done(crawl_key, artifact_id, artifact_edges)
+                        requested += 1
+
+                        if requested % checkpoint_interval == 0:
+                            checkpoint.commit()
+
+                if next_frontier:
+                    pending.setdefault(depth + 1, []).extend(next_frontier)
+
+                if checkpoint is not None:
+                    checkpoint.commit()
+
+        if (checkpoint is not None) and (len(self._failedArtifactIds) == 0):
+            checkpoint.set_complete(crawl_key)
+
+        self._data = ArtifactGraph(edges, visited)
+
+        return len(self._failedArtifactIds) == 0
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _request_links(self, artifact_id):
+        """
+        Request the artifact and extract its links (called from the worker threads).
+
+        :param int artifact_id: Artifact ID
+
+        :return: (forward links, reverse links) as lists of (artifact ID, link type) tuples or None
+                 if the artifact could not be requested
+        """
+        artifacts = getattr(self._threadData, "artifacts", None)
+
+        if artifacts is None:
+            artifacts = Artifacts(self._connection.clone())
+            self._threadData.artifacts = artifacts
+
+        if not artifacts.request_artifact(artifact_id, values_format=FieldValuesFormat.Collection):
+            return None
+
+        artifact = ArtifactParser(artifacts.get_data())
+
+        return (list(zip_link_types(artifact.get_links(), artifact.get_links_types())),
+                list(zip_link_types(artifact.get_reverse_links(),
+                                    artifact.get_reverse_links_types())))
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+def _build_csr(node_count, sorted_edges):
+    """
+    Build the CSR arrays from the sorted (source node, target node, link type code) edges
+
+    :return: (offsets, targets, types) arrays
+    :rtype: (array, array, array)
+    """
+    offsets = array('l', [0] * (node_count + 1))
+    targets = array('l', [edge[1] for edge in sorted_edges])
+    types = array('H', [edge[2] for edge in sorted_edges])
+
+    for source, _, _ in sorted_edges:
+        offsets[source + 1] += 1
+
+    for node in range(node_count):
+        offsets[node + 1] += offsets[node]
+
+    return offsets, targets, types
+
@@ -18,7 +18,8 @@ You should have received a copy of the GNU Lesser General Public License along w
 not, see <http://www.gnu.org/licenses/>.
 """
 
-from Tuleap.RestClient.ValueParser import ValueParser
+from Tuleap.RestClient.ParseDiagnostics import ParseProblem
+from Tuleap.RestClient.ValueParser import ValueParser, get_dicts, get_list
 # Public -------------------------------------------------------------------------------------------
 
 
@@ -26,8 +27,21 @@ class ArtifactParser(object):
     """
     Parses the artifact and extract the relevant data
 
+    In lazy mode only the name, project ID and tracker ID are extracted in the constructor. The
+    raw values are indexed by their type and field ID on the first access to a value, link or git
+    reference accessor, and each of these facets is parsed only when it is requested for the first
+    time (and then kept). The results are the same as in the eager mode.
+
     Fields type information:
     :type __artifact: dict
+    :type __typed: bool
+    :type __lazy: bool
+    :type __diagnostics: Tuleap.RestClient.ParseDiagnostics.ParseDiagnostics
+    :type __value_items: list[dict]
+    :type __value_items_by_field: dict[int, dict]
+    :type __link_items: list[dict]
+    :type __cross_reference_items: list[dict]
+    :type __parsed_values_by_field: dict[int, dict]
     :type __name: str
     :type __project_id: int
     :type __tracker_id: int
@@ -41,15 +55,29 @@ class ArtifactParser(object):
     :type __valid: bool
     """
 
-    def __init__(self, item):
+    def __init__(self, item, typed=False, lazy=False, diagnostics=None):
         """
         Constructor
 
         :param item: the artifact item to ber parsed
         :type item: dict
+        :param bool typed: Keep the values as native values instead of converting them to strings
+                           (see ValueParser)
+        :param bool lazy: Parse the values, links and git references only when they are requested
+        :param diagnostics: Optional parameter for the diagnostics where the problems found in
+                            malformed value items, links and cross-references are recorded
+        :type diagnostics: Tuleap.RestClient.ParseDiagnostics.ParseDiagnostics
 
         """
         self.__artifact = item
+        self.__typed = typed
+        self.__lazy = lazy
+        self.__diagnostics = diagnostics
+        self.__value_items = None
+        self.__value_items_by_field = None
+        self.__link_items = None
+        self.__cross_reference_items = None
+        self.__parsed_values_by_field = dict()
         self.__name = ""
         self.__project_id = -1
         self.__tracker_id = -1
@@ -63,6 +91,12 @@ class ArtifactParser(object):
         
         self.__valid = self.__parse_item()
 
+        if lazy and self.__valid:
+            # The facets are materialized on first access
+            self.__values = None
+            self.__links = None
+            self.__out_git_references = None
+
     def is_valid(self):
         """
         Check whether the supplied item was convertible to string
@@ -97,8 +131,41 @@ class ArtifactParser(object):
         :return: list of values
         :rtype: list[dict]
         """
+        if self.__values is None:
+            self.__materialize_values()
+
         return self.__values
 
+    def get_value(self, field_id):
+        """
+        Get the parsed value of a single field
+
+        :param int field_id: Field ID
+
+        :return: value (same format as the items returned by "get_values") or None if the artifact
+                 has no supported value for the field
+        :rtype: dict
+        """
+        if field_id in self.__parsed_values_by_field:
+            return self.__parsed_values_by_field[field_id]
+
+        value = None
+
+        if self.__values is not None:
+            for value_dict in self.__values:
+                if value_dict['id'] == field_id:
+                    value = value_dict
+                    break
+        else:
+            self.__index_items()
+            value_item = self.__value_items_by_field.get(field_id)
+
+            if value_item is not None:
+                value = self.__parse_value(value_item)
+
+        self.__parsed_values_by_field[field_id] = value
+        return value
+
     def get_links(self):
         """
         Get the list of all artifact ids the current artifact links to
@@ -106,6 +173,9 @@ class ArtifactParser(object):
         :return: list of direct artifact links
         :rtype: list[int]
         """
+        if self.__links is None:
+            self.__materialize_links()
+
         return self.__links
 
     def get_links_types(self):
@@ -117,6 +187,9 @@ class ArtifactParser(object):
         :return: list of links types
         :rtype: list[str]
         """
+        if self.__links is None:
+            self.__materialize_links()
+
         return self.__links_types
 
     def has_links(self):
@@ -126,6 +199,9 @@ class ArtifactParser(object):
         :return: True if the artifact links to others
         :rtype: bool
         """
+        if self.__links is None:
+            self.__materialize_links()
+
         return len(self.__links) > 0
 
     def get_reverse_links(self):
@@ -135,6 +211,9 @@ class ArtifactParser(object):
         :return: list of reverse artifact links
         :rtype: list[int]
         """
+        if self.__links is None:
+            self.__materialize_links()
+
         return self.__reverse_links
 
     def get_reverse_links_types(self):
@@ -146,6 +225,9 @@ class ArtifactParser(object):
         :return: list of links types
         :rtype: list[str]
         """
+        if self.__links is None:
+            self.__materialize_links()
+
         return self.__reverse_links_types
 
     def has_reverse_links(self):
@@ -155,6 +237,9 @@ class ArtifactParser(object):
         :return: True if the artifact is linked from others
         :rtype: bool
         """
+        if self.__links is None:
+            self.__materialize_links()
+
         return len(self.__reverse_links) > 0
 
     def get_name(self):
@@ -173,6 +258,9 @@ class ArtifactParser(object):
         :return: list of direct commits links
         :rtype: list[str]
         """
+        if self.__out_git_references is None:
+            self.__materialize_git_references()
+
         return self.__out_git_references
 
     def has_out_git_references(self):
@@ -182,6 +270,9 @@ class ArtifactParser(object):
         :return: True if the artifact is linked to commits.
         :rtype: bool
         """
+        if self.__out_git_references is None:
+            self.__materialize_git_references()
+
         return len(self.__out_git_references) > 0
 
     def get_in_git_references(self):
@@ -191,6 +282,9 @@ class ArtifactParser(object):
         :return: list of incoming commits links
         :rtype: list[str]
         """
+        if self.__out_git_references is None:
+            self.__materialize_git_references()
+
         return self.__in_git_references
 
     def has_in_git_references(self):
@@ -200,6 +294,9 @@ class ArtifactParser(object):
         :return: True if the artifact is referenced by commits.
         :rtype: bool
         """
+        if self.__out_git_references is None:
+            self.__materialize_git_references()
+
         return len(self.__in_git_references) > 0
 
 # Private-------------------------------------------------------------------------------------------
@@ -221,7 +318,7 @@ class ArtifactParser(object):
             success = self.__extract_tracker()
             
         # Extract the artifact values
-        if success:
+        if success and not self.__lazy:
             success = self.__extract_values()
 
         return success
@@ -272,9 +369,9 @@ class ArtifactParser(object):
         representation and added to a values list.
         """
         if "values" in self.__artifact:
-            for value_item in self.__artifact["values"]:
+            for value_item in get_list(self.__artifact["values"], self.__diagnostics):
                 # Convert the current value item to string
-                value_parsed = ValueParser(value_item)
+                value_parsed = ValueParser(value_item, self.__typed, self.__diagnostics)
                 if value_parsed.is_valid():
                     # if the current value item is the list of links extract all the required links!
                     if value_parsed.is_links():
@@ -290,27 +387,114 @@ class ArtifactParser(object):
                         self.__values.append(tmp_dict)
         return True
 
+    def __index_items(self):
+        """
+        Sort the raw value items by their type (only once, for the lazy mode).
+        """
+        if self.__value_items is not None:
+            return
+
+        self.__value_items = []
+        self.__value_items_by_field = dict()
+        self.__link_items = []
+        self.__cross_reference_items = []
+
+        for value_item in get_list(self.__artifact.get("values"), self.__diagnostics):
+            if not isinstance(value_item, dict):
+                # Let the value parser report the malformed item
+                self.__value_items.append(value_item)
+                continue
+
+            value_type = value_item.get("type")
+
+            if value_type == "art_link":
+                self.__link_items.append(value_item)
+            elif value_type == "cross":
+                self.__cross_reference_items.append(value_item)
+            else:
+                self.__value_items.append(value_item)
+
+                if "field_id" in value_item:
+                    self.__value_items_by_field.setdefault(value_item["field_id"], value_item)
+
+    def __parse_value(self, value_item):
+        """
+        Parse a value item (that is neither a link nor a cross-reference value item).
+
+        :return: parsed value or None if the value item is not valid
+        :rtype: dict
+        """
+        value_parsed = ValueParser(value_item, self.__typed, self.__diagnostics)
+
+        if not value_parsed.is_valid():
+            return None
+
+        return {'id':    value_parsed.get_id(),
+                'label': value_parsed.get_label(),
+                'value': value_parsed.get_value(),
+                'type':  value_parsed.get_type()}
+
+    def __materialize_values(self):
+        """
+        Parse all values (lazy mode).
+        """
+        self.__index_items()
+        self.__values = []
+
+        for value_item in self.__value_items:
+            value = self.__parse_value(value_item)
+
+            if value is not None:
+                self.__values.append(value)
+
+    def __materialize_links(self):
+        """
+        Extract the links and links types (lazy mode).
+        """
+        self.__index_items()
+        self.__links = []
+
+        for value_item in self.__link_items:
+            self.__extract_links(value_item)
+
+    def __materialize_git_references(self):
+        """
+        Extract the git references (lazy mode).
+        """
+        self.__index_items()
+        self.__out_git_references = []
+
+        for value_item in self.__cross_reference_items:
+            self.__extract_git_references(value_item)
+
     def __extract_links(self, item):
         """
         Search for and extract the artifact links and links types. These can be either forward or reverse links
         (current artifact linking to a following artifact or a second artifact linking to the
         current artifact).
         """
+        field_id = item.get("field_id")
+
         # Extract forward links
         if "links" in item:
-            for lnk_tmp in item["links"]:
+            for lnk_tmp in get_dicts(item["links"], self.__diagnostics, "art_link", field_id):
                 # Extract the artifact ID
                 if "id" in lnk_tmp:
                     self.__links.append(lnk_tmp["id"])
+                elif self.__diagnostics is not None:
+                    self.__diagnostics.record(ParseProblem.MalformedLink, "art_link", field_id)
                 if "type" in lnk_tmp:
                     self.__links_types.append(lnk_tmp["type"])
 
         # Extract reverse links
         if "reverse_links" in item:
-            for lnk_tmp in item["reverse_links"]:
+            for lnk_tmp in get_dicts(item["reverse_links"], self.__diagnostics, "art_link",
+                                     field_id):
                 # Extract the artifact ID
                 if "id" in lnk_tmp:
                     self.__reverse_links.append(lnk_tmp["id"])
+                elif self.__diagnostics is not None:
+                    self.__diagnostics.record(ParseProblem.MalformedLink, "art_link", field_id)
                 if "type" in lnk_tmp:
                     self.__reverse_links_types.append(lnk_tmp["type"])
 
@@ -322,11 +506,19 @@ class ArtifactParser(object):
         :return:
         """
         if "value" in item:
-            for ref_dict in item["value"]:
-                if ref_dict["ref"].startswith("git"):
-                    if ref_dict["direction"] == "out":
-                        self.__out_git_references.append(ref_dict["ref"])
+            for ref_dict in get_dicts(item["value"], self.__diagnostics, "cross",
+                                      item.get("field_id")):
+                reference = ref_dict.get("ref")
+                direction = ref_dict.get("direction")
+
+                if not isinstance(reference, str) or (direction is None):
+                    if self.__diagnostics is not None:
+                        self.__diagnostics.record(ParseProblem.MalformedReference, "cross",
+                                                  item.get("field_id"))
+                elif reference.startswith("git"):
+                    if direction == "out":
+                        self.__out_git_references.append(reference)
                     else:
-                        self.__in_git_references.append(ref_dict["ref"])
+                        self.__in_git_references.append(reference)
 
         return True
@@ -0,0 +1,426 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+import sqlite3
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.Commons import FieldValues
+from Tuleap.RestClient.Pagination import iterate_items
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class ArtifactStore(object):
+    """
+    Local SQLite mirror of artifacts.
+
+    For every artifact the raw JSON data is stored together with the data extracted by the
+    ArtifactParser (values, links and git references). The tables are indexed so that analytic
+    queries can be executed locally instead of requesting the data from the server again.
+
+    Tables:
+    * artifacts(id, tracker_id, project_id, name, last_modified_date, raw)
+    * artifact_values(artifact_id, field_id, label, type, value)
+    * artifact_links(origin_id, source_id, target_id, type)
+    * git_references(artifact_id, direction, reference)
+
+    A link is stored as a "source_id -> target_id" edge. The "origin_id" is the artifact whose data
+    contained the link, so the same edge can be stored twice (once from the source artifact and
+    once from the target artifact as a reverse link).
+
+    Fields type information:
+    :type _database: sqlite3.Connection
+    """
+
+    def __init__(self, path=":memory:"):
+        """
+        Constructor
+
+        :param str path: path to the SQLite database file (by default an in-memory database)
+        """
+        self._database = sqlite3.connect(path)
+        self._create_schema()
+
+    def close(self):
+        """
+        Close the database
+        """
+        self._database.close()
+
+    def upsert_artifact(self, item):
+        """
+        Insert the artifact into the store or replace its previously stored data.
+
+        :param dict item: artifact data (as received from the server with all field values)
+
+        :return: success: Success or failure
+        :rtype: bool
+        """
+        with self._database:
+            success = self._upsert_artifact(item)
+
+        return success
+
+    def upsert_artifacts(self, items):
+        """
+        Insert or replace all artifacts in a single transaction.
+
+        :param items: artifacts (e.g. a page of artifacts or an iterator over all pages)
+        :type items: collections.Iterable[dict]
+
+        :return: Number of stored artifacts
+        :rtype: int
+        """
+        count = 0
+
+        with self._database:
+            for item in items:
+                if self._upsert_artifact(item):
+                    count += 1
+
+        return count
+
+    def mirror_tracker(self, tracker, tracker_id, limit=None, expert_query=None):
+        """
+        Request all artifacts of the tracker (page by page) and store them.
+
+        :param tracker: tracker object (its connection must already be logged in)
+        :type tracker: Tuleap.RestClient.Trackers.Tracker
+        :param int tracker_id: Tracker ID
+        :param int limit: Optional parameter for the page size
+        :param str expert_query: Optional parameter for the search criteria, expert format
+
+        :return: Number of stored artifacts
+        :rtype: int
+        """
+        items = iterate_items(tracker.request_artifact_list,
+                              tracker_id=tracker_id,
+                              field_values=FieldValues.All,
+                              limit=limit,
+                              expert_query=expert_query)
+
+        return self.upsert_artifacts(items)
+
+    def sync_tracker(self, tracker, tracker_id, limit=None):
+        """
+        Incrementally synchronize the tracker. Only the artifacts that were modified on or after
+        the day of the newest stored artifact of the tracker are requested from the server.
+
+        :param tracker: tracker object (its connection must already be logged in)
+        :type tracker: Tuleap.RestClient.Trackers.Tracker
+        :param int tracker_id: Tracker ID
+        :param int limit: Optional parameter for the page size
+
+        :return: Number of stored artifacts
+        :rtype: int
+        """
+        expert_query = None
+        last_modified_date = self.get_last_modified_date(tracker_id)
+
+        if last_modified_date:
+            # TQL date comparison works with day resolution, artifacts modified on the same day
+            # are requested again and simply replaced
+            expert_query = '@last_update_date >= "{:}"'.format(last_modified_date[:10])
+
+        return self.mirror_tracker(tracker, tracker_id, limit=limit, expert_query=expert_query)
+
+    def get_artifact(self, artifact_id):
+        """
+        Get the raw data of the stored artifact.
+
+        :param int artifact_id: Artifact ID
+
+        :return: Artifact data or None if the artifact is not stored
+        :rtype: dict | None
+        """
+        row = self._database.execute("SELECT raw FROM artifacts WHERE id = ?",
+                                     (artifact_id,)).fetchone()
+
+        if row is None:
+            return None
+
+        return json.loads(row[0])
+
+    def get_artifact_ids(self, tracker_id=None, project_id=None):
+        """
+        Get the IDs of the stored artifacts, optionally limited to a tracker and/or project.
+
+        :param int tracker_id: Optional parameter for the tracker ID
+        :param int project_id: Optional parameter for the project ID
+
+        :return: Artifact IDs
+        :rtype: list[int]
+        """
+        query = "SELECT id FROM artifacts"
+        conditions = []
+        parameters = []
+
+        if tracker_id is not None:
+            conditions.append("tracker_id = ?")
+            parameters.append(tracker_id)
+
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            parameters.append(project_id)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY id"
+
+        return [row[0] for row in self._database.execute(query, parameters)]
+
+    def get_values(self, artifact_id):
+        """
+        Get the parsed values of the stored artifact.
+
+        :param int artifact_id: Artifact ID
+
+        :return: list of values (same format as ArtifactParser.get_values())
+        :rtype: list[dict]
+        """
+        rows = self._database.execute("SELECT field_id, label, value, type FROM artifact_values "
+                                      "WHERE artifact_id = ? ORDER BY rowid",
+                                      (artifact_id,))
+
+        return [{'id': row[0], 'label': row[1], 'value': row[2], 'type': row[3]} for row in rows]
+
+    def find_artifact_ids_by_value(self, field_id, value):
+        """
+        Find the artifacts that have the specified (string) value in the specified field.
+
+        :param int field_id: Field ID
+        :param str value: Value (string representation created by the ValueParser)
+
+        :return: Artifact IDs
+        :rtype: list[int]
+        """
+        rows = self._database.execute("SELECT DISTINCT artifact_id FROM artifact_values "
+                                      "WHERE field_id = ? AND value = ? ORDER BY artifact_id",
+                                      (field_id, value))
+
+        return [row[0] for row in rows]
+
+    def get_links(self, artifact_id):
+        """
+        Get the links from the artifact to other artifacts.
+
+        :param int artifact_id: Artifact ID
+
+        :return: list of (target artifact ID, link type) tuples
+        :rtype: list[(int, str)]
+        """
+        rows = self._database.execute("SELECT DISTINCT target_id, type FROM artifact_links "
+                                      "WHERE source_id = ? ORDER BY target_id",
+                                      (artifact_id,))
+
+        return [(row[0], row[1]) for row in rows]
+
+    def get_reverse_links(self, artifact_id):
+        """
+        Get the links from other artifacts to the artifact.
+
+        :param int artifact_id: Artifact ID
+
+        :return: list of (source artifact ID, link type) tuples
+        :rtype: list[(int, str)]
+        """
+        rows = self._database.execute("SELECT DISTINCT source_id, type FROM artifact_links "
+                                      "WHERE target_id = ? ORDER BY source_id",
+                                      (artifact_id,))
+
+        return [(row[0], row[1]) for row in rows]
+
+    def get_git_references(self, artifact_id):
+        """
+        Get the git references of the artifact.
+
+        :param int artifact_id: Artifact ID
+
+        :return: list of (direction, reference) tuples
+        :rtype: list[(str, str)]
+        """
+        rows = self._database.execute("SELECT direction, reference FROM git_references "
+                                      "WHERE artifact_id = ? ORDER BY rowid",
+                                      (artifact_id,))
+
+        return [(row[0], row[1]) for row in rows]
+
+    def find_artifact_ids_by_git_reference(self, reference):
+        """
+        Find the artifacts that have the specified git reference.
+
+        :param str reference: git reference (e.g. "git #repository/sha")
+
+        :return: Artifact IDs
+        :rtype: list[int]
+        """
+        rows = self._database.execute("SELECT DISTINCT artifact_id FROM git_references "
+                                      "WHERE reference = ? ORDER BY artifact_id",
+                                      (reference,))
+
+        return [row[0] for row in rows]
+
+    def get_last_modified_date(self, tracker_id):
+        """
+        Get the newest modification date of all stored artifacts of the tracker.
+
+        :param int tracker_id: Tracker ID
+
+        :return: Last modification date (ISO format) or None if there are no stored artifacts
+        :rtype: str | None
+        """
+        row = self._database.execute("SELECT MAX(last_modified_date) FROM artifacts "
+                                     "WHERE tracker_id = ?",
+                                     (tracker_id,)).fetchone()
+
+        return row[0]
+
+    def execute(self, query, parameters=()):
+        """
+        Execute an (analytic) SQL query on the store.
+
+        :param str query: SQL query
+        :param parameters: query parameters
+
+        :return: Result rows
+        :rtype: list[tuple]
+        """
+        return self._database.execute(query, parameters).fetchall()
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _create_schema(self):
+        """
+        Create the tables and indexes (if they do not exist yet)
+        """
+        self._database.executescript("""
+            CREATE TABLE IF NOT EXISTS artifacts (
+                id INTEGER PRIMARY KEY,
+                tracker_id INTEGER,
+                project_id INTEGER,
+                name TEXT,
+                last_modified_date TEXT,
+                raw TEXT);
+            CREATE TABLE IF NOT EXISTS artifact_values (
+                artifact_id INTEGER,
+                field_id INTEGER,
+                label TEXT,
+                type TEXT,
+                value TEXT);
+            CREATE TABLE IF NOT EXISTS artifact_links (
+                origin_id INTEGER,
+                source_id INTEGER,
+                target_id INTEGER,
+                type TEXT);
+            CREATE TABLE IF NOT EXISTS git_references (
+                artifact_id INTEGER,
+                direction TEXT,
+                reference TEXT);
+
+            CREATE INDEX IF NOT EXISTS idx_artifacts_tracker ON artifacts (tracker_id);
+            CREATE INDEX IF NOT EXISTS idx_artifacts_project ON artifacts (project_id);
+            CREATE INDEX IF NOT EXISTS idx_values_artifact ON artifact_values (artifact_id);
+            CREATE INDEX IF NOT EXISTS idx_values_field_value ON artifact_values (field_id, value);
+            CREATE INDEX IF NOT EXISTS idx_links_origin ON artifact_links (origin_id);
+            CREATE INDEX IF NOT EXISTS idx_links_source ON artifact_links (source_id);
+            CREATE INDEX IF NOT EXISTS idx_links_target ON artifact_links (target_id);
+            CREATE INDEX IF NOT EXISTS idx_git_artifact ON git_references (artifact_id);
+            CREATE INDEX IF NOT EXISTS idx_git_reference ON git_references (reference);
+            """)
+
+    def _upsert_artifact(self, item):
+        """
+        Insert or replace the artifact (without committing the transaction).
+
+        :param dict item: artifact data
+
+        :return: success: Success or failure
+        :rtype: bool
+        """
+        if "id" not in item:
+            return False
+
+        artifact = ArtifactParser(item)
+
+        if not artifact.is_valid():
+            return False
+
+        artifact_id = item["id"]
+        database = self._database
+
+        # Remove the previously stored data
+        database.execute("DELETE FROM artifact_values WHERE artifact_id = ?", (artifact_id,))
+        database.execute("DELETE FROM artifact_links WHERE origin_id = ?", (artifact_id,))
+        database.execute("DELETE FROM git_references WHERE artifact_id = ?", (artifact_id,))
+
+        database.execute("INSERT OR REPLACE INTO artifacts "
+                         "(id, tracker_id, project_id, name, last_modified_date, raw) "
+                         "VALUES (?, ?, ?, ?, ?, ?)",
+                         (artifact_id,
+                          artifact.get_tracker_id(),
+                          artifact.get_project_id(),
+                          artifact.get_name(),
+                          item.get("last_modified_date"),
+                          json.dumps(item)))
+
+        database.executemany("INSERT INTO artifact_values "
+                             "(artifact_id, field_id, label, type, value) VALUES (?, ?, ?, ?, ?)",
+                             [(artifact_id, value['id'], value['label'], value['type'],
+                               value['value'])
+                              for value in artifact.get_values()])
+
+        links = [(artifact_id, artifact_id, target_id, link_type)
+                 for target_id, link_type in zip_link_types(artifact.get_links(),
+                                                             artifact.get_links_types())]
+        links.extend((artifact_id, source_id, artifact_id, link_type)
+                     for source_id, link_type in zip_link_types(artifact.get_reverse_links(),
+                                                                 artifact.get_reverse_links_types()))
+        database.executemany("INSERT INTO artifact_links "
+                             "(origin_id, source_id, target_id, type) VALUES (?, ?, ?, ?)",
+                             links)
+
+        references = [(artifact_id, "out", reference)
+                      for reference in artifact.get_out_git_references()]
+        references.extend((artifact_id, "in", reference)
+                          for reference in artifact.get_in_git_references())
+        database.executemany("INSERT INTO git_references "
+                             "(artifact_id, direction, reference) VALUES (?, ?, ?)",
+                             references)
+
+        return True
+
+
+def zip_link_types(links, links_types):
+    """
+    Pair the links with their types. Older Tuleap versions do not provide the link types, in that
+    case the missing types are set to None.
+
+    :param list[int] links: artifact IDs
+    :param list[str] links_types: link types
+
+    :return: generator of (artifact ID, link type) tuples
+    """
+    for index, artifact_id in enumerate(links):
+        if index < len(links_types):
+            yield artifact_id, links_types[index]
+        else:
+            yield artifact_id, None
@@ -0,0 +1,527 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+from array import array
+
+from Tuleap.RestClient.CompactArtifact import intern_string, link_type_code, link_type_name
+from Tuleap.RestClient.ValueParser import ValueParser, get_dicts, get_list
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class Column(object):
+    """
+    Single column of an artifact table.
+
+    Integer, bind value ID and float values are stored in typed arrays (array.array), all other
+    values in a list. The null mask contains 1 for the rows that have a value and 0 for the rows
+    that do not (the typed arrays contain 0 at those positions).
+
+    Fields type information:
+    :type _fieldId: int
+    :type _label: str
+    :type _type: str
+    :type _values: array | list
+    :type _mask: bytearray
+    """
+
+    def __init__(self, field_id, label, value_type, typed=True):
+        """
+        Constructor
+
+        :param int field_id: Field ID
+        :param str label: Field label
+        :param str value_type: Value type (as returned by ValueParser.get_type())
+        :param bool typed: Store numeric values in typed arrays
+        """
+        self._fieldId = field_id
+        self._label = intern_string(label)
+        self._type = value_type
+        self._mask = bytearray()
+
+        typecode = _ARRAY_TYPECODES.get(value_type)
+
+        if (typecode is None) or (not typed):
+            self._values = []
+        else:
+            self._values = array(typecode)
+
+    def __len__(self):
+        return len(self._mask)
+
+    def get_field_id(self):
+        """
+        :return: Field ID
+        :rtype: int
+        """
+        return self._fieldId
+
+    def get_label(self):
+        """
+        :return: Field label
+        :rtype: str
+        """
+        return self._label
+
+    def get_type(self):
+        """
+        :return: Value type
+        :rtype: str
+        """
+        return self._type
+
+    def get_values(self):
+        """
+        Get the column values (rows without a value contain 0 or None)
+
+        :return: column values
+        :rtype: array | list
+        """
+        return self._values
+
+    def get_mask(self):
+        """
+        Get the null mask (1 for rows with a value, 0 for rows without a value)
+
+        :return: null mask
+        :rtype: bytearray
+        """
+        return self._mask
+
+    def to_list(self):
+        """
+        Get the column values as a list (with None for rows without a value)
+
+        :return: column values
+        :rtype: list
+        """
+        return [value if present else None for value, present in zip(self._values, self._mask)]
+
+    def append(self, value):
+        """
+        Append a value to the column
+
+        :param value: value or None for a missing value
+        """
+        if value is None:
+            if isinstance(self._values, array):
+                self._values.append(0)
+            else:
+                self._values.append(None)
+
+            self._mask.append(0)
+            return
+
+        try:
+            self._values.append(value)
+        except (TypeError, OverflowError):
+            # The value does not fit the typed array, fall back to a generic list
+            self._values = self.to_list()
+            self._values.append(value)
+
+        self._mask.append(1)
+
+    def pad(self, length):
+        """
+        Append missing values until the column has the specified length
+
+        :param int length: column length
+        """
+        while len(self._mask) < length:
+            self.append(None)
+
+
+class ArtifactTable(object):
+    """
+    Columnar representation of a batch of artifacts (e.g. pages received from
+    "Tracker.request_artifact_list" or "Report.request_artifact_list").
+
+    Every artifact is a row. The artifact, tracker and project IDs are stored in integer arrays
+    and every field is stored in its own Column. The links are stored as edge arrays (source
+    artifact ID, target artifact ID, link type code) and the git references as three parallel
+    columns (artifact ID, direction, reference).
+
+    The table can be converted to NumPy arrays, a pandas DataFrame or an Arrow table if those
+    packages are installed.
+
+    Fields type information:
+    :type _typed: bool
+    :type _artifactIds: array
+    :type _trackerIds: array
+    :type _projectIds: array
+    :type _columns: dict[int, Column]
+    :type _linkSources: array
+    :type _linkTargets: array
+    :type _linkTypes: array
+    :type _reverseLinkSources: array
+    :type _reverseLinkTargets: array
+    :type _reverseLinkTypes: array
+    :type _gitArtifactIds: array
+    :type _gitDirections: bytearray
+    :type _gitReferences: list[str]
+    """
+
+    def __init__(self, typed=True):
+        """
+        Constructor
+
+        :param bool typed: Keep the values as native values instead of converting them to strings
+                           (see ValueParser)
+        """
+        self._typed = typed
+        self._artifactIds = array('q')
+        self._trackerIds = array('q')
+        self._projectIds = array('q')
+        self._columns = dict()
+        self._linkSources = array('q')
+        self._linkTargets = array('q')
+        self._linkTypes = array('H')
+        self._reverseLinkSources = array('q')
+        self._reverseLinkTargets = array('q')
+        self._reverseLinkTypes = array('H')
+        self._gitArtifactIds = array('q')
+        self._gitDirections = bytearray()
+        self._gitReferences = []
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        # The link type codes are only valid in the current process, so the link type names are
+        # pickled instead
+        state["_linkTypes"] = [link_type_name(code) for code in self._linkTypes]
+        state["_reverseLinkTypes"] = [link_type_name(code) for code in self._reverseLinkTypes]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._linkTypes = array('H', [link_type_code(name) for name in state["_linkTypes"]])
+        self._reverseLinkTypes = array('H', [link_type_code(name)
+                                             for name in state["_reverseLinkTypes"]])
+
+    def add_page(self, items):
+        """
+        Add a page (list) of artifacts to the table
+
+        :param items: artifacts (with field values)
+        :type items: collections.Iterable[dict]
+
+        :return: Number of added artifacts
+        :rtype: int
+        """
+        count = 0
+
+        for item in items:
+            if self.add_artifact(item):
+                count += 1
+
+        return count
+
+    def add_artifact(self, item):
+        """
+        Add an artifact to the table
+
+        :param dict item: artifact (with field values)
+
+        :return: success: Success or failure (the artifact has no ID, project or tracker)
+        :rtype: bool
+        """
+        artifact_id = item.get("id")
+        project = item.get("project") or {}
+        tracker = item.get("tracker") or {}
+
+        if (artifact_id is None) or ("id" not in project) or ("id" not in tracker):
+            return False
+
+        row = len(self._artifactIds)
+        self._artifactIds.append(artifact_id)
+        self._trackerIds.append(tracker["id"])
+        self._projectIds.append(project["id"])
+
+        for value_item in get_list(item.get("values")):
+            value_parsed = ValueParser(value_item, self._typed)
+
+            if not value_parsed.is_valid():
+                continue
+
+            if value_parsed.is_links():
+                self._add_links(artifact_id, value_item)
+            elif value_parsed.is_cross_refs():
+                self._add_git_references(artifact_id, value_item)
+            elif value_parsed.get_type():
+                field_id = value_parsed.get_id()
+                column = self._columns.get(field_id)
+
+                if column is None:
+                    column = Column(field_id,
+                                    value_parsed.get_label(),
+                                    value_parsed.get_type(),
+                                    self._typed)
+                    self._columns[field_id] = column
+
+                column.pad(row)
+                column.append(value_parsed.get_value())
+
+        for column in self._columns.values():
+            column.pad(row + 1)
+
+        return True
+
+    def get_row_count(self):
+        """
+        :return: Number of rows (artifacts)
+        :rtype: int
+        """
+        return len(self._artifactIds)
+
+    def get_artifact_ids(self):
+        """
+        :return: Artifact IDs of all rows
+        :rtype: array
+        """
+        return self._artifactIds
+
+    def get_tracker_ids(self):
+        """
+        :return: Tracker IDs of all rows
+        :rtype: array
+        """
+        return self._trackerIds
+
+    def get_project_ids(self):
+        """
+        :return: Project IDs of all rows
+        :rtype: array
+        """
+        return self._projectIds
+
+    def get_field_ids(self):
+        """
+        :return: Field IDs of all columns
+        :rtype: list[int]
+        """
+        return list(self._columns.keys())
+
+    def get_column(self, field_id):
+        """
+        Get the column of a field
+
+        :param int field_id: Field ID
+
+        :return: column or None if no artifact has the field
+        :rtype: Column | None
+        """
+        return self._columns.get(field_id)
+
+    def get_columns(self):
+        """
+        :return: dictionary of field_id: column
+        :rtype: dict[int, Column]
+        """
+        return self._columns
+
+    def get_link_edges(self):
+        """
+        Get the links of the artifacts to other artifacts
+
+        :return: (source artifact IDs, target artifact IDs, link type codes), the link type codes
+                 can be converted with get_link_type_name
+        :rtype: (array, array, array)
+        """
+        return self._linkSources, self._linkTargets, self._linkTypes
+
+    def get_reverse_link_edges(self):
+        """
+        Get the links of other artifacts to the artifacts
+
+        :return: (source artifact IDs, target artifact IDs, link type codes), the link type codes
+                 can be converted with get_link_type_name
+        :rtype: (array, array, array)
+        """
+        return self._reverseLinkSources, self._reverseLinkTargets, self._reverseLinkTypes
+
+    def get_link_type_name(self, code):
+        """
+        Get the link type from its code
+
+        :param int code: link type code
+
+        :return: link type (e.g. "_is_child" or None)
+        :rtype: str
+        """
+        return link_type_name(code)
+
+    def get_git_references(self):
+        """
+        Get the git references of the artifacts
+
+        :return: (artifact IDs, directions (1 for "out", 0 for "in"), references)
+        :rtype: (array, bytearray, list[str])
+        """
+        return self._gitArtifactIds, self._gitDirections, self._gitReferences
+
+    def get_column_names(self):
+        """
+        Get the names used for the columns in the converted tables. The name is the field label,
+        or "label (field_id)" if several fields have the same label.
+
+        :return: dictionary of field_id: column name
+        :rtype: dict[int, str]
+        """
+        label_count = dict()
+
+        for column in self._columns.values():
+            label_count[column.get_label()] = label_count.get(column.get_label(), 0) + 1
+
+        names = dict()
+
+        for field_id, column in self._columns.items():
+            if label_count[column.get_label()] == 1:
+                names[field_id] = column.get_label()
+            else:
+                names[field_id] = "{:} ({:})".format(column.get_label(), field_id)
+
+        return names
+
+    def to_numpy(self):
+        """
+        Convert the table to NumPy arrays (requires NumPy). Integer and float columns are
+        converted to masked arrays, other columns to object arrays. The data is copied (a view of
+        the column buffers would prevent adding more artifacts to the table).
+
+        :return: dictionary of column name: array (including "artifact_id", "tracker_id" and
+                 "project_id")
+        :rtype: dict[str, numpy.ndarray]
+        """
+        import numpy
+
+        result = {"artifact_id": numpy.array(self._artifactIds, dtype=numpy.int64),
+                  "tracker_id": numpy.array(self._trackerIds, dtype=numpy.int64),
+                  "project_id": numpy.array(self._projectIds, dtype=numpy.int64)}
+
+        for field_id, name in self.get_column_names().items():
+            column = self._columns[field_id]
+            values = column.get_values()
+
+            if isinstance(values, array):
+                dtype = numpy.float64 if values.typecode == 'd' else numpy.int64
+                data = numpy.array(values, dtype=dtype)
+            else:
+                data = numpy.empty(len(values), dtype=object)
+                data[:] = values
+
+            present = numpy.frombuffer(bytes(column.get_mask()), dtype=numpy.uint8).astype(bool)
+            result[name] = numpy.ma.masked_array(data, mask=~present)
+
+        return result
+
+    def to_pandas(self):
+        """
+        Convert the table to a pandas DataFrame (requires pandas). Missing values are None/NaN.
+
+        :return: data frame with one row per artifact
+        :rtype: pandas.DataFrame
+        """
+        import pandas
+
+        data = {"artifact_id": self._artifactIds.tolist(),
+                "tracker_id": self._trackerIds.tolist(),
+                "project_id": self._projectIds.tolist()}
+
+        for field_id, name in self.get_column_names().items():
+            data[name] = self._columns[field_id].to_list()
+
+        return pandas.DataFrame(data)
+
+    def to_arrow(self):
+        """
+        Convert the table to an Arrow table (requires pyarrow).
+
+        :return: table with one row per artifact
+        :rtype: pyarrow.Table
+        """
+        import pyarrow
+
+        data = {"artifact_id": pyarrow.array(self._artifactIds.tolist(), type=pyarrow.int64()),
+                "tracker_id": pyarrow.array(self._trackerIds.tolist(), type=pyarrow.int64()),
+                "project_id": pyarrow.array(self._projectIds.tolist(), type=pyarrow.int64())}
+
+        for field_id, name in self.get_column_names().items():
+            data[name] = pyarrow.array(self._columns[field_id].to_list())
+
+        return pyarrow.table(data)
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _add_links(self, artifact_id, item):
+        """
+        Add the forward and reverse links of the artifact to the edge arrays
+        """
+        for link in get_dicts(item.get("links")):
+            if "id" in link:
+                self._linkSources.append(artifact_id)
+                self._linkTargets.append(link["id"])
+                self._linkTypes.append(link_type_code(link.get("type")))
+
+        for link in get_dicts(item.get("reverse_links")):
+            if "id" in link:
+                self._reverseLinkSources.append(link["id"])
+                self._reverseLinkTargets.append(artifact_id)
+                self._reverseLinkTypes.append(link_type_code(link.get("type")))
+
+    def _add_git_references(self, artifact_id, item):
+        """
+        Add the git references of the artifact to the git reference columns
+        """
+        for ref_dict in get_dicts(item.get("value")):
+            reference = ref_dict.get("ref")
+
+            if isinstance(reference, str) and reference.startswith("git"):
+                self._gitArtifactIds.append(artifact_id)
+                self._gitDirections.append(1 if ref_dict.get("direction") == "out" else 0)
+                self._gitReferences.append(reference)
+
+
+def parse_artifact_page(items, typed=True):
+    """
+    Parse a page (list) of artifacts into an artifact table
+
+    :param items: artifacts (with field values)
+    :type items: collections.Iterable[dict]
+    :param bool typed: Keep the values as native values instead of converting them to strings
+
+    :return: artifact table
+    :rtype: ArtifactTable
+    """
+    table = ArtifactTable(typed)
+    table.add_page(items)
+
+    return table
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+# Array type codes of the value types that are stored in typed arrays
+_ARRAY_TYPECODES = {
+    'INTEGER': 'q',
+    'FLOAT': 'd',
+    'ID': 'q',
+}
@@ -20,7 +20,11 @@ not, see <http://www.gnu.org/licenses/>.
 
 import json
 
-from Tuleap.RestClient.Commons import FieldsToFetch, FieldValuesFormat, FieldValuesStructure
+from Tuleap.RestClient.Commons import ConflictResolution, FieldsToFetch, FieldValuesFormat, \
+    FieldValuesStructure
+
+# HTTP status code returned by the server when the condition of a conditional request fails
+HTTP_PRECONDITION_FAILED = 412
 
 # Public -------------------------------------------------------------------------------------------
 
@@ -32,6 +36,8 @@ class Artifacts(object):
     Fields type information:
     :type _connection: Tuleap.RestClient.Connection.Connection
     :type _data: dict | list[dict]
+    :type _versionToken: dict
+    :type _conflict: bool
     """
 
     def __init__(self, connection):
@@ -45,6 +51,8 @@ class Artifacts(object):
         self._data = None
         self._count = 0
         self._pagination = 10
+        self._versionToken = None
+        self._conflict = False
 
     def get_connection(self):
         """
@@ -94,6 +102,31 @@ class Artifacts(object):
         """
         return int(self._pagination) if self._pagination is not None else None
 
+    def get_version_token(self):
+        """
+        Get the version token of the artifact received in the last "request_artifact" response.
+
+        The version token contains the conditional request headers ("If-Match" with the ETag of
+        the artifact, or "If-Unmodified-Since" with its last modification time) that make an
+        update fail if the artifact was modified after it was read.
+
+        :return: Version token (or None if the server did not supply any version information)
+        :rtype: dict | None
+
+        :note: The request_artifact method should be successfully executed before this method is
+               called!
+        """
+        return self._versionToken
+
+    def has_conflict(self):
+        """
+        Check whether the last update failed because the artifact was modified in the meantime.
+
+        :return: True if the last update was rejected because of a conflict
+        :rtype: bool
+        """
+        return self._conflict
+
     def request_artifact(self,
                          artifact_id,
                          values_format=FieldValuesFormat.All, tracker_structure_format=FieldValuesStructure.Minimal):
@@ -134,7 +167,9 @@ class Artifacts(object):
 
         # parse response
         if success:
-            self._data = json.loads(self._connection.get_last_response_message().text)
+            response = self._connection.get_last_response_message()
+            self._data = json.loads(response.text)
+            self._versionToken = _extract_version_token(response)
 
         return success
 
@@ -273,17 +308,22 @@ class Artifacts(object):
 
         return success
 
-    def update_artifact(self, artifact_id, values):
+    def update_artifact(self, artifact_id, values, version_token=None):
         """
         Update an artifact with some values using the "/artifacts/<artifact_id>" method PUT of the  REST API.
 
         :param int artifact_id: Artifact ID of the artifact to update
         :param list values: Values is a list of differents fields to update ex: 
             [{"field_id": xxxx, "type": "art_link", "label": "Links", "links": [{"id": xxxx, "uri": "artifacts/xxxx"}]}]
+        :param dict version_token: Optional parameter for the version token captured when the
+            artifact was read (see get_version_token), the update is rejected by the server if the
+            artifact was modified in the meantime (has_conflict will then return True)
 
         :return: success: Success or failure
         :rtype: bool
         """
+        self._conflict = False
+
          # Check if we are logged in
         if not self._connection.is_logged_in():
             return False
@@ -297,13 +337,87 @@ class Artifacts(object):
         else:
             raise Exception("Error: invalid values value")
 
-        success = self._connection.call_put_method(relative_url, data=parameters)
+        if version_token:
+            success = self._connection.call_put_method(relative_url,
+                                                       data=parameters,
+                                                       headers=version_token)
+        else:
+            success = self._connection.call_put_method(relative_url, data=parameters)
         # parse response
         if success:
             self._data = self._connection.get_last_response_message().text
+        else:
+            response = self._connection.get_last_response_message()
+            self._conflict = (response is not None) and \
+                             (response.status_code == HTTP_PRECONDITION_FAILED)
 
         return success
 
+    def update_artifact_conditionally(self,
+                                      artifact_id,
+                                      values,
+                                      conflict_resolution=ConflictResolution.Retry,
+                                      max_retries=3,
+                                      version_token=None,
+                                      reapply_values=None):
+        """
+        Update an artifact only if it was not modified by someone else since it was read.
+
+        If no version token is supplied the artifact is read first to capture it. When the server
+        rejects the update because of a conflict, the conflict is either reported (has_conflict
+        returns True) or the artifact is read again and the update is retried with the new
+        version token.
+
+        :param int artifact_id: Artifact ID of the artifact to update
+        :param list values: Values to update (see update_artifact)
+        :param ConflictResolution conflict_resolution: Report the conflict or retry the update
+        :param int max_retries: Maximum number of retries after a conflict
+        :param dict version_token: Optional parameter for the version token captured when the
+            artifact was read (see get_version_token)
+        :param reapply_values: Optional parameter for a function that recreates the values from
+            the re-read artifact data (function(artifact, values) -> values), by default the same
+            values are applied again
+        :type reapply_values: (dict, list) -> list
+
+        :return: success: Success or failure
+        :rtype: bool
+
+        :note: An exception is raised if the server does not provide a version token (ETag or
+               Last-Modified header) for the artifact, the update is then not executed because it
+               could silently overwrite the changes of someone else.
+        """
+        if version_token is None:
+            if not self.request_artifact(artifact_id):
+                return False
+
+            version_token = self._require_version_token(artifact_id)
+
+        retries = 0
+
+        while True:
+            success = self.update_artifact(artifact_id, values, version_token)
+
+            if success or (not self._conflict):
+                return success
+
+            if (conflict_resolution == ConflictResolution.Report) or (retries >= max_retries):
+                return False
+
+            retries += 1
+
+            # Re-read the artifact and re-apply the changes on top of its current state
+            if not self.request_artifact(artifact_id):
+                return False
+
+            version_token = self._require_version_token(artifact_id)
+
+            if reapply_values is not None:
+                values = reapply_values(self._data, values)
+
+                if not values:
+                    # Nothing left to change
+                    return True
+
     def get_last_response_message(self):
         """
         Get last response message.
@@ -314,3 +428,45 @@ class Artifacts(object):
         :note: This is just a proxy to the connection's method.
         """
         return self._connection.get_last_response_message()
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _require_version_token(self, artifact_id):
+        """
+        Get the version token of the last requested artifact
+
+        :param int artifact_id: Artifact ID (used in the error message)
+
+        :return: Version token
+        :rtype: dict
+        """
+        if not self._versionToken:
+            raise Exception("Error: the server provided no version token for artifact {:}, "
+                            "a conditional update is not possible".format(artifact_id))
+
+        return self._versionToken
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+def _extract_version_token(response):
+    """
+    Extract the version token (conditional request headers) from the artifact response.
+
+    :param requests.Response response: Response message from server
+
+    :return: Version token or None if the response contains no version information
+    :rtype: dict | None
+    """
+    etag = response.headers.get("ETag")
+
+    if etag:
+        return {"If-Match": etag}
+
+    last_modified = response.headers.get("Last-Modified")
+
+    if last_modified:
+        return {"If-Unmodified-Since": last_modified}
+
+    return None
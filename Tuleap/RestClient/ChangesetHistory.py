@@ -0,0 +1,247 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from Tuleap.RestClient.Artifacts import Artifacts
+from Tuleap.RestClient.Commons import FieldsToFetch
+from Tuleap.RestClient.Pagination import PageRequestError, iterate_items
+from Tuleap.RestClient.ValueParser import ValueParser
+
+# Public -------------------------------------------------------------------------------------------
+
+
+def iterate_changesets(artifacts, artifact_id, fields_to_fetch=FieldsToFetch.All, limit=None):
+    """
+    Walk all pages of the artifact changesets and yield the changesets one by one.
+
+    :param artifacts: artifacts object (its connection must already be logged in)
+    :type artifacts: Tuleap.RestClient.Artifacts.Artifacts
+    :param int artifact_id: Artifact ID
+    :param FieldsToFetch fields_to_fetch: Fields to fetch
+    :param int limit: Optional parameter for the page size
+
+    :return: generator of changesets
+    :rtype: collections.Iterable[dict]
+    """
+    return iterate_items(artifacts.request_changeset,
+                         artifact_id=artifact_id,
+                         fields_to_fetch=fields_to_fetch,
+                         limit=limit)
+
+
+class ChangesetTimeline(object):
+    """
+    Per-field timeline of an artifact.
+
+    The changesets are folded into rows of (timestamp, field_id, old value, new value). A row is
+    added only when the value of a field differs from its value in the previous changeset, so the
+    full snapshots contained in the changesets are not kept. The values are the string
+    representations created by the ValueParser (links and cross-references are not tracked).
+
+    Comments are added as rows with field_id None, old value None and the comment body as the new
+    value. In "comments only" mode the field values of the changesets are not parsed at all.
+
+    Fields type information:
+    :type _commentsOnly: bool
+    :type _rows: list[(str, int, str, str)]
+    :type _lastValues: dict[int, str]
+    """
+
+    def __init__(self, comments_only=False):
+        """
+        Constructor
+
+        :param bool comments_only: Only extract the comments from the changesets
+        """
+        self._commentsOnly = comments_only
+        self._rows = []
+        self._lastValues = dict()
+
+    def add_changeset(self, changeset):
+        """
+        Fold the changeset into the timeline. The changesets have to be added in chronological
+        order.
+
+        :param dict changeset: changeset data
+        """
+        timestamp = changeset.get("submitted_on")
+
+        if not self._commentsOnly:
+            for value_item in changeset.get("values") or []:
+                value_parsed = ValueParser(value_item)
+
+                if (not value_parsed.is_valid()) or value_parsed.is_links() or \
+                        value_parsed.is_cross_refs():
+                    continue
+
+                field_id = value_parsed.get_id()
+                new_value = value_parsed.get_value()
+                old_value = self._lastValues.get(field_id)
+
+                if new_value != old_value:
+                    self._rows.append((timestamp, field_id, old_value, new_value))
+                    self._lastValues[field_id] = new_value
+
+        comment = changeset.get("last_comment")
+
+        if comment and comment.get("body"):
+            self._rows.append((timestamp, None, None, comment["body"]))
+
+    def get_rows(self):
+        """
+        Get all timeline rows
+
+        :return: list of (timestamp, field_id, old value, new value) tuples
+        :rtype: list[(str, int, str, str)]
+        """
+        return self._rows
+
+    def get_field_rows(self, field_id):
+        """
+        Get the timeline rows of a single field (or comments if the field_id is None)
+
+        :param int field_id: Field ID
+
+        :return: list of (timestamp, field_id, old value, new value) tuples
+        :rtype: list[(str, int, str, str)]
+        """
+        return [row for row in self._rows if row[1] == field_id]
+
+    def get_current_values(self):
+        """
+        Get the last known value of every field
+
+        :return: dictionary of field_id: value
+        :rtype: dict[int, str]
+        """
+        return dict(self._lastValues)
+
+
+class ChangesetHistory(object):
+    """
+    Builds the changeset timelines of many artifacts. The changesets of the artifacts are
+    requested concurrently (page by page) and each worker thread uses its own copy of the
+    connection.
+
+    Fields type information:
+    :type _connection: Tuleap.RestClient.Connection.Connection
+    :type _maxWorkers: int
+    :type _data: dict[int, ChangesetTimeline]
+    :type _failedArtifactIds: list[int]
+    """
+
+    def __init__(self, connection, max_workers=8):
+        """
+        Constructor
+
+        :param connection: connection object (must already be logged in)
+        :type connection: Tuleap.RestClient.Connection.Connection
+        :param int max_workers: maximum number of concurrent requests
+        """
+        self._connection = connection
+        self._maxWorkers = max_workers
+        self._data = None
+        self._failedArtifactIds = []
+        self._threadData = threading.local()
+
+    def get_data(self):
+        """
+        Get the timelines created by the last request.
+
+        :return: dictionary of artifact_id: timeline
+        :rtype: dict[int, ChangesetTimeline]
+
+        :note: The request method should be successfully executed before this method is called!
+        """
+        return self._data
+
+    def get_failed_artifact_ids(self):
+        """
+        Get the IDs of the artifacts whose changesets could not be requested.
+
+        :return: Artifact IDs
+        :rtype: list[int]
+        """
+        return self._failedArtifactIds
+
+    def request_timelines(self, artifact_ids, fields_to_fetch=FieldsToFetch.All, limit=None):
+        """
+        Request all changesets of the artifacts and fold them into timelines.
+
+        :param artifact_ids: Artifact IDs
+        :type artifact_ids: collections.Iterable[int]
+        :param FieldsToFetch fields_to_fetch: Fields to fetch (FieldsToFetch.Comments only
+                                              requests and extracts the comments)
+        :param int limit: Optional parameter for the page size
+
+        :return: success: Success or failure (False if any of the artifacts failed)
+        :rtype: bool
+        """
+        # Check if we are logged in
+        if not self._connection.is_logged_in():
+            return False
+
+        artifact_ids = list(artifact_ids)
+        self._data = dict()
+        self._failedArtifactIds = []
+
+        with ThreadPoolExecutor(max_workers=self._maxWorkers) as executor:
+            timelines = executor.map(lambda artifact_id: self._request_timeline(artifact_id,
+                                                                                fields_to_fetch,
+                                                                                limit),
+                                     artifact_ids)
+
+            for artifact_id, timeline in zip(artifact_ids, timelines):
+                if timeline is None:
+                    self._failedArtifactIds.append(artifact_id)
+                else:
+                    self._data[artifact_id] = timeline
+
+        return len(self._failedArtifactIds) == 0
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _request_timeline(self, artifact_id, fields_to_fetch, limit):
+        """
+        Request the changesets of a single artifact (called from the worker threads).
+
+        :return: timeline or None if the changesets could not be requested
+        :rtype: ChangesetTimeline | None
+        """
+        artifacts = getattr(self._threadData, "artifacts", None)
+
+        if artifacts is None:
+            artifacts = Artifacts(self._connection.clone())
+            self._threadData.artifacts = artifacts
+
+        timeline = ChangesetTimeline(comments_only=(fields_to_fetch == FieldsToFetch.Comments))
+
+        try:
+            for changeset in iterate_changesets(artifacts, artifact_id, fields_to_fetch, limit):
+                timeline.add_changeset(changeset)
+        except (PageRequestError, requests.RequestException, json.JSONDecodeError):
+            return None
+
+        return timeline
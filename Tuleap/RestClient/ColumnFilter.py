@@ -0,0 +1,387 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+from array import array
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class RowMask(object):
+    """
+    Boolean mask over the rows of a batch of items (one bit per row).
+
+    The bits are stored in a NumPy boolean array when NumPy is installed, otherwise in a Python
+    integer used as a bitset (bit N is row N). Masks are combined with the "&", "|" and "~"
+    operators.
+
+    Fields type information:
+    :type _length: int
+    :type _bits: int | numpy.ndarray
+    """
+
+    def __init__(self, length, bits):
+        """
+        Constructor (use the "full", "from_bools" or "from_numpy" functions instead)
+
+        :param int length: number of rows
+        :param bits: bits (NumPy boolean array or integer bitset)
+        """
+        self._length = length
+        self._bits = bits
+
+    @staticmethod
+    def full(length, value=True):
+        """
+        Create a mask with all rows set (or cleared)
+
+        :param int length: number of rows
+        :param bool value: value of all rows
+
+        :rtype: RowMask
+        """
+        numpy = _numpy()
+
+        if numpy is not None:
+            return RowMask(length, numpy.full(length, bool(value), dtype=bool))
+
+        return RowMask(length, ((1 << length) - 1) if value else 0)
+
+    @staticmethod
+    def from_bools(values, length=None):
+        """
+        Create a mask from a sequence of booleans
+
+        :param values: value of each row
+        :type values: collections.Iterable[bool]
+        :param int length: Optional parameter for the number of rows (needed when the values are
+                           an iterator)
+
+        :rtype: RowMask
+        """
+        numpy = _numpy()
+
+        if length is None:
+            values = list(values)
+            length = len(values)
+
+        if numpy is not None:
+            return RowMask(length, numpy.fromiter(values, dtype=bool, count=length))
+
+        # Build the bitset from a string of binary digits (the last digit is row 0), which is much
+        # faster than setting the bits one by one
+        digits = "".join(["1" if value else "0" for value in values])
+
+        return RowMask(length, int(digits[::-1], 2) if digits else 0)
+
+    @staticmethod
+    def from_numpy(values):
+        """
+        Create a mask from a NumPy boolean array (without copying it)
+
+        :param numpy.ndarray values: value of each row
+
+        :rtype: RowMask
+        """
+        return RowMask(len(values), values)
+
+    def __len__(self):
+        return self._length
+
+    def __and__(self, other):
+        bits, other_bits = self._coerce(other)
+        return RowMask(self._length, bits & other_bits)
+
+    def __or__(self, other):
+        bits, other_bits = self._coerce(other)
+        return RowMask(self._length, bits | other_bits)
+
+    def __invert__(self):
+        if isinstance(self._bits, int):
+            return RowMask(self._length, ((1 << self._length) - 1) ^ self._bits)
+
+        return RowMask(self._length, ~self._bits)
+
+    def __eq__(self, other):
+        if not isinstance(other, RowMask):
+            return NotImplemented
+
+        return self.to_list() == other.to_list()
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+
+        if result is NotImplemented:
+            return result
+
+        return not result
+
+    __hash__ = None
+
+    def is_numpy(self):
+        """
+        :return: True if the bits are stored in a NumPy array
+        :rtype: bool
+        """
+        return not isinstance(self._bits, int)
+
+    def get_bits(self):
+        """
+        :return: bits (NumPy boolean array or integer bitset)
+        :rtype: int | numpy.ndarray
+        """
+        return self._bits
+
+    def count(self):
+        """
+        :return: Number of set rows
+        :rtype: int
+        """
+        if isinstance(self._bits, int):
+            return bin(self._bits).count("1")
+
+        return int(self._bits.sum())
+
+    def any(self):
+        """
+        :return: True if any row is set
+        :rtype: bool
+        """
+        if isinstance(self._bits, int):
+            return self._bits != 0
+
+        return bool(self._bits.any())
+
+    def get_indices(self):
+        """
+        :return: indices of the set rows (ascending)
+        :rtype: list[int]
+        """
+        if isinstance(self._bits, int):
+            bits = self._bits
+            indices = []
+
+            while bits:
+                lowest = bits & -bits
+                indices.append(lowest.bit_length() - 1)
+                bits ^= lowest
+
+            return indices
+
+        return _numpy().flatnonzero(self._bits).tolist()
+
+    def to_list(self):
+        """
+        :return: value of each row
+        :rtype: list[bool]
+        """
+        if isinstance(self._bits, int):
+            return [bool((self._bits >> row) & 1) for row in range(self._length)]
+
+        return self._bits.tolist()
+
+    def select(self, items):
+        """
+        Select the items of the set rows
+
+        :param list items: items (one per row)
+
+        :return: selected items
+        :rtype: list
+        """
+        return [items[index] for index in self.get_indices()]
+
+# Private-------------------------------------------------------------------------------------------
+
+    def _coerce(self, other):
+        """
+        Get the bits of both masks in the same representation
+        """
+        if len(other) != self._length:
+            raise ValueError("Error: row masks of different lengths!")
+
+        bits = self._bits
+        other_bits = other.get_bits()
+
+        if isinstance(bits, int) != isinstance(other_bits, int):
+            if isinstance(bits, int):
+                bits = _int_to_numpy(bits, self._length)
+            else:
+                other_bits = _int_to_numpy(other_bits, self._length)
+
+        return bits, other_bits
+
+
+def get_column_length(columns):
+    """
+    Get the number of rows of the columns
+
+    :param dict columns: key -> column (see "evaluate_column")
+
+    :return: number of rows (0 if there are no columns)
+    :rtype: int
+    """
+    for column in columns.values():
+        return len(column)
+
+    return 0
+
+
+def get_table_columns(table):
+    """
+    Get the columns of an artifact table for the column evaluation of filter queries
+
+    :param table: artifact table
+    :type table: Tuleap.RestClient.ArtifactTable.ArtifactTable
+
+    :return: dictionary of key -> column, the keys are the column names (see
+             "ArtifactTable.get_column_names"), the field IDs and "artifact_id", "tracker_id" and
+             "project_id"
+    :rtype: dict
+    """
+    columns = {"artifact_id": table.get_artifact_ids(),
+               "tracker_id": table.get_tracker_ids(),
+               "project_id": table.get_project_ids()}
+
+    for field_id, name in table.get_column_names().items():
+        column = table.get_column(field_id)
+        columns[field_id] = column
+        columns[name] = column
+
+    return columns
+
+
+def evaluate_column(column, predicate, missing_result, numpy_operation=None, numpy_kinds="iuf"):
+    """
+    Evaluate a predicate for all values of a column
+
+    :param column: column, either an ArtifactTable column (with its null mask), an array, a NumPy
+                   array or a list (with None for missing values)
+    :param predicate: function that is called for each value, values for which the function raises
+                      an exception do not match
+    :param bool missing_result: result for missing values
+    :param numpy_operation: Optional parameter for a function that evaluates the predicate for a
+                            whole NumPy array (only used when NumPy is installed)
+    :param str numpy_kinds: NumPy data type kinds that the NumPy operation supports (by default
+                            numeric types, "U" for unicode string arrays)
+
+    :return: row mask
+    :rtype: RowMask
+    """
+    values = column
+    present = None
+
+    numpy = _numpy()
+
+    if hasattr(column, "get_mask"):
+        values = column.get_values()
+        present = column.get_mask()
+    elif (numpy is not None) and isinstance(column, numpy.ma.MaskedArray):
+        values = column.data
+        present = bytearray((~numpy.ma.getmaskarray(column)).astype(numpy.uint8).tobytes())
+
+    length = len(values)
+
+    if (numpy is not None) and (numpy_operation is not None):
+        data = _numpy_array(numpy, values, numpy_kinds)
+
+        if data is not None:
+            # noinspection PyBroadException
+            try:
+                result = numpy.asarray(numpy_operation(data), dtype=bool)
+            except Exception:
+                result = None
+
+            if result is not None:
+                if present is not None:
+                    present_bits = numpy.frombuffer(bytes(present), dtype=numpy.uint8).astype(bool)
+                    result = numpy.where(present_bits, result, bool(missing_result))
+
+                return RowMask.from_numpy(result)
+
+    if present is None:
+        present = [value is not None for value in values]
+
+    return RowMask.from_bools((_safe_call(predicate, value) if value_present else missing_result
+                               for value, value_present in zip(values, present)),
+                              length)
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+# NumPy module (None if it is not installed), loaded on first use
+_NUMPY_MODULE = []
+
+
+def _numpy():
+    """
+    :return: NumPy module or None if it is not installed
+    """
+    if not _NUMPY_MODULE:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        _NUMPY_MODULE.append(numpy)
+
+    return _NUMPY_MODULE[0]
+
+
+def _int_to_numpy(bits, length):
+    """
+    Convert an integer bitset to a NumPy boolean array
+    """
+    numpy = _numpy()
+    data = numpy.frombuffer(bits.to_bytes((length + 7) // 8, "little"), dtype=numpy.uint8)
+
+    return numpy.unpackbits(data, bitorder="little")[:length].astype(bool)
+
+
+def _numpy_array(numpy, values, kinds):
+    """
+    Get the values as a NumPy array (without copying them)
+
+    :return: NumPy array or None if the values are not of one of the data type kinds
+    """
+    if isinstance(values, numpy.ndarray):
+        if values.dtype.kind in kinds:
+            return values
+
+        return None
+
+    if isinstance(values, array) and (values.typecode in "bBhHiIlLqQfd") and \
+            ("i" in kinds):
+        return numpy.frombuffer(values, dtype=values.typecode) if len(values) > 0 \
+            else numpy.zeros(0)
+
+    return None
+
+
+def _safe_call(predicate, value):
+    """
+    Call the predicate, exceptions are treated as no match
+    """
+    # noinspection PyBroadException
+    try:
+        return bool(predicate(value))
+    except Exception:
+        return False
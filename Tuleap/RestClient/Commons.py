@@ -54,6 +54,14 @@ class GitFields(IntEnum):
     All = 1
 
 
+class ConflictResolution(IntEnum):
+    """
+    Handling of conflicting (concurrent) artifact updates
+    """
+    Report = 0
+    Retry = 1
+
+
 class CertificateVerification(IntEnum):
     """
     Certificate verification
@@ -0,0 +1,497 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+import sys
+import threading
+from array import array
+from collections import namedtuple
+
+from Tuleap.RestClient.ValueParser import ValueParser, get_dicts, get_list
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class CompactValue(namedtuple("CompactValue", ["id", "label", "value", "type"])):
+    """
+    Parsed artifact value stored as a tuple.
+
+    For compatibility with the value dictionaries returned by "ArtifactParser.get_values()" the
+    fields can also be accessed by their key (e.g. value['label']) and a value compares equal to a
+    dictionary with the same content.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in self._fields:
+                return getattr(self, key)
+
+            raise KeyError(key)
+
+        return tuple.__getitem__(self, key)
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            return self._asdict() == other
+
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = tuple.__hash__
+
+    def get(self, key, default=None):
+        """
+        Get the field by its key
+
+        :param str key: field name ('id', 'label', 'value' or 'type')
+        :param default: value returned for unknown keys
+
+        :return: field value
+        """
+        if key in self._fields:
+            return getattr(self, key)
+
+        return default
+
+    def keys(self):
+        """
+        Get the field names
+
+        :return: field names
+        :rtype: tuple[str]
+        """
+        return self._fields
+
+
+class CompactArtifact(object):
+    """
+    Memory efficient alternative to the ArtifactParser.
+
+    The artifact is parsed in the same way as by the ArtifactParser and the same accessors are
+    provided, but the parsed data is stored compactly:
+    * the object uses __slots__ and does not keep a reference to the raw artifact data
+    * the values are stored as a tuple of CompactValue tuples with interned labels
+    * the links are stored in integer arrays and the link types as codes of a shared link type
+      table
+    * the git references are stored as tuples
+
+    Fields type information:
+    :type __id: int
+    :type __name: str
+    :type __project_id: int
+    :type __tracker_id: int
+    :type __values: tuple[CompactValue]
+    :type __links: array
+    :type __links_types: array
+    :type __reverse_links: array
+    :type __reverse_links_types: array
+    :type __in_git_references: tuple[str]
+    :type __out_git_references: tuple[str]
+    :type __valid: bool
+    """
+
+    __slots__ = ("__id",
+                 "__name",
+                 "__project_id",
+                 "__tracker_id",
+                 "__values",
+                 "__links",
+                 "__links_types",
+                 "__reverse_links",
+                 "__reverse_links_types",
+                 "__in_git_references",
+                 "__out_git_references",
+                 "__valid")
+
+    def __init__(self, item, typed=False, schema=None):
+        """
+        Constructor
+
+        :param item: the artifact item to be parsed
+        :type item: dict
+        :param bool typed: Keep the values as native values instead of converting them to strings
+                           (see ValueParser)
+        :param schema: Optional parameter for a parser compiled from the tracker structure, used
+                       to convert the values instead of the ValueParser
+        :type schema: Tuleap.RestClient.TrackerSchemaParser.TrackerSchemaParser
+        """
+        self.__id = item.get("id", -1)
+        self.__name = ""
+        self.__project_id = -1
+        self.__tracker_id = -1
+        self.__values = ()
+        self.__links = _EMPTY_LINKS
+        self.__links_types = _EMPTY_LINKS_TYPES
+        self.__reverse_links = _EMPTY_LINKS
+        self.__reverse_links_types = _EMPTY_LINKS_TYPES
+        self.__in_git_references = ()
+        self.__out_git_references = ()
+        self.__valid = False
+
+        self.__parse_item(item, typed, schema)
+
+    def __getstate__(self):
+        state = [getattr(self, name) for name in _MANGLED_SLOTS]
+
+        # The link type codes are only valid in the current process, so the link type names are
+        # pickled instead
+        for index in _LINK_TYPES_SLOT_INDEXES:
+            state[index] = [_LINK_TYPE_NAMES[code] for code in state[index]]
+
+        return tuple(state)
+
+    def __setstate__(self, state):
+        for index, name in enumerate(_MANGLED_SLOTS):
+            value = state[index]
+
+            if index in _LINK_TYPES_SLOT_INDEXES:
+                value = array('H', [link_type_code(link_type) for link_type in value])
+
+            setattr(self, name, value)
+
+    def is_valid(self):
+        """
+        Check whether the supplied item was successfully parsed
+
+        :return: item conversion validity
+        :rtype: bool
+        """
+        return self.__valid
+
+    def get_id(self):
+        """
+        Get the id of the artifact
+
+        :return: artifact id
+        :rtype: int
+        """
+        return self.__id
+
+    def get_project_id(self):
+        """
+        Get the id of the artifacts project
+
+        :return: artifacts project id
+        :rtype: int
+        """
+        return self.__project_id
+
+    def get_tracker_id(self):
+        """
+        Get the id of the artifacts tracker
+
+        :return: artifacts tracker id
+        :rtype: int
+        """
+        return self.__tracker_id
+
+    def get_name(self):
+        """
+        Get the full name of the given artifact. (e.g. story #1234)
+
+        :return: the full name of the artifact.
+        :rtype: str
+        """
+        return self.__name
+
+    def get_values(self):
+        """
+        Get all supported values found in the artifact
+
+        :return: list of values
+        :rtype: list[CompactValue]
+        """
+        return list(self.__values)
+
+    def get_links(self):
+        """
+        Get the list of all artifact ids the current artifact links to
+
+        :return: list of direct artifact links
+        :rtype: list[int]
+        """
+        return self.__links.tolist()
+
+    def get_links_array(self):
+        """
+        Get the artifact ids the current artifact links to without copying them
+
+        :return: array of direct artifact links
+        :rtype: array
+        """
+        return self.__links
+
+    def get_links_types(self):
+        """
+        Get the list of all artifacts' links types. (_is_child, None, ...)
+        There is one type per referenced artifact, in the same order.
+
+        :return: list of links types
+        :rtype: list[str]
+        """
+        return [_LINK_TYPE_NAMES[code] for code in self.__links_types]
+
+    def has_links(self):
+        """
+        Check whether the artifact has links to other artifacts
+
+        :return: True if the artifact links to others
+        :rtype: bool
+        """
+        return len(self.__links) > 0
+
+    def get_reverse_links(self):
+        """
+        Get the list of all ids of the artifacts that link to this
+
+        :return: list of reverse artifact links
+        :rtype: list[int]
+        """
+        return self.__reverse_links.tolist()
+
+    def get_reverse_links_array(self):
+        """
+        Get the ids of the artifacts that link to this without copying them
+
+        :return: array of reverse artifact links
+        :rtype: array
+        """
+        return self.__reverse_links
+
+    def get_reverse_links_types(self):
+        """
+        Get the list of all incoming artifacts' links types. (_is_child, None, ...)
+        There is exactly one type per referencing artifact, in the same order.
+
+        :return: list of links types
+        :rtype: list[str]
+        """
+        return [_LINK_TYPE_NAMES[code] for code in self.__reverse_links_types]
+
+    def has_reverse_links(self):
+        """
+        Check whether other artifacts have links to the current artifact
+
+        :return: True if the artifact is linked from others
+        :rtype: bool
+        """
+        return len(self.__reverse_links) > 0
+
+    def get_out_git_references(self):
+        """
+        Get the list of all referenced commits in cross-references.
+
+        :return: list of direct commits links
+        :rtype: list[str]
+        """
+        return list(self.__out_git_references)
+
+    def has_out_git_references(self):
+        """
+        Check whether the artifacts references commits.
+
+        :return: True if the artifact is linked to commits.
+        :rtype: bool
+        """
+        return len(self.__out_git_references) > 0
+
+    def get_in_git_references(self):
+        """
+        Get the list of all referencing commits in cross-references.
+
+        :return: list of incoming commits links
+        :rtype: list[str]
+        """
+        return list(self.__in_git_references)
+
+    def has_in_git_references(self):
+        """
+        Check whether the artifacts has referencing commits.
+
+        :return: True if the artifact is referenced by commits.
+        :rtype: bool
+        """
+        return len(self.__in_git_references) > 0
+
+# Private-------------------------------------------------------------------------------------------
+
+    def __parse_item(self, item, typed, schema):
+        """
+        Parse the artifact item (same rules as in the ArtifactParser).
+        """
+        if "xref" not in item:
+            return
+
+        self.__name = item["xref"]
+
+        if ("project" not in item) or ("id" not in item["project"]):
+            return
+
+        self.__project_id = item["project"]["id"]
+
+        if ("tracker" not in item) or ("id" not in item["tracker"]):
+            return
+
+        self.__tracker_id = item["tracker"]["id"]
+
+        if ("values" in item) and (schema is not None):
+            self.__values, link_items, cross_reference_items = schema.split_values(item["values"])
+
+            for value_item in link_items:
+                self.__extract_links(value_item)
+
+            for value_item in cross_reference_items:
+                self.__extract_git_references(value_item)
+        elif "values" in item:
+            values = []
+
+            for value_item in get_list(item["values"]):
+                value_parsed = ValueParser(value_item, typed)
+
+                if value_parsed.is_valid():
+                    if value_parsed.is_links():
+                        self.__extract_links(value_item)
+                    elif value_parsed.is_cross_refs():
+                        self.__extract_git_references(value_item)
+                    else:
+                        values.append(CompactValue(value_parsed.get_id(),
+                                                   intern_string(value_parsed.get_label()),
+                                                   value_parsed.get_value(),
+                                                   value_parsed.get_type()))
+
+            self.__values = tuple(values)
+
+        self.__valid = True
+
+    def __extract_links(self, item):
+        """
+        Extract the forward and reverse artifact links and their types.
+        """
+        if "links" in item:
+            self.__links, self.__links_types = _link_arrays(item["links"])
+
+        if "reverse_links" in item:
+            self.__reverse_links, self.__reverse_links_types = _link_arrays(item["reverse_links"])
+
+    def __extract_git_references(self, item):
+        """
+        Extract commit references from artifact cross-references dictionary.
+        """
+        if "value" in item:
+            in_references = []
+            out_references = []
+
+            for ref_dict in get_dicts(item["value"]):
+                reference = ref_dict.get("ref")
+                direction = ref_dict.get("direction")
+
+                if isinstance(reference, str) and (direction is not None) and \
+                        reference.startswith("git"):
+                    if direction == "out":
+                        out_references.append(reference)
+                    else:
+                        in_references.append(reference)
+
+            self.__in_git_references = tuple(in_references)
+            self.__out_git_references = tuple(out_references)
+
+
+def intern_string(value):
+    """
+    Intern the string so that all equal strings (e.g. field labels) share the same object.
+
+    :param value: string (other values are returned as they are)
+
+    :return: interned string
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+
+    return value
+
+
+def link_type_code(link_type):
+    """
+    Get the code of the link type in the shared link type table (the link type is added to the
+    table if needed).
+
+    :param str link_type: link type (e.g. "_is_child" or None)
+
+    :return: link type code
+    :rtype: int
+    """
+    code = _LINK_TYPE_CODES.get(link_type)
+
+    if code is None:
+        with _LINK_TYPE_LOCK:
+            code = _LINK_TYPE_CODES.get(link_type)
+
+            if code is None:
+                code = len(_LINK_TYPE_NAMES)
+                _LINK_TYPE_NAMES.append(intern_string(link_type))
+                _LINK_TYPE_CODES[link_type] = code
+
+    return code
+
+
+def link_type_name(code):
+    """
+    Get the link type from its code in the shared link type table
+
+    :param int code: link type code
+
+    :return: link type
+    :rtype: str
+    """
+    return _LINK_TYPE_NAMES[code]
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+_LINK_TYPE_NAMES = [None]
+_LINK_TYPE_CODES = {None: 0}
+_LINK_TYPE_LOCK = threading.Lock()
+
+_EMPTY_LINKS = array('q')
+_EMPTY_LINKS_TYPES = array('H')
+
+_MANGLED_SLOTS = tuple("_CompactArtifact" + name for name in CompactArtifact.__slots__)
+_LINK_TYPES_SLOT_INDEXES = (CompactArtifact.__slots__.index("__links_types"),
+                            CompactArtifact.__slots__.index("__reverse_links_types"))
+
+
+def _link_arrays(links):
+    """
+    Convert the links to an array of artifact IDs and an array of link type codes
+
+    :param list[dict] links: links (as received from the server, malformed entries are skipped)
+
+    :return: (artifact IDs, link type codes)
+    :rtype: (array, array)
+    """
+    links = get_dicts(links)
+    artifact_ids = array('q', [link["id"] for link in links if "id" in link])
+    types = array('H', [link_type_code(link["type"]) for link in links if "type" in link])
+
+    return artifact_ids, types
@@ -19,6 +19,7 @@ not, see <http://www.gnu.org/licenses/>.
 """
 
 
+import copy
 import requests
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 import json
@@ -320,13 +321,18 @@ class Connection(object):
 
         return success
 
-    def call_put_method(self, relative_url, data=None, success_status_codes=list([200, 201])):
+    def call_put_method(self,
+                        relative_url,
+                        data=None,
+                        success_status_codes=list([200, 201]),
+                        headers=None):
         """
         Call PUT method on the server
 
         :param str relative_url: relative part of URL
         :param dict data: request data
         :param list[int] success_status_codes: list of HTTP status codes that represent 'success'
+        :param dict headers: additional request headers (e.g. conditional request headers)
 
         :return: Success or failure
         :rtype: bool
@@ -347,10 +353,15 @@ class Connection(object):
         # Call the PUT method
         success = False
         url = self._create_full_url(relative_url)
+        request_headers = self._authenticationHeaders
+
+        if headers:
+            request_headers = dict(self._authenticationHeaders)
+            request_headers.update(headers)
 
         response = requests.put(url,
                                  json=data,
-                                 headers=self._authenticationHeaders,
+                                 headers=request_headers,
                                  verify=self._verifyCertificate)
 
         self._lastResponseMessage = response
@@ -413,6 +424,23 @@ class Connection(object):
         """
         return self._lastResponseMessage
 
+    def clone(self):
+        """
+        Create a copy of the connection that shares the login data with this connection, but has
+        its own last response message.
+
+        :return: Connection copy
+        :rtype: Connection
+
+        :note: Each thread that calls the HTTP methods concurrently needs its own copy, otherwise
+               the threads would overwrite each other's last response message. Only the original
+               connection should be used to log out!
+        """
+        connection = copy.copy(self)
+        connection._lastResponseMessage = None
+
+        return connection
+
     def _create_full_url(self, relative_url, parameters=None):
         """
         Create "full" URL from a "relative" URL. "Full" URL is created by combining REST API URL
@@ -0,0 +1,259 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import json
+import sqlite3
+import threading
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class CrawlCheckpoint(object):
+    """
+    Persistent progress of long running crawls, stored in a local SQLite database file.
+
+    A crawl is identified by a key. Paginated crawls (see "Pagination.iterate_pages") store the
+    offset of the next page after every completed page, recursive crawls (see
+    "ArtifactGraph.ArtifactGraphCrawler") store the visited items with their depth, which of them
+    are done and the discovered edges. When a crawl is executed again with the same checkpoint it
+    continues where it stopped, and a completed crawl is not executed again (until the checkpoint
+    is cleared).
+
+    Tables:
+    * crawls(crawl_key, next_offset, complete)
+    * crawl_visited(crawl_key, item_id, depth, done)
+    * crawl_edges(crawl_key, source_id, target_id, type)
+
+    Fields type information:
+    :type _database: sqlite3.Connection
+    :type _lock: threading.RLock
+    """
+
+    def __init__(self, path=":memory:"):
+        """
+        Constructor
+
+        :param str path: path to the SQLite database file (by default an in-memory database, which
+                         only makes sense for testing)
+        """
+        self._database = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._create_schema()
+
+    def close(self):
+        """
+        Commit the pending changes and close the database
+        """
+        with self._lock:
+            self._database.commit()
+            self._database.close()
+
+    def commit(self):
+        """
+        Commit the pending changes (the visited items and edges are only committed explicitly)
+        """
+        with self._lock:
+            self._database.commit()
+
+    def clear(self, crawl_key=None):
+        """
+        Remove the progress of a crawl (or of all crawls)
+
+        :param str crawl_key: Optional parameter for the key of the crawl (all crawls if not set)
+        """
+        with self._lock, self._database:
+            for table in ("crawls", "crawl_visited", "crawl_edges"):
+                if crawl_key is None:
+                    self._database.execute("DELETE FROM {:}".format(table))
+                else:
+                    self._database.execute("DELETE FROM {:} WHERE crawl_key = ?".format(table),
+                                           (crawl_key,))
+
+    @staticmethod
+    def make_key(name, *args, **kwargs):
+        """
+        Create the key of a crawl from its name and parameters
+
+        :param str name: name of the crawl (e.g. the name of the request method)
+        :param args: positional parameters of the crawl
+        :param kwargs: keyword parameters of the crawl
+
+        :return: crawl key
+        :rtype: str
+        """
+        return "{:}:{:}".format(name, json.dumps([args, kwargs], sort_keys=True, default=str))
+
+    @staticmethod
+    def make_page_key(request_method, args, kwargs):
+        """
+        Create the key of a paginated crawl (the "limit" and "offset" parameters are not part of
+        the key)
+
+        :param request_method: bound request method (e.g. tracker.request_artifact_list)
+        :param tuple args: positional parameters passed to the request method
+        :param dict kwargs: keyword parameters passed to the request method
+
+        :return: crawl key
+        :rtype: str
+        """
+        parameters = dict((key, value) for key, value in kwargs.items()
+                          if key not in ("limit", "offset"))
+
+        return CrawlCheckpoint.make_key("{:}.{:}".format(type(request_method.__self__).__name__,
+                                                         request_method.__name__),
+                                        *args,
+                                        **parameters)
+
+    def is_complete(self, crawl_key):
+        """
+        :param str crawl_key: key of the crawl
+
+        :return: True if the crawl was completed
+        :rtype: bool
+        """
+        row = self._fetch_one("SELECT complete FROM crawls WHERE crawl_key = ?", (crawl_key,))
+
+        return (row is not None) and bool(row[0])
+
+    def set_complete(self, crawl_key):
+        """
+        Mark the crawl as completed (commits all pending changes)
+
+        :param str crawl_key: key of the crawl
+        """
+        with self._lock, self._database:
+            self._database.execute("INSERT OR IGNORE INTO crawls (crawl_key) VALUES (?)",
+                                   (crawl_key,))
+            self._database.execute("UPDATE crawls SET complete = 1 WHERE crawl_key = ?",
+                                   (crawl_key,))
+
+    def get_next_offset(self, crawl_key):
+        """
+        :param str crawl_key: key of the paginated crawl
+
+        :return: offset of the first page that was not completed yet (or None if no page was
+                 completed)
+        :rtype: int
+        """
+        row = self._fetch_one("SELECT next_offset FROM crawls WHERE crawl_key = ?", (crawl_key,))
+
+        return row[0] if row is not None else None
+
+    def set_page_complete(self, crawl_key, next_offset):
+        """
+        Store the offset of the next page after a completed page (commits all pending changes)
+
+        :param str crawl_key: key of the paginated crawl
+        :param int next_offset: offset of the next page
+        """
+        with self._lock, self._database:
+            self._database.execute("INSERT OR IGNORE INTO crawls (crawl_key) VALUES (?)",
+                                   (crawl_key,))
+            self._database.execute("UPDATE crawls SET next_offset = ? WHERE crawl_key = ?",
+                                   (next_offset, crawl_key))
+
+    def add_visited(self, crawl_key, item_ids, depth):
+        """
+        Add visited (discovered) items that are not done yet
+
+        :param str crawl_key: key of the recursive crawl
+        :param item_ids: IDs of the items
+        :type item_ids: collections.Iterable[int]
+        :param int depth: depth of the items (number of followed links from the seed items)
+        """
+        with self._lock:
+            self._database.executemany("INSERT OR IGNORE INTO crawl_visited "
+                                       "(crawl_key, item_id, depth, done) VALUES (?, ?, ?, 0)",
+                                       [(crawl_key, item_id, depth) for item_id in item_ids])
+
+    def set_done(self, crawl_key, item_id, edges=()):
+        """
+        Mark a visited item as done and add the edges discovered from it
+
+        :param str crawl_key: key of the recursive crawl
+        :param int item_id: ID of the item
+        :param edges: (source ID, target ID, type) tuples
+        :type edges: collections.Iterable[(int, int, str)]
+        """
+        with self._lock:
+            self._database.execute("UPDATE crawl_visited SET done = 1 "
+                                   "WHERE crawl_key = ? AND item_id = ?",
+                                   (crawl_key, item_id))
+            self._database.executemany("INSERT INTO crawl_edges "
+                                       "(crawl_key, source_id, target_id, type) "
+                                       "VALUES (?, ?, ?, ?)",
+                                       [(crawl_key,) + tuple(edge) for edge in edges])
+
+    def get_visited(self, crawl_key):
+        """
+        :param str crawl_key: key of the recursive crawl
+
+        :return: dictionary of item ID: (depth, done)
+        :rtype: dict[int, (int, bool)]
+        """
+        with self._lock:
+            rows = self._database.execute("SELECT item_id, depth, done FROM crawl_visited "
+                                          "WHERE crawl_key = ?",
+                                          (crawl_key,)).fetchall()
+
+        return dict((item_id, (depth, bool(done))) for item_id, depth, done in rows)
+
+    def get_edges(self, crawl_key):
+        """
+        :param str crawl_key: key of the recursive crawl
+
+        :return: (source ID, target ID, type) tuples
+        :rtype: list[(int, int, str)]
+        """
+        with self._lock:
+            return self._database.execute("SELECT source_id, target_id, type FROM crawl_edges "
+                                          "WHERE crawl_key = ?",
+                                          (crawl_key,)).fetchall()
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _fetch_one(self, query, parameters):
+        with self._lock:
+            return self._database.execute(query, parameters).fetchone()
+
+    def _create_schema(self):
+        """
+        Create the tables and indexes (if they do not exist yet)
+        """
+        self._database.executescript("""
+            CREATE TABLE IF NOT EXISTS crawls (
+                crawl_key TEXT PRIMARY KEY,
+                next_offset INTEGER,
+                complete INTEGER DEFAULT 0);
+            CREATE TABLE IF NOT EXISTS crawl_visited (
+                crawl_key TEXT,
+                item_id INTEGER,
+                depth INTEGER,
+                done INTEGER,
+                PRIMARY KEY (crawl_key, item_id));
+            CREATE TABLE IF NOT EXISTS crawl_edges (
+                crawl_key TEXT,
+                source_id INTEGER,
+                target_id INTEGER,
+                type TEXT);
+
+            CREATE INDEX IF NOT EXISTS idx_crawl_edges_key ON crawl_edges (crawl_key);
+            """)
@@ -19,6 +19,9 @@ not, see <http://www.gnu.org/licenses/>.
 """
 
 import enum
+import operator
+
+from Tuleap.RestClient.ColumnFilter import RowMask, evaluate_column, get_column_length
 
 # Public -------------------------------------------------------------------------------------------
 
@@ -55,6 +58,93 @@ class CaseSensitivity(enum.Enum):
     CaseInsensitive = 1
 
 
+class MissingValue(enum.Enum):
+    """
+    Result of a filter item for an item that does not have a value for the key (the key is missing
+    or the value is None)
+    """
+    Raise = 0       # raise KeyError (only for a missing key) and let type errors propagate
+    NoMatch = 1     # the item does not match, type errors also count as no match
+    Match = 2       # the item matches, type errors count as no match
+
+
+class KeyPath(object):
+    """
+    Accessor for the value of a key in a dictionary object.
+
+    The key can be a path of nested keys separated with dots (e.g. "tracker.id" or
+    "values_by_field.status.value"), list elements are accessed by their index (e.g.
+    "values.0.value"). A key that exists literally in the dictionary object (even if it contains
+    dots) takes precedence over the path.
+
+    Fields type information:
+    :type _key: str
+    :type _parts: tuple[str] | None
+    """
+
+    __slots__ = ("_key", "_parts")
+
+    def __init__(self, key):
+        """
+        Constructor
+
+        :param str key: key or dotted path of keys
+        """
+        self._key = key
+        self._parts = None
+
+        if isinstance(key, str) and ("." in key):
+            self._parts = tuple(key.split("."))
+
+    def __getstate__(self):
+        return self._key
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def get_key(self):
+        """
+        :return: key or dotted path of keys
+        :rtype: str
+        """
+        return self._key
+
+    def is_path(self):
+        """
+        :return: True if the key is a path of nested keys
+        :rtype: bool
+        """
+        return self._parts is not None
+
+    def get(self, item, default=None):
+        """
+        Get the value of the key
+
+        :param item: a dictionary object
+        :param default: value returned if the key (or any key on the path) is missing
+
+        :return: value
+        """
+        try:
+            return item[self._key]
+        except (KeyError, IndexError, TypeError):
+            if self._parts is None:
+                return default
+
+        value = item
+
+        for part in self._parts:
+            try:
+                if isinstance(value, (list, tuple)):
+                    value = value[int(part)]
+                else:
+                    value = value[part]
+            except (KeyError, IndexError, TypeError, ValueError):
+                return default
+
+        return value
+
+
 class AbstractFilterItem(object):
     """
     Abstract filter item.
@@ -73,6 +163,41 @@ class AbstractFilterItem(object):
         """
         raise NotImplementedError()
 
+    def compile(self):
+        """
+        Compile the filter item into a predicate function
+        
+        The returned function gives the same result as the "match" method, but all the decisions
+        that only depend on the filter item are made once, during the compilation.
+        
+        :return: function that takes a dictionary object and returns True if it matches the filter
+        :rtype: function
+        """
+        return self.match
+
+    def get_missing_value(self):
+        """
+        :return: Result for dictionary objects without a value
+        :rtype: MissingValue
+        """
+        return MissingValue.Raise
+
+    def match_columns(self, columns):
+        """
+        Try to match all rows of a columnar batch of items to the filter
+        
+        The result for every row is the same as the result of the "match" method for the row, but
+        rows for which "match" would raise an exception (for example because the value is missing)
+        do not match.
+        
+        :param dict columns: key -> column (a list, an array, a NumPy array or an ArtifactTable
+                             column, see "ColumnFilter.get_table_columns")
+        
+        :return: matching rows
+        :rtype: Tuleap.RestClient.ColumnFilter.RowMask
+        """
+        raise NotImplementedError()
+
 
 class NumericFilterItem(AbstractFilterItem):
     """
@@ -86,33 +211,81 @@ class NumericFilterItem(AbstractFilterItem):
     
     Fields type information:
     :type _key: str
+    :type _keyPath: KeyPath
     :type _comparisonOperation: ComparisonOperation
     :type _value: T
+    :type _missingValue: MissingValue
     """
     
-    def __init__(self, key, comparison_operation, value):
+    def __init__(self, key, comparison_operation, value, missing_value=MissingValue.Raise):
         """
         Constructor
         
-        :param str key: key of the dictionary item to filter
+        :param str key: key of the dictionary item to filter (or a dotted path of nested keys, see
+                        KeyPath)
         :param ComparisonOperation comparison_operation: Comparison
         :param T value: value of the dictionary item to filter
+        :param MissingValue missing_value: Result for dictionary objects without a value
         """
         self._key = key
+        self._keyPath = KeyPath(key)
         self._comparisonOperation = comparison_operation
         self._value = value
+        self._missingValue = missing_value
+
+    def get_key(self):
+        """
+        :return: key of the dictionary item to filter
+        :rtype: str
+        """
+        return self._key
     
+    def get_comparison_operation(self):
+        """
+        :return: Comparison
+        :rtype: ComparisonOperation
+        """
+        return self._comparisonOperation
+    
+    def get_value(self):
+        """
+        :return: value of the dictionary item to filter
+        :rtype: T
+        """
+        return self._value
+    
+    def get_missing_value(self):
+        """
+        :return: Result for dictionary objects without a value
+        :rtype: MissingValue
+        """
+        return self._missingValue
+
     def match(self, item):
         """
         Try to match the item to the filter
         
         :param dict item: a dictionary object to match
         
+        :return: Success or failure
+        :rtype: bool
+        """
+        if self._missingValue == _RAISE:
+            return self._match_value(item[self._key] if not self._keyPath.is_path()
+                                     else _get_key_value(self._keyPath, item))
+
+        return _match_key_value(self._keyPath, self._missingValue, item, self._match_value)
+
+    def _match_value(self, value):
+        """
+        Try to match the value of the dictionary item to the filter
+
+        :param T value: value of the dictionary item
+
         :return: Success or failure
         :rtype: bool
         """
         success = False
-        value = item[self._key]
         
         # Operation: <
         if self._comparisonOperation == ComparisonOperation.LessThan:
@@ -149,6 +322,62 @@ class NumericFilterItem(AbstractFilterItem):
         
         return success
 
+    def compile(self):
+        """
+        Compile the filter item into a predicate function (see AbstractFilterItem.compile)
+        
+        :return: predicate function
+        :rtype: function
+        """
+        if self._comparisonOperation not in _COMPARISON_OPERATORS:
+            raise Exception("Error: invalid comparison operation!")
+        
+        compare = _COMPARISON_OPERATORS[self._comparisonOperation]
+        filter_value = self._value
+        
+        if (self._missingValue == MissingValue.Raise) and not self._keyPath.is_path():
+            key = self._key
+        
+            def predicate(item):
+                return bool(compare(item[key], filter_value))
+
+            return predicate
+
+        def value_predicate(value):
+            return bool(compare(value, filter_value))
+
+        return _key_predicate(self._keyPath, self._missingValue, value_predicate)
+
+    def match_columns(self, columns):
+        """
+        Try to match all rows of a columnar batch of items to the filter (see
+        AbstractFilterItem.match_columns)
+        
+        :param dict columns: key -> column
+        
+        :return: matching rows
+        :rtype: Tuleap.RestClient.ColumnFilter.RowMask
+        """
+        if self._comparisonOperation not in _COMPARISON_OPERATORS:
+            raise Exception("Error: invalid comparison operation!")
+        
+        compare = _COMPARISON_OPERATORS[self._comparisonOperation]
+        filter_value = self._value
+        
+        if self._missingValue == MissingValue.Raise:
+            # A missing value (None) is only "not equal to" a value
+            missing_result = (self._comparisonOperation == ComparisonOperation.NotEqualTo)
+        else:
+            missing_result = (self._missingValue == MissingValue.Match)
+
+            if self._key not in columns:
+                return RowMask.full(get_column_length(columns), missing_result)
+
+        return evaluate_column(columns[self._key],
+                               lambda value: compare(value, filter_value),
+                               missing_result,
+                               lambda values: compare(values, filter_value))
+
 
 class NumericInRangeFilterItem(AbstractFilterItem):
     """
@@ -160,10 +389,12 @@ class NumericInRangeFilterItem(AbstractFilterItem):
     
     Fields type information:
     :type _key: str
+    :type _keyPath: KeyPath
     :type _lowerLimit: T
     :type _lowerLimitIncluded: bool
     :type _upperLimit: T
     :type _upperLimitIncluded: bool
+    :type _missingValue: MissingValue
     """
     
     def __init__(self,
@@ -171,61 +402,167 @@ class NumericInRangeFilterItem(AbstractFilterItem):
                  lower_limit,
                  lower_limit_included,
                  upper_limit,
-                 upper_limit_included):
+                 upper_limit_included,
+                 missing_value=MissingValue.NoMatch):
         """
         
         Constructor
         
-        :param str key: key of the dictionary item to filter
+        :param str key: key of the dictionary item to filter (or a dotted path of nested keys, see
+                        KeyPath)
         :param T lower_limit: Lower limit
         :param bool lower_limit_included: Is lower limit included
         :param T upper_limit: Upper limit
         :param bool upper_limit_included: Is lower upper included
+        :param MissingValue missing_value: Result for dictionary objects without a value
         """
         self._key = key
+        self._keyPath = KeyPath(key)
         self._lowerLimit = lower_limit
         self._lowerLimitIncluded = lower_limit_included
         self._upperLimit = upper_limit
         self._upperLimitIncluded = upper_limit_included
+        self._missingValue = missing_value
+
+    def get_key(self):
+        """
+        :return: key of the dictionary item to filter
+        :rtype: str
+        """
+        return self._key
+    
+    def get_lower_limit(self):
+        """
+        :return: Lower limit
+        :rtype: T
+        """
+        return self._lowerLimit
+    
+    def is_lower_limit_included(self):
+        """
+        :return: Is lower limit included
+        :rtype: bool
+        """
+        return self._lowerLimitIncluded
+    
+    def get_upper_limit(self):
+        """
+        :return: Upper limit
+        :rtype: T
+        """
+        return self._upperLimit
+    
+    def is_upper_limit_included(self):
+        """
+        :return: Is upper limit included
+        :rtype: bool
+        """
+        return self._upperLimitIncluded
     
+    def get_missing_value(self):
+        """
+        :return: Result for dictionary objects without a value
+        :rtype: MissingValue
+        """
+        return self._missingValue
+
     def match(self, item):
         """
         Try to match the item to the filter
         
         :param dict item: a dictionary object to match
         
+        :return: Success or failure
+        :rtype: bool
+        """
+        if self._missingValue == _RAISE:
+            return self._match_value(item[self._key] if not self._keyPath.is_path()
+                                     else _get_key_value(self._keyPath, item))
+
+        return _match_key_value(self._keyPath, self._missingValue, item, self._match_value)
+
+    def _match_value(self, value):
+        """
+        Try to match the value of the dictionary item to the filter
+
+        :param T value: value of the dictionary item
+
         :return: Success or failure
         :rtype: bool
         """
         success = False
 
-        # noinspection PyBroadException,PyBroadException
-        try:
-            value = item[self._key]
+        # Check for lower limit
+        lower_limit_matched = False
             
-            # Check for lower limit
-            lower_limit_matched = False
+        if self._lowerLimitIncluded:
+            if self._lowerLimit <= value:
+                lower_limit_matched = True
+        else:
+            if self._lowerLimit < value:
+                lower_limit_matched = True
             
-            if self._lowerLimitIncluded:
-                if self._lowerLimit <= value:
-                    lower_limit_matched = True
+        # Check for upper limit
+        if lower_limit_matched:
+            if self._upperLimitIncluded:
+                if value <= self._upperLimit:
+                    success = True
             else:
-                if self._lowerLimit < value:
-                    lower_limit_matched = True
-            
-            # Check for upper limit
-            if lower_limit_matched:
-                if self._upperLimitIncluded:
-                    if value <= self._upperLimit:
-                        success = True
-                else:
-                    if value < self._upperLimit:
-                        success = True
-        except:
-            pass
+                if value < self._upperLimit:
+                    success = True
         
         return success
 
+    def compile(self):
+        """
+        Compile the filter item into a predicate function (see AbstractFilterItem.compile)
+        
+        :return: predicate function
+        :rtype: function
+        """
+        value_predicate, _ = self._compile_range()
+        
+        return _key_predicate(self._keyPath, self._missingValue, value_predicate)
+
+    def match_columns(self, columns):
+        """
+        Try to match all rows of a columnar batch of items to the filter (see
+        AbstractFilterItem.match_columns)
+        
+        :param dict columns: key -> column
+        
+        :return: matching rows
+        :rtype: Tuleap.RestClient.ColumnFilter.RowMask
+        """
+        missing_result = (self._missingValue == MissingValue.Match)
+        
+        if (self._key not in columns) and (self._missingValue != MissingValue.Raise):
+            return RowMask.full(get_column_length(columns), missing_result)
+
+        value_predicate, numpy_operation = self._compile_range()
+
+        return evaluate_column(columns[self._key], value_predicate, missing_result, numpy_operation)
+
+    def _compile_range(self):
+        """
+        Compile the range check for a single value and for a NumPy array of values
+
+        :return: (value predicate function, NumPy operation)
+        :rtype: (function, function)
+        """
+        lower_limit = self._lowerLimit
+        upper_limit = self._upperLimit
+        lower_compare = operator.le if self._lowerLimitIncluded else operator.lt
+        upper_compare = operator.le if self._upperLimitIncluded else operator.lt
+        
+        def value_predicate(value):
+            return bool(lower_compare(lower_limit, value) and upper_compare(value, upper_limit))
+
+        def numpy_operation(values):
+            return lower_compare(lower_limit, values) & upper_compare(values, upper_limit)
+
+        return value_predicate, numpy_operation
+
 
 class NumericOutOfRangeFilterItem(AbstractFilterItem):
     """
@@ -235,8 +572,14 @@ class NumericOutOfRangeFilterItem(AbstractFilterItem):
     :note: Should be used only for dictionary objects that contain some kind of numeric value (for
            example int, float, date, time etc.).
     
+    :note: The filter item is the negation of the in range filter item (with the inverted missing
+           value result), so a value that can not be compared with the limits (e.g. a string) is
+           not in range and therefore matches, unless the missing value result is
+           MissingValue.Raise.
+    
     Fields type information:
     :type _inRangeFilter: NumericInRangeFilterItem
+    :type _missingValue: MissingValue
     """
     
     def __init__(self,
@@ -244,22 +587,41 @@ class NumericOutOfRangeFilterItem(AbstractFilterItem):
                  lower_limit,
                  lower_limit_included,
                  upper_limit,
-                 upper_limit_included):
+                 upper_limit_included,
+                 missing_value=MissingValue.Match):
         """
         
         Constructor
         
-        :param str key: key of the dictionary item to filter
+        :param str key: key of the dictionary item to filter (or a dotted path of nested keys, see
+                        KeyPath)
         :param T lower_limit: Lower limit
         :param bool lower_limit_included: Is lower limit included
         :param T upper_limit: Upper limit
         :param bool upper_limit_included: Is lower upper included
+        :param MissingValue missing_value: Result for dictionary objects without a value
         """
         self._inRangeFilter = NumericInRangeFilterItem(key,
                                                        lower_limit,
                                                        lower_limit_included,
                                                        upper_limit,
-                                                       upper_limit_included)
+                                                       upper_limit_included,
+                                                       _INVERTED_MISSING_VALUES[missing_value])
+        self._missingValue = missing_value
+    
+    def get_in_range_filter(self):
+        """
+        :return: in range filter item that this filter item negates
+        :rtype: NumericInRangeFilterItem
+        """
+        return self._inRangeFilter
+
+    def get_missing_value(self):
+        """
+        :return: Result for dictionary objects without a value
+        :rtype: MissingValue
+        """
+        return self._missingValue
     
     def match(self, item):
         """
@@ -270,9 +632,49 @@ class NumericOutOfRangeFilterItem(AbstractFilterItem):
         :return: Success or failure
         :rtype: bool
         """
-        success = not self._inRangeFilter.match(item)
+        return not self._inRangeFilter.match(item)
+
+    def compile(self):
+        """
+        Compile the filter item into a predicate function (see AbstractFilterItem.compile)
         
-        return success
+        :return: predicate function
+        :rtype: function
+        """
+        return _negated_predicate(self._inRangeFilter.compile())
+
+    def match_columns(self, columns):
+        """
+        Try to match all rows of a columnar batch of items to the filter (see
+        AbstractFilterItem.match_columns)
+        
+        :param dict columns: key -> column
+        
+        :return: matching rows
+        :rtype: Tuleap.RestClient.ColumnFilter.RowMask
+        """
+        key = self._inRangeFilter.get_key()
+        missing_result = (self._missingValue == MissingValue.Match)
+        
+        if (key not in columns) and (self._missingValue != MissingValue.Raise):
+            return RowMask.full(get_column_length(columns), missing_result)
+
+        in_range_predicate, in_range_operation = self._inRangeFilter._compile_range()
+        
+        # Values that can not be compared with the limits are not in range, so they match unless
+        # "match" raises an exception for them (MissingValue.Raise)
+        invalid_result = (self._missingValue != MissingValue.Raise)
+
+        def value_predicate(value):
+            try:
+                return not in_range_predicate(value)
+            except _TYPE_ERRORS:
+                return invalid_result
+
+        def numpy_operation(values):
+            return ~in_range_operation(values)
+
+        return evaluate_column(columns[key], value_predicate, missing_result, numpy_operation)
 
 
 class StringFilterItem(AbstractFilterItem):
@@ -287,29 +689,71 @@ class StringFilterItem(AbstractFilterItem):
     
     Fields type information:
     :type _key: str
+    :type _keyPath: KeyPath
     :type _comparisonOperation: StringComparisonOperation
     :type _value: T
     :type _caseSensitive: CaseSensitivity
+    :type _missingValue: MissingValue
     """
     
     def __init__(self,
                  key,
                  comparison_operation,
                  value,
-                 case_sensitive=CaseSensitivity.CaseSensitive):
+                 case_sensitive=CaseSensitivity.CaseSensitive,
+                 missing_value=MissingValue.Raise):
         """
         Constructor
         
-        :param str key: key of the dictionary item to filter
+        :param str key: key of the dictionary item to filter (or a dotted path of nested keys, see
+                        KeyPath)
         :param StringComparisonOperation comparison_operation: Comparison
         :param str value: value of the dictionary item to filter
         :param CaseSensitivity case_sensitive: Case sensitive comparison
+        :param MissingValue missing_value: Result for dictionary objects without a value
         """
         self._key = key
+        self._keyPath = KeyPath(key)
         self._comparisonOperation = comparison_operation
         self._value = value
         self._caseSensitive = case_sensitive
+        self._missingValue = missing_value
+
+    def get_key(self):
+        """
+        :return: key of the dictionary item to filter
+        :rtype: str
+        """
+        return self._key
+    
+    def get_comparison_operation(self):
+        """
+        :return: Comparison
+        :rtype: StringComparisonOperation
+        """
+        return self._comparisonOperation
     
+    def get_value(self):
+        """
+        :return: value of the dictionary item to filter
+        :rtype: str
+        """
+        return self._value
+    
+    def get_case_sensitivity(self):
+        """
+        :return: Case sensitive comparison
+        :rtype: CaseSensitivity
+        """
+        return self._caseSensitive
+    
+    def get_missing_value(self):
+        """
+        :return: Result for dictionary objects without a value
+        :rtype: MissingValue
+        """
+        return self._missingValue
+
     def match(self, item):
         """
         Try to match the item to the filter
@@ -319,8 +763,21 @@ class StringFilterItem(AbstractFilterItem):
         :return: Success or failure
         :rtype: bool
         """
-        value = item[self._key]
+        if self._missingValue == _RAISE:
+            return self._match_value(item[self._key] if not self._keyPath.is_path()
+                                     else _get_key_value(self._keyPath, item))
         
+        return _match_key_value(self._keyPath, self._missingValue, item, self._match_value)
+
+    def _match_value(self, value):
+        """
+        Try to match the value of the dictionary item to the filter
+
+        :param str value: value of the dictionary item
+
+        :return: Success or failure
+        :rtype: bool
+        """
         # Handle case sensitivity
         if self._caseSensitive == CaseSensitivity.CaseSensitive:
             str_input_value = value
@@ -351,6 +808,94 @@ class StringFilterItem(AbstractFilterItem):
         
         return success
 
+    def compile(self):
+        """
+        Compile the filter item into a predicate function (see AbstractFilterItem.compile)
+        
+        The filter value is converted to lower case only once for case insensitive comparisons.
+        
+        :return: predicate function
+        :rtype: function
+        """
+        if self._comparisonOperation not in _STRING_COMPARISON_OPERATORS:
+            raise Exception("Error: invalid string comparison operation!")
+        
+        compare = _STRING_COMPARISON_OPERATORS[self._comparisonOperation]
+        
+        if self._caseSensitive == CaseSensitivity.CaseSensitive:
+            filter_value = self._value
+            
+            if (self._missingValue == MissingValue.Raise) and not self._keyPath.is_path():
+                key = self._key
+                return lambda item: compare(item[key], filter_value)
+
+            def value_predicate(value):
+                return compare(value, filter_value)
+        elif self._caseSensitive == CaseSensitivity.CaseInsensitive:
+            filter_value = self._value.lower()
+            
+            if (self._missingValue == MissingValue.Raise) and not self._keyPath.is_path():
+                key = self._key
+                return lambda item: compare(item[key].lower(), filter_value)
+
+            def value_predicate(value):
+                return compare(value.lower(), filter_value)
+        else:
+            raise Exception("Error: invalid case sensitivity!")
+        
+        return _key_predicate(self._keyPath, self._missingValue, value_predicate)
+
+    def match_columns(self, columns):
+        """
+        Try to match all rows of a columnar batch of items to the filter (see
+        AbstractFilterItem.match_columns)
+        
+        :param dict columns: key -> column
+        
+        :return: matching rows
+        :rtype: Tuleap.RestClient.ColumnFilter.RowMask
+        """
+        if self._comparisonOperation not in _STRING_COMPARISON_OPERATORS:
+            raise Exception("Error: invalid string comparison operation!")
+        
+        compare = _STRING_COMPARISON_OPERATORS[self._comparisonOperation]
+        
+        if self._caseSensitive == CaseSensitivity.CaseSensitive:
+            filter_value = self._value
+            
+            def predicate(value):
+                return compare(value, filter_value)
+            
+            def numpy_operation(values):
+                return numpy_compare(values, filter_value)
+            
+            # A missing value (None) is only "not equal to" a string
+            missing_result = (self._comparisonOperation == StringComparisonOperation.NotEqualTo)
+        elif self._caseSensitive == CaseSensitivity.CaseInsensitive:
+            filter_value = self._value.lower()
+            
+            def predicate(value):
+                return compare(value.lower(), filter_value)
+            
+            def numpy_operation(values):
+                import numpy
+                return numpy_compare(numpy.char.lower(values), filter_value)
+            
+            missing_result = False
+        else:
+            raise Exception("Error: invalid case sensitivity!")
+        
+        numpy_compare = _NUMPY_STRING_COMPARISON_OPERATORS[self._comparisonOperation]
+
+        if self._missingValue != MissingValue.Raise:
+            missing_result = (self._missingValue == MissingValue.Match)
+
+            if self._key not in columns:
+                return RowMask.full(get_column_length(columns), missing_result)
+        
+        # Unicode string NumPy arrays are compared with the vectorized string functions
+        return evaluate_column(columns[self._key], predicate, missing_result, numpy_operation, "U")
+
 
 class FilterQuery(object):
     """
@@ -375,6 +920,27 @@ class FilterQuery(object):
         self._logicalOperation = logical_operation
         self._negation = negation
     
+    def get_query_items(self):
+        """
+        :return: List of any combination of filter items and filter (sub)queries
+        :rtype: list[AbstractFilterItem | FilterQuery]
+        """
+        return self._queryItems
+    
+    def get_logical_operation(self):
+        """
+        :return: logical operation applied to all query items
+        :rtype: LogicalOperation
+        """
+        return self._logicalOperation
+    
+    def get_negation(self):
+        """
+        :return: negation of the complete query
+        :rtype: Negation
+        """
+        return self._negation
+    
     def execute(self, item):
         """
         execute query
@@ -397,6 +963,120 @@ class FilterQuery(object):
             matches = (not matches)
         
         return matches
+
+    def compile(self):
+        """
+        Compile the query into a single predicate function
+        
+        The query tree is flattened (sub-queries with the same logical operation and without
+        negation are merged into their parent), and every filter item is compiled into a predicate
+        (see AbstractFilterItem.compile). The returned function gives the same results as the
+        "execute" method, but it is much faster when the same query is executed for many items.
+        
+        :return: function that takes a dictionary object and returns True if it matches the query
+        :rtype: function
+        
+        Example:
+            predicate = query.compile()
+            matching_items = [item for item in items if predicate(item)]
+        """
+        if self._logicalOperation not in (LogicalOperation.And, LogicalOperation.Or):
+            raise Exception("Error: invalid logical operation!")
+        
+        predicates = tuple(self._compile_query_items(self._logicalOperation))
+        
+        if self._logicalOperation == LogicalOperation.And:
+            predicate = _all_predicate(predicates)
+        else:
+            predicate = _any_predicate(predicates)
+        
+        if self._negation == Negation.Enabled:
+            return _negated_predicate(predicate)
+        
+        return predicate
+    
+    def execute_columns(self, columns, row_count=None):
+        """
+        execute query on all rows of a columnar batch of items
+        
+        The logical operations and the negation are executed as operations on row masks (NumPy
+        arrays when NumPy is installed). The result of every row is the same as the result of the
+        "execute" method for the row, except that rows for which "execute" would raise an
+        exception do not match (see AbstractFilterItem.match_columns).
+        
+        :param dict columns: key -> column (a list, an array, a NumPy array or an ArtifactTable
+                             column, see "ColumnFilter.get_table_columns")
+        :param int row_count: Optional parameter for the number of rows (by default the length of
+                              the columns)
+        
+        :return: matching rows
+        :rtype: Tuleap.RestClient.ColumnFilter.RowMask
+        """
+        if row_count is None:
+            row_count = get_column_length(columns)
+        
+        if self._logicalOperation == LogicalOperation.And:
+            matches = RowMask.full(row_count, True)
+            
+            for queryItem in self._queryItems:
+                matches = matches & self._execute_columns_item(queryItem, columns, row_count)
+                
+                if not matches.any():
+                    break
+        elif self._logicalOperation == LogicalOperation.Or:
+            matches = RowMask.full(row_count, False)
+            
+            for queryItem in self._queryItems:
+                matches = matches | self._execute_columns_item(queryItem, columns, row_count)
+        else:
+            raise Exception("Error: invalid logical operation!")
+        
+        if self._negation == Negation.Enabled:
+            matches = ~matches
+        
+        return matches
+    
+    @staticmethod
+    def _execute_columns_item(query_item, columns, row_count):
+        """
+        execute a query item on all rows of a columnar batch of items
+        
+        :return: matching rows
+        :rtype: Tuleap.RestClient.ColumnFilter.RowMask
+        """
+        if isinstance(query_item, AbstractFilterItem):
+            return query_item.match_columns(columns)
+        
+        if isinstance(query_item, FilterQuery):
+            return query_item.execute_columns(columns, row_count)
+        
+        raise Exception("Error: invalid query item type!")
+    
+    def _compile_query_items(self, logical_operation):
+        """
+        Compile the query items, the query items of sub-queries with the same logical operation
+        and without negation are compiled as if they were items of this query
+        
+        :param LogicalOperation logical_operation: logical operation of the (top level) query
+        
+        :return: list of predicate functions
+        :rtype: list[function]
+        """
+        predicates = []
+        
+        for queryItem in self._queryItems:
+            if isinstance(queryItem, AbstractFilterItem):
+                predicates.append(queryItem.compile())
+            elif isinstance(queryItem, FilterQuery):
+                if (queryItem._logicalOperation == logical_operation) and \
+                        (queryItem._negation != Negation.Enabled):
+                    predicates.extend(queryItem._compile_query_items(logical_operation))
+                else:
+                    predicates.append(queryItem.compile())
+            else:
+                raise Exception("Error: invalid query item type!")
+        
+        return predicates
     
     def _execute_query_with_and_operation(self, item):
         """
@@ -451,3 +1131,211 @@ class FilterQuery(object):
                 raise Exception("Error: invalid query item type!")
         
         return matches
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+_COMPARISON_OPERATORS = {
+    ComparisonOperation.LessThan: operator.lt,
+    ComparisonOperation.LessThanOrEqualTo: operator.le,
+    ComparisonOperation.EqualTo: operator.eq,
+    ComparisonOperation.NotEqualTo: operator.ne,
+    ComparisonOperation.GreaterThanOrEqualTo: operator.ge,
+    ComparisonOperation.GreaterThan: operator.gt,
+}
+
+_STRING_COMPARISON_OPERATORS = {
+    StringComparisonOperation.EqualTo: operator.eq,
+    StringComparisonOperation.NotEqualTo: operator.ne,
+    StringComparisonOperation.Contains: operator.contains,
+    StringComparisonOperation.StartsWith: lambda value, filter_value: value.startswith(filter_value),
+    StringComparisonOperation.EndsWith: lambda value, filter_value: value.endswith(filter_value),
+}
+
+
+def _numpy_contains(values, filter_value):
+    import numpy
+    return numpy.char.find(values, filter_value) >= 0
+
+
+def _numpy_starts_with(values, filter_value):
+    import numpy
+    return numpy.char.startswith(values, filter_value)
+
+
+def _numpy_ends_with(values, filter_value):
+    import numpy
+    return numpy.char.endswith(values, filter_value)
+
+
+_NUMPY_STRING_COMPARISON_OPERATORS = {
+    StringComparisonOperation.EqualTo: operator.eq,
+    StringComparisonOperation.NotEqualTo: operator.ne,
+    StringComparisonOperation.Contains: _numpy_contains,
+    StringComparisonOperation.StartsWith: _numpy_starts_with,
+    StringComparisonOperation.EndsWith: _numpy_ends_with,
+}
+
+
+# Marker of a missing value
+_MISSING = object()
+
+# Missing value semantics used when matching items (looking up enum members is slow)
+_RAISE = MissingValue.Raise
+_MATCH = MissingValue.Match
+
+# Exceptions of a missing key
+_KEY_ERRORS = (KeyError, IndexError, TypeError)
+
+# Exceptions of a comparison with a value of an unexpected type (e.g. a number with a string)
+_TYPE_ERRORS = (TypeError, AttributeError, ValueError)
+
+# Missing value result of the negated filter item
+_INVERTED_MISSING_VALUES = {
+    MissingValue.Raise: MissingValue.Raise,
+    MissingValue.NoMatch: MissingValue.Match,
+    MissingValue.Match: MissingValue.NoMatch,
+}
+
+
+def _match_key_value(key_path, missing_value, item, match_value):
+    """
+    Get the value of the key and match it (following the missing value semantics)
+
+    :param KeyPath key_path: key of the dictionary item
+    :param MissingValue missing_value: result for dictionary objects without a value
+    :param dict item: a dictionary object to match
+    :param match_value: function that matches the value
+
+    :return: Success or failure
+    :rtype: bool
+    """
+    if missing_value == _RAISE:
+        return match_value(_get_key_value(key_path, item))
+
+    value = key_path.get(item, _MISSING)
+
+    if (value is _MISSING) or (value is None):
+        return missing_value == _MATCH
+
+    try:
+        return match_value(value)
+    except _TYPE_ERRORS:
+        return False
+
+
+def _get_key_value(key_path, item):
+    """
+    Get the value of the key, raise KeyError if the key is missing
+    """
+    value = key_path.get(item, _MISSING)
+
+    if value is _MISSING:
+        raise KeyError(key_path.get_key())
+
+    return value
+
+
+def _key_predicate(key_path, missing_value, value_predicate):
+    """
+    Predicate that gets the value of the key and matches it with the value predicate (following the
+    missing value semantics, see "_match_key_value")
+    """
+    key = key_path.get_key()
+    get = key_path.get
+
+    if missing_value == MissingValue.Raise:
+        if not key_path.is_path():
+            return lambda item: value_predicate(item[key])
+
+        def predicate(item):
+            value = get(item, _MISSING)
+
+            if value is _MISSING:
+                raise KeyError(key)
+
+            return value_predicate(value)
+
+        return predicate
+
+    missing_result = (missing_value == MissingValue.Match)
+
+    if not key_path.is_path():
+        def predicate(item):
+            try:
+                value = item[key]
+            except _KEY_ERRORS:
+                return missing_result
+
+            if value is None:
+                return missing_result
+
+            try:
+                return value_predicate(value)
+            except _TYPE_ERRORS:
+                return False
+
+        return predicate
+
+    def predicate(item):
+        value = get(item, _MISSING)
+
+        if (value is _MISSING) or (value is None):
+            return missing_result
+
+        try:
+            return value_predicate(value)
+        except _TYPE_ERRORS:
+            return False
+
+    return predicate
+
+
+def _all_predicate(predicates):
+    """
+    Predicate that matches if all predicates match (logical AND)
+    """
+    if len(predicates) == 1:
+        single = predicates[0]
+        return lambda item: bool(single(item))
+    
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda item: bool(first(item) and second(item))
+    
+    def predicate(item):
+        for child in predicates:
+            if not child(item):
+                return False
+        return True
+    
+    return predicate
+
+
+def _any_predicate(predicates):
+    """
+    Predicate that matches if any of the predicates matches (logical OR)
+    """
+    if len(predicates) == 1:
+        single = predicates[0]
+        return lambda item: bool(single(item))
+    
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda item: bool(first(item) or second(item))
+    
+    def predicate(item):
+        for child in predicates:
+            if child(item):
+                return True
+        return False
+    
+    return predicate
+
+
+def _negated_predicate(predicate):
+    """
+    Predicate that matches if the predicate does not match
+    """
+    return lambda item: not predicate(item)
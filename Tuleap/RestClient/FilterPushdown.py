@@ -0,0 +1,372 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import datetime
+import numbers
+
+from Tuleap.RestClient.Filter import ComparisonOperation, FilterQuery, LogicalOperation, \
+    MissingValue, Negation, NumericFilterItem, NumericInRangeFilterItem, \
+    StringComparisonOperation, StringFilterItem
+from Tuleap.RestClient.Pagination import iterate_items
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class PushdownPlan(object):
+    """
+    Filter query split into a part that is executed by the server and a part that is executed
+    locally.
+
+    The server part is a TQL expression (the "expert_query" parameter of
+    "Tracker.request_artifact_list") that selects at least all matching artifacts. The local part
+    (residual query) contains all query items that could not be expressed exactly on the server and
+    has to be executed on the received artifacts.
+
+    Fields type information:
+    :type _expertQuery: str
+    :type _residualQuery: FilterQuery
+    :type _residualPredicate: function
+    """
+
+    def __init__(self, expert_query, residual_query):
+        """
+        Constructor
+
+        :param str expert_query: TQL expression executed by the server (None if nothing could be
+                                 pushed to the server)
+        :param FilterQuery residual_query: query executed locally (None if the server executes the
+                                           complete query)
+        """
+        self._expertQuery = expert_query
+        self._residualQuery = residual_query
+        self._residualPredicate = None
+
+        if residual_query is not None:
+            self._residualPredicate = residual_query.compile()
+
+    def get_expert_query(self):
+        """
+        :return: TQL expression executed by the server (None if nothing could be pushed)
+        :rtype: str
+        """
+        return self._expertQuery
+
+    def get_residual_query(self):
+        """
+        :return: query that has to be executed locally (None if the server executes the complete
+                 query)
+        :rtype: FilterQuery
+        """
+        return self._residualQuery
+
+    def is_exact(self):
+        """
+        :return: True if the server executes the complete query
+        :rtype: bool
+        """
+        return self._residualQuery is None
+
+    def matches(self, item):
+        """
+        Execute the residual query on an item received from the server
+
+        :param dict item: Dictionary object that should be filtered (same format as for the
+                          original query)
+
+        :return: True if the item matches the residual query (or if there is no residual query)
+        :rtype: bool
+        """
+        if self._residualPredicate is None:
+            return True
+
+        return self._residualPredicate(item)
+
+    def iterate_artifacts(self, tracker, tracker_id, converter=None, **kwargs):
+        """
+        Request the artifacts that match the query (page by page) from the server
+
+        :param tracker: tracker object (its connection must already be logged in)
+        :type tracker: Tuleap.RestClient.Trackers.Tracker
+        :param int tracker_id: Tracker ID
+        :param converter: Optional parameter for a function that converts the received artifact to
+                          the dictionary object that the filter query expects (the artifact is used
+                          as it is if not set)
+        :param kwargs: other parameters for "Tracker.request_artifact_list" (e.g. "field_values" or
+                       "limit")
+
+        :return: generator of the matching artifacts (as received from the server)
+        :rtype: collections.Iterable[dict]
+        """
+        for item in iterate_items(tracker.request_artifact_list,
+                                  tracker_id=tracker_id,
+                                  expert_query=self._expertQuery,
+                                  **kwargs):
+            if self.matches(converter(item) if converter is not None else item):
+                yield item
+
+
+def plan_pushdown(query, field_map):
+    """
+    Split the filter query into a TQL expression for the server and a residual query.
+
+    Pushed to the server are the query items on keys that are present in the field map:
+    * numeric comparisons and ranges with number values (exact)
+    * numeric comparisons and ranges with date values, widened to whole days (the residual query
+      keeps them)
+    * string "equal to", "contains", "starts with" and "ends with" comparisons with a non-empty
+      value on text fields, as TQL "=" which means "contains" for text fields (the residual query
+      keeps them)
+
+    Negated (sub)queries, "not equal to" comparisons, out of range items, items that match items
+    without a value (MissingValue.Match, the server would not select them) and "or" queries with
+    items that can not be pushed are executed only locally.
+
+    :param FilterQuery query: filter query
+    :param field_map: filter query key -> tracker field name (as used in TQL) or tuple of the
+                      tracker field name and the Tuleap field type (e.g. ("title", "string")).
+                      String comparisons are only pushed for keys with the field type "string" or
+                      "text", for other fields (e.g. list fields) TQL "=" has another meaning.
+    :type field_map: dict[str, str | (str, str)]
+
+    :return: pushdown plan
+    :rtype: PushdownPlan
+    """
+    expression, exact = _translate_query(query, field_map)
+
+    if exact:
+        return PushdownPlan(expression, None)
+
+    return PushdownPlan(expression, _residual_query(query, field_map))
+
+
+def format_tql_value(value):
+    """
+    Format the value as a TQL literal
+
+    :param value: number, string, date or datetime
+
+    :return: TQL literal
+    :rtype: str
+    """
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+
+    if isinstance(value, datetime.date):
+        value = value.isoformat()
+
+    if isinstance(value, str):
+        return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+    return repr(value)
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+_TQL_OPERATORS = {
+    ComparisonOperation.LessThan: "<",
+    ComparisonOperation.LessThanOrEqualTo: "<=",
+    ComparisonOperation.EqualTo: "=",
+    ComparisonOperation.GreaterThanOrEqualTo: ">=",
+    ComparisonOperation.GreaterThan: ">",
+}
+
+# Date comparisons are widened to whole days, so that the server never excludes a matching item
+_TQL_DATE_OPERATORS = {
+    ComparisonOperation.LessThan: "<=",
+    ComparisonOperation.LessThanOrEqualTo: "<=",
+    ComparisonOperation.EqualTo: "=",
+    ComparisonOperation.GreaterThanOrEqualTo: ">=",
+    ComparisonOperation.GreaterThan: ">=",
+}
+
+_PUSHED_STRING_OPERATIONS = (StringComparisonOperation.EqualTo,
+                             StringComparisonOperation.Contains,
+                             StringComparisonOperation.StartsWith,
+                             StringComparisonOperation.EndsWith)
+
+# Field types for which TQL "=" means "contains" (an empty value means "field is empty")
+_TEXT_FIELD_TYPES = ("string", "text")
+
+
+def _field_name(field_map, key):
+    field = field_map.get(key)
+
+    if isinstance(field, tuple):
+        return field[0]
+
+    return field
+
+
+def _field_type(field_map, key):
+    field = field_map.get(key)
+
+    if isinstance(field, tuple):
+        return field[1]
+
+    return None
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def _is_date(value):
+    return isinstance(value, (datetime.date, datetime.datetime))
+
+
+def _translate_query(query, field_map):
+    """
+    Translate the (sub)query to TQL
+
+    :return: (TQL expression or None if nothing can be pushed, True if the expression is exact)
+    :rtype: (str, bool)
+    """
+    if query.get_negation() == Negation.Enabled:
+        return None, False
+
+    translated = [_translate_query_item(query_item, field_map)
+                  for query_item in query.get_query_items()]
+    exact = all(item_exact for _, item_exact in translated)
+
+    if query.get_logical_operation() == LogicalOperation.And:
+        expressions = [expression for expression, _ in translated if expression is not None]
+
+        if not expressions:
+            return None, exact
+
+        return " AND ".join(expressions), exact
+
+    if query.get_logical_operation() == LogicalOperation.Or:
+        if (not translated) or any(expression is None for expression, _ in translated):
+            return None, False
+
+        if len(translated) == 1:
+            return translated[0][0], exact
+
+        return "(" + " OR ".join(expression for expression, _ in translated) + ")", exact
+
+    return None, False
+
+
+def _translate_query_item(query_item, field_map):
+    """
+    Translate a filter item or a subquery to TQL
+
+    :return: (TQL expression or None if nothing can be pushed, True if the expression is exact)
+    :rtype: (str, bool)
+    """
+    if isinstance(query_item, FilterQuery):
+        expression, exact = _translate_query(query_item, field_map)
+
+        # Keep the operator precedence of the sub-query ("or" expressions are already enclosed)
+        if (expression is not None) and \
+                (query_item.get_logical_operation() == LogicalOperation.And):
+            expression = "(" + expression + ")"
+
+        return expression, exact
+
+    # The server never returns the artifacts without a value for a field in a comparison, so the
+    # filter items that match them have to be executed locally
+    if query_item.get_missing_value() == MissingValue.Match:
+        return None, False
+
+    field = _field_name(field_map, query_item.get_key())
+
+    if field is None:
+        return None, False
+
+    if isinstance(query_item, NumericFilterItem):
+        return _translate_comparison(field, query_item)
+    elif isinstance(query_item, NumericInRangeFilterItem):
+        return _translate_in_range(field, query_item)
+    elif isinstance(query_item, StringFilterItem):
+        if (_field_type(field_map, query_item.get_key()) in _TEXT_FIELD_TYPES) and \
+                (query_item.get_comparison_operation() in _PUSHED_STRING_OPERATIONS) and \
+                isinstance(query_item.get_value(), str) and query_item.get_value():
+            return "{:} = {:}".format(field, format_tql_value(query_item.get_value())), False
+
+    return None, False
+
+
+def _translate_comparison(field, query_item):
+    operation = query_item.get_comparison_operation()
+    value = query_item.get_value()
+
+    if _is_number(value) and (operation in _TQL_OPERATORS):
+        return "{:} {:} {:}".format(field, _TQL_OPERATORS[operation], format_tql_value(value)), True
+
+    if _is_date(value) and (operation in _TQL_DATE_OPERATORS):
+        return "{:} {:} {:}".format(field,
+                                    _TQL_DATE_OPERATORS[operation],
+                                    format_tql_value(value)), False
+
+    return None, False
+
+
+def _translate_in_range(field, query_item):
+    lower_limit = query_item.get_lower_limit()
+    upper_limit = query_item.get_upper_limit()
+
+    if _is_number(lower_limit) and _is_number(upper_limit):
+        if query_item.is_lower_limit_included() and query_item.is_upper_limit_included():
+            return "{:} BETWEEN({:}, {:})".format(field,
+                                                  format_tql_value(lower_limit),
+                                                  format_tql_value(upper_limit)), True
+
+        return "({:} {:} {:} AND {:} {:} {:})".format(
+            field, ">=" if query_item.is_lower_limit_included() else ">",
+            format_tql_value(lower_limit),
+            field, "<=" if query_item.is_upper_limit_included() else "<",
+            format_tql_value(upper_limit)), True
+
+    if _is_date(lower_limit) and _is_date(upper_limit):
+        return "{:} BETWEEN({:}, {:})".format(field,
+                                              format_tql_value(lower_limit),
+                                              format_tql_value(upper_limit)), False
+
+    return None, False
+
+
+def _residual_query(query, field_map):
+    """
+    Build the query of the items that are not executed exactly by the server
+
+    :rtype: FilterQuery
+    """
+    if (query.get_negation() == Negation.Enabled) or \
+            (query.get_logical_operation() != LogicalOperation.And):
+        return query
+
+    residual_items = []
+
+    for query_item in query.get_query_items():
+        expression, exact = _translate_query_item(query_item, field_map)
+
+        if exact:
+            continue
+
+        if isinstance(query_item, FilterQuery):
+            residual_items.append(_residual_query(query_item, field_map))
+        else:
+            residual_items.append(query_item)
+
+    return FilterQuery(residual_items, LogicalOperation.And)
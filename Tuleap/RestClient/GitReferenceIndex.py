@@ -0,0 +1,335 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import binascii
+
+from Tuleap.RestClient.ValueParser import get_dicts
+
+# Public -------------------------------------------------------------------------------------------
+
+
+GIT_REFERENCE_PREFIX = "git #"
+
+
+def parse_git_reference(reference):
+    """
+    Parse a git cross-reference (e.g. "git #tuleap/stable/8e6896fa659ad7bea33a042fe3d5e0c395c10dc8")
+
+    :param str reference: git cross-reference
+
+    :return: (repository, binary commit SHA) or None if the reference is not a valid git reference
+    :rtype: (str, bytes)
+    """
+    if not isinstance(reference, str) or not reference.startswith(GIT_REFERENCE_PREFIX):
+        return None
+
+    repository, separator, sha = reference[len(GIT_REFERENCE_PREFIX):].rpartition("/")
+
+    if not separator:
+        return None
+
+    sha = _parse_sha(sha)
+
+    if sha is None:
+        return None
+
+    return repository, sha
+
+
+class GitReferenceIndex(object):
+    """
+    Index of the git commits referenced by artifacts.
+
+    The git cross-references are parsed only once into the repository and the commit SHA. The
+    repository names are stored once and referenced by their index, and the SHAs are stored as
+    binary strings (20 bytes instead of a 40 character string). Two maps are kept up to date: the
+    commits referenced by each artifact, and the artifacts referencing each commit.
+
+    The index can be fed with raw artifact items, parsed artifacts (ArtifactParser or
+    CompactArtifact) or plain lists of references, and it can be updated incrementally when
+    artifacts change.
+
+    Fields type information:
+    :type _repositories: list[str]
+    :type _repositoryIndexes: dict[str, int]
+    :type _commitsByArtifact: dict[int, set[(int, bytes)]]
+    :type _artifactsByCommit: dict[(int, bytes), set[int]]
+    :type _repositoriesBySha: dict[bytes, set[int]]
+    :type _invalidReferenceCount: int
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._repositories = []
+        self._repositoryIndexes = dict()
+        self._commitsByArtifact = dict()
+        self._artifactsByCommit = dict()
+        self._repositoriesBySha = dict()
+        self._invalidReferenceCount = 0
+
+    def set_references(self, artifact_id, references):
+        """
+        Set the git references of the artifact (the previously indexed references of the artifact
+        are replaced)
+
+        :param int artifact_id: Artifact ID
+        :param references: git cross-references (e.g. "git #repository/sha")
+        :type references: collections.Iterable[str]
+        """
+        commits = set()
+
+        for reference in references:
+            parsed = parse_git_reference(reference)
+
+            if parsed is None:
+                self._invalidReferenceCount += 1
+            else:
+                commits.add((self._repository_index(parsed[0]), parsed[1]))
+
+        self.remove_artifact(artifact_id)
+
+        if not commits:
+            return
+
+        self._commitsByArtifact[artifact_id] = commits
+
+        for commit in commits:
+            self._artifactsByCommit.setdefault(commit, set()).add(artifact_id)
+            self._repositoriesBySha.setdefault(commit[1], set()).add(commit[0])
+
+    def add_parsed_artifact(self, artifact_id, artifact):
+        """
+        Index the git references of a parsed artifact
+
+        :param int artifact_id: Artifact ID
+        :param artifact: parsed artifact
+        :type artifact: Tuleap.RestClient.ArtifactParser.ArtifactParser |
+                        Tuleap.RestClient.CompactArtifact.CompactArtifact
+        """
+        self.set_references(artifact_id,
+                            artifact.get_out_git_references() +
+                            artifact.get_in_git_references())
+
+    def add_item(self, item):
+        """
+        Index the git references of an artifact item (as received from the server with all field
+        values)
+
+        :param dict item: artifact
+        """
+        artifact_id = item.get("id")
+
+        if artifact_id is None:
+            return
+
+        references = []
+
+        for value_item in get_dicts(item.get("values")):
+            if value_item.get("type") == "cross":
+                for reference_item in get_dicts(value_item.get("value")):
+                    reference = reference_item.get("ref")
+
+                    if isinstance(reference, str) and reference.startswith("git"):
+                        references.append(reference)
+
+        self.set_references(artifact_id, references)
+
+    def add_items(self, items):
+        """
+        Index the git references of all artifact items (see "add_item")
+
+        :param items: artifacts (e.g. a page of artifacts or an iterator over all pages)
+        :type items: collections.Iterable[dict]
+        """
+        for item in items:
+            self.add_item(item)
+
+    def remove_artifact(self, artifact_id):
+        """
+        Remove the git references of the artifact from the index
+
+        :param int artifact_id: Artifact ID
+        """
+        commits = self._commitsByArtifact.pop(artifact_id, None)
+
+        if commits is None:
+            return
+
+        for commit in commits:
+            artifact_ids = self._artifactsByCommit[commit]
+            artifact_ids.discard(artifact_id)
+
+            if not artifact_ids:
+                del self._artifactsByCommit[commit]
+
+                repository_indexes = self._repositoriesBySha[commit[1]]
+                repository_indexes.discard(commit[0])
+
+                if not repository_indexes:
+                    del self._repositoriesBySha[commit[1]]
+
+    def get_artifact_count(self):
+        """
+        :return: Number of artifacts with git references
+        :rtype: int
+        """
+        return len(self._commitsByArtifact)
+
+    def get_commit_count(self):
+        """
+        :return: Number of referenced commits
+        :rtype: int
+        """
+        return len(self._artifactsByCommit)
+
+    def get_invalid_reference_count(self):
+        """
+        :return: Number of references that could not be parsed
+        :rtype: int
+        """
+        return self._invalidReferenceCount
+
+    def get_repositories(self):
+        """
+        :return: Names of all repositories seen so far
+        :rtype: list[str]
+        """
+        return list(self._repositories)
+
+    def get_artifact_ids(self, sha, repository=None):
+        """
+        Get the artifacts that reference the commit
+
+        :param str sha: commit SHA (hexadecimal) or a git cross-reference ("git #repository/sha")
+        :param str repository: Optional parameter for the repository of the commit (by default the
+                               commit is searched in all repositories)
+
+        :return: Artifact IDs (sorted)
+        :rtype: list[int]
+        """
+        parsed = parse_git_reference(sha)
+
+        if parsed is not None:
+            repository, binary_sha = parsed
+        else:
+            binary_sha = _parse_sha(sha)
+
+            if binary_sha is None:
+                return []
+
+        if repository is not None:
+            repository_indexes = [self._repositoryIndexes.get(repository)]
+        else:
+            repository_indexes = self._repositoriesBySha.get(binary_sha, ())
+
+        artifact_ids = set()
+
+        for repository_index in repository_indexes:
+            artifact_ids.update(self._artifactsByCommit.get((repository_index, binary_sha), ()))
+
+        return sorted(artifact_ids)
+
+    def get_commits(self, artifact_ids):
+        """
+        Get the commits referenced by the artifact(s), e.g. by all artifacts of an epic (see
+        "ArtifactGraph.get_subtree")
+
+        :param artifact_ids: Artifact ID or IDs
+        :type artifact_ids: int | collections.Iterable[int]
+
+        :return: (repository, hexadecimal commit SHA) tuples (sorted)
+        :rtype: list[(str, str)]
+        """
+        if isinstance(artifact_ids, int):
+            artifact_ids = [artifact_ids]
+
+        commits = set()
+
+        for artifact_id in artifact_ids:
+            commits.update(self._commitsByArtifact.get(artifact_id, ()))
+
+        return sorted((self._repositories[repository_index], _to_hex(binary_sha))
+                      for repository_index, binary_sha in commits)
+
+    def get_repository_artifact_ids(self, repository):
+        """
+        Get the artifacts that reference commits of the repository
+
+        :param str repository: repository name (e.g. "tuleap/stable")
+
+        :return: Artifact IDs (sorted)
+        :rtype: list[int]
+        """
+        repository_index = self._repositoryIndexes.get(repository)
+
+        if repository_index is None:
+            return []
+
+        return sorted(artifact_id
+                      for artifact_id, commits in self._commitsByArtifact.items()
+                      if any(commit[0] == repository_index for commit in commits))
+
+# Private-------------------------------------------------------------------------------------------
+
+    def _repository_index(self, repository):
+        """
+        Get the index of the repository (the repository is added if needed)
+
+        :rtype: int
+        """
+        repository_index = self._repositoryIndexes.get(repository)
+
+        if repository_index is None:
+            repository_index = len(self._repositories)
+            self._repositories.append(repository)
+            self._repositoryIndexes[repository] = repository_index
+
+        return repository_index
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+def _parse_sha(sha):
+    """
+    Convert a hexadecimal commit SHA to a binary string
+
+    :return: binary SHA or None if the SHA is not valid
+    :rtype: bytes
+    """
+    if not isinstance(sha, str) or (len(sha) == 0) or (len(sha) % 2 != 0):
+        return None
+
+    try:
+        return binascii.unhexlify(sha.lower())
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _to_hex(binary_sha):
+    """
+    Convert a binary commit SHA to a hexadecimal string
+
+    :rtype: str
+    """
+    return binascii.hexlify(binary_sha).decode("ascii")
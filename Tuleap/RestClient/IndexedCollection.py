@@ -0,0 +1,479 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import bisect
+
+from Tuleap.RestClient.AdaptiveFilter import describe_query_item
+from Tuleap.RestClient.Filter import CaseSensitivity, ComparisonOperation, FilterQuery, KeyPath, \
+    LogicalOperation, MissingValue, Negation, NumericFilterItem, NumericInRangeFilterItem, \
+    NumericOutOfRangeFilterItem, StringComparisonOperation, StringFilterItem
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class IndexedCollection(object):
+    """
+    Collection of dictionary objects (e.g. cached projects or artifacts) for repeated filtering.
+
+    Filter queries are executed with indexes on the keys used by the filter items. The indexes
+    are built on first use and kept until the collection is changed:
+    * hash indexes for "equal to" and "not equal to" comparisons (numeric and string comparisons)
+    * sorted indexes for numeric comparisons and ranges
+    * sorted string indexes for "starts with" comparisons (the matching strings are a contiguous
+      range of the sorted strings)
+    Case insensitive string comparisons use indexes of the lower case values.
+
+    An index is only used if every item has a value for the key and all values can be compared
+    (e.g. all numbers or all strings). Filter items that can not use an index (e.g. "contains"
+    comparisons) are executed item by item, but only on the items that are still candidates after
+    executing the indexed filter items.
+
+    The results are the same as the results of "FilterQuery.execute" for every item, as long as the
+    filter items do not raise exceptions (e.g. for missing keys).
+
+    Fields type information:
+    :type _items: list[dict]
+    :type _hashIndexes: dict[(str, bool), dict | None]
+    :type _sortedIndexes: dict[(str, str), (list, list[int]) | None]
+    """
+
+    def __init__(self, items=None):
+        """
+        Constructor
+
+        :param items: Optional parameter for the initial items
+        :type items: collections.Iterable[dict]
+        """
+        self._items = list(items) if items is not None else []
+        self._hashIndexes = dict()
+        self._sortedIndexes = dict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def add_items(self, items):
+        """
+        Add items to the collection (the indexes are rebuilt on next use)
+
+        :param items: items to add
+        :type items: collections.Iterable[dict]
+        """
+        self._items.extend(items)
+        self.clear_indexes()
+
+    def get_items(self):
+        """
+        :return: all items of the collection
+        :rtype: list[dict]
+        """
+        return self._items
+
+    def clear_indexes(self):
+        """
+        Remove all indexes (they are rebuilt on next use)
+        """
+        self._hashIndexes.clear()
+        self._sortedIndexes.clear()
+
+    def get_index_count(self):
+        """
+        :return: number of built indexes
+        :rtype: int
+        """
+        return len([index for index in self._hashIndexes.values() if index is not None]) + \
+            len([index for index in self._sortedIndexes.values() if index is not None])
+
+    def execute(self, query):
+        """
+        Execute the query on all items
+
+        :param FilterQuery query: filter query
+
+        :return: matching items (in the order of the collection)
+        :rtype: list[dict]
+        """
+        return [self._items[position] for position in self.execute_positions(query)]
+
+    def execute_positions(self, query):
+        """
+        Execute the query on all items
+
+        :param FilterQuery query: filter query
+
+        :return: positions of the matching items (ascending)
+        :rtype: list[int]
+        """
+        return sorted(self._evaluate_query(query, None))
+
+    def explain(self, query):
+        """
+        Describe how the filter items of the query are executed
+
+        :param FilterQuery query: filter query
+
+        :return: one line per (sub)query and filter item, depth first (e.g.
+                 "status EqualTo 'Open': index")
+        :rtype: list[str]
+        """
+        lines = []
+        self._explain_query(query, 0, lines)
+
+        return lines
+
+# Private-------------------------------------------------------------------------------------------
+
+    def _all_positions(self):
+        return set(range(len(self._items)))
+
+    def _evaluate_query(self, query, domain):
+        """
+        Get the positions of the items of the domain that match the query
+
+        :param FilterQuery query: (sub)query
+        :param set[int] domain: positions of the candidate items (None for all items)
+
+        :return: positions of the matching items
+        :rtype: set[int]
+        """
+        if query.get_negation() == Negation.Enabled:
+            matches = self._evaluate_operation(query, domain)
+            return (domain if domain is not None else self._all_positions()) - matches
+
+        return self._evaluate_operation(query, domain)
+
+    def _evaluate_operation(self, query, domain):
+        """
+        Get the positions of the items of the domain that match the query (without its negation)
+        """
+        query_items = query.get_query_items()
+
+        if query.get_logical_operation() == LogicalOperation.And:
+            # Indexed filter items first, they reduce the domain of the other ones
+            indexed = []
+            other = []
+
+            for query_item in query_items:
+                positions = self._lookup(query_item)
+
+                if positions is not None:
+                    indexed.append(positions)
+                else:
+                    other.append(query_item)
+
+            matches = domain
+
+            for positions in sorted(indexed, key=len):
+                matches = positions if matches is None else (matches & positions)
+
+            for query_item in other:
+                if (matches is not None) and (len(matches) == 0):
+                    break
+
+                matches = self._evaluate_item(query_item, matches)
+
+            return matches if matches is not None else self._all_positions()
+
+        if query.get_logical_operation() == LogicalOperation.Or:
+            if domain is None:
+                domain = self._all_positions()
+
+            matches = set()
+            other = []
+
+            for query_item in query_items:
+                positions = self._lookup(query_item)
+
+                if positions is not None:
+                    matches |= (positions & domain)
+                else:
+                    other.append(query_item)
+
+            for query_item in other:
+                remaining = domain - matches
+
+                if not remaining:
+                    break
+
+                matches |= self._evaluate_item(query_item, remaining)
+
+            return matches
+
+        raise Exception("Error: invalid logical operation!")
+
+    def _evaluate_item(self, query_item, domain):
+        """
+        Get the positions of the items of the domain that match the query item
+
+        :return: positions of the matching items
+        :rtype: set[int]
+        """
+        if isinstance(query_item, FilterQuery):
+            return self._evaluate_query(query_item, domain)
+
+        positions = self._lookup(query_item)
+
+        if positions is not None:
+            return positions if domain is None else (positions & domain)
+
+        return self._scan(query_item, domain)
+
+    def _scan(self, query_item, domain):
+        """
+        Execute the filter item item by item
+        """
+        match = query_item.compile()
+        items = self._items
+
+        if domain is None:
+            return set(position for position, item in enumerate(items) if match(item))
+
+        return set(position for position in domain if match(items[position]))
+
+    def _lookup(self, query_item):
+        """
+        Get the positions of the matching items with an index
+
+        :return: positions of the matching items (or None if no index can be used)
+        :rtype: set[int]
+        """
+        if isinstance(query_item, NumericFilterItem):
+            return self._lookup_comparison(query_item.get_key(),
+                                           query_item.get_comparison_operation(),
+                                           query_item.get_value(),
+                                           False,
+                                           query_item.get_missing_value())
+
+        if isinstance(query_item, NumericInRangeFilterItem):
+            return self._lookup_range(query_item)
+
+        if isinstance(query_item, NumericOutOfRangeFilterItem):
+            positions = self._lookup_range(query_item.get_in_range_filter())
+
+            if positions is None:
+                return None
+
+            return self._all_positions() - positions
+
+        if isinstance(query_item, StringFilterItem):
+            return self._lookup_string(query_item)
+
+        return None
+
+    def _lookup_comparison(self, key, operation, value, lower_case, missing_value):
+        if operation in (ComparisonOperation.EqualTo, ComparisonOperation.NotEqualTo):
+            index = self._hash_index(key, lower_case)
+
+            try:
+                positions = set(index.get(value, ())) if index is not None else None
+            except TypeError:
+                # Unhashable filter value
+                positions = None
+
+            if (positions is not None) and (operation == ComparisonOperation.NotEqualTo):
+                positions = self._all_positions() - positions
+
+            if (positions is not None) and (missing_value != MissingValue.Raise):
+                # Items with a None value do not have a value
+                missing_positions = set(index.get(None, ()))
+
+                if missing_value == MissingValue.Match:
+                    positions |= missing_positions
+                else:
+                    positions -= missing_positions
+
+            return positions
+
+        index = self._sorted_index(key, "numeric")
+
+        if index is None:
+            return None
+
+        values, positions = index
+
+        try:
+            if operation == ComparisonOperation.LessThan:
+                return set(positions[:bisect.bisect_left(values, value)])
+
+            if operation == ComparisonOperation.LessThanOrEqualTo:
+                return set(positions[:bisect.bisect_right(values, value)])
+
+            if operation == ComparisonOperation.GreaterThan:
+                return set(positions[bisect.bisect_right(values, value):])
+
+            if operation == ComparisonOperation.GreaterThanOrEqualTo:
+                return set(positions[bisect.bisect_left(values, value):])
+        except TypeError:
+            # The filter value can not be compared with the indexed values
+            return None
+
+        return None
+
+    def _lookup_range(self, query_item):
+        index = self._sorted_index(query_item.get_key(), "numeric")
+
+        if index is None:
+            return None
+
+        values, positions = index
+
+        try:
+            if query_item.is_lower_limit_included():
+                start = bisect.bisect_left(values, query_item.get_lower_limit())
+            else:
+                start = bisect.bisect_right(values, query_item.get_lower_limit())
+
+            if query_item.is_upper_limit_included():
+                end = bisect.bisect_right(values, query_item.get_upper_limit())
+            else:
+                end = bisect.bisect_left(values, query_item.get_upper_limit())
+        except TypeError:
+            return None
+
+        return set(positions[start:end])
+
+    def _lookup_string(self, query_item):
+        value = query_item.get_value()
+
+        if not isinstance(value, str):
+            return None
+
+        lower_case = (query_item.get_case_sensitivity() == CaseSensitivity.CaseInsensitive)
+
+        if lower_case:
+            value = value.lower()
+
+        operation = query_item.get_comparison_operation()
+
+        if operation in (StringComparisonOperation.EqualTo, StringComparisonOperation.NotEqualTo):
+            return self._lookup_comparison(query_item.get_key(),
+                                           ComparisonOperation.EqualTo
+                                           if operation == StringComparisonOperation.EqualTo
+                                           else ComparisonOperation.NotEqualTo,
+                                           value,
+                                           lower_case,
+                                           query_item.get_missing_value())
+
+        if operation == StringComparisonOperation.StartsWith:
+            index = self._sorted_index(query_item.get_key(), "lower" if lower_case else "string")
+
+            if index is None:
+                return None
+
+            values, positions = index
+            start = bisect.bisect_left(values, value)
+            end = start
+
+            while (end < len(values)) and values[end].startswith(value):
+                end += 1
+
+            return set(positions[start:end])
+
+        return None
+
+    def _hash_index(self, key, lower_case):
+        """
+        Get (or build) the hash index of the key: value -> positions
+
+        :return: hash index or None if not all items have a hashable value for the key
+        """
+        index_key = (key, lower_case)
+
+        if index_key not in self._hashIndexes:
+            index = dict()
+            key_path = KeyPath(key)
+
+            try:
+                for position, item in enumerate(self._items):
+                    value = key_path.get(item, _MISSING)
+
+                    if value is _MISSING:
+                        raise KeyError(key)
+
+                    if lower_case:
+                        value = value.lower()
+
+                    index.setdefault(value, []).append(position)
+            except (KeyError, TypeError, AttributeError):
+                index = None
+
+            self._hashIndexes[index_key] = index
+
+        return self._hashIndexes[index_key]
+
+    def _sorted_index(self, key, kind):
+        """
+        Get (or build) the sorted index of the key: (sorted values, positions)
+
+        :param str kind: "numeric" (no strings), "string" (only strings) or "lower" (only strings,
+                         converted to lower case)
+
+        :return: sorted index or None if not all items have a value of the kind for the key
+        """
+        index_key = (key, kind)
+
+        if index_key not in self._sortedIndexes:
+            index = None
+
+            try:
+                entries = []
+                key_path = KeyPath(key)
+
+                for position, item in enumerate(self._items):
+                    value = key_path.get(item)
+
+                    if (value is None) or (isinstance(value, str) != (kind != "numeric")):
+                        raise TypeError()
+
+                    if kind == "lower":
+                        value = value.lower()
+
+                    entries.append((value, position))
+
+                entries.sort()
+                index = ([value for value, _ in entries], [position for _, position in entries])
+            except (KeyError, TypeError):
+                index = None
+
+            self._sortedIndexes[index_key] = index
+
+        return self._sortedIndexes[index_key]
+
+    def _explain_query(self, query, depth, lines):
+        lines.append("{:}{:}{:}".format("  " * depth,
+                                        "Not " if query.get_negation() == Negation.Enabled
+                                        else "",
+                                        query.get_logical_operation().name))
+
+        for query_item in query.get_query_items():
+            if isinstance(query_item, FilterQuery):
+                self._explain_query(query_item, depth + 1, lines)
+            else:
+                lines.append("{:}{:}: {:}".format("  " * (depth + 1),
+                                                  describe_query_item(query_item),
+                                                  "index" if self._lookup(query_item) is not None
+                                                  else "scan"))
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+# Marker of a missing value
+_MISSING = object()
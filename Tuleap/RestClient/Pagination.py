@@ -0,0 +1,190 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+import re
+
+# Public -------------------------------------------------------------------------------------------
+
+
+DEFAULT_PAGE_SIZE = 50
+
+
+class PageRequestError(Exception):
+    """
+    Raised when a page of a paginated list could not be requested
+    """
+
+
+def iterate_pages(request_method, *args, **kwargs):
+    """
+    Walk all pages of a paginated list method and yield them one by one.
+
+    The request method has to be a bound "request_*" method of one of the REST API classes that
+    accepts the "limit" and "offset" parameters (for example "Tracker.request_artifact_list" or
+    "Projects.request_trackers"). The owner of the method is used to get the page data and the
+    total number of items ("X-PAGINATION-SIZE" header).
+
+    :param request_method: bound request method (e.g. tracker.request_artifact_list)
+    :param args: positional parameters passed to the request method
+    :param kwargs: keyword parameters passed to the request method, "limit" is the page size
+                   (DEFAULT_PAGE_SIZE if not set), "offset" the index of the first item and
+                   "checkpoint" an optional CrawlCheckpoint that makes the walk resumable
+
+    :return: generator of (offset, page) tuples where page is the list of items
+    :rtype: collections.Iterable[(int, list)]
+
+    With a checkpoint the offset of the next page is stored every time the consumer requests the
+    next page (i.e. after it finished processing the previous one). When the walk is started again
+    with the same checkpoint and parameters (and without an explicit offset) it continues with the
+    first unfinished page, so a page is processed at least once. A completed walk yields nothing
+    until the checkpoint is cleared.
+
+    Example:
+        tracker = Tracker(connection)
+        for offset, page in iterate_pages(tracker.request_artifact_list,
+                                          tracker_id=20,
+                                          field_values=FieldValues.All):
+            ...
+    """
+    owner = request_method.__self__
+    limit = kwargs.pop("limit", DEFAULT_PAGE_SIZE)
+    offset = kwargs.pop("offset", None)
+    checkpoint = kwargs.pop("checkpoint", None)
+    crawl_key = None
+
+    if limit is None:
+        limit = DEFAULT_PAGE_SIZE
+
+    if checkpoint is not None:
+        crawl_key = checkpoint.make_page_key(request_method, args, kwargs)
+
+        if checkpoint.is_complete(crawl_key):
+            return
+
+        if offset is None:
+            offset = checkpoint.get_next_offset(crawl_key)
+
+    if offset is None:
+        offset = 0
+
+    while True:
+        success = request_method(*args, limit=limit, offset=offset, **kwargs)
+
+        if not success:
+            raise PageRequestError("Error: page request failed at offset {:}".format(offset))
+
+        # Read the page and the total before yielding, the consumer may use the same owner for
+        # other requests
+        page = owner.get_data()
+        total = owner.get_count()
+
+        if not page:
+            break
+
+        yield offset, page
+
+        offset += len(page)
+
+        if checkpoint is not None:
+            checkpoint.set_page_complete(crawl_key, offset)
+
+        if (total is not None) and (offset >= total):
+            break
+
+    if checkpoint is not None:
+        checkpoint.set_complete(crawl_key)
+
+
+def iterate_items(request_method, *args, **kwargs):
+    """
+    Walk all pages of a paginated list method and yield the items one by one.
+
+    :param request_method: bound request method (e.g. tracker.request_artifact_list)
+    :param args: positional parameters passed to the request method
+    :param kwargs: keyword parameters passed to the request method (see "iterate_pages")
+
+    :return: generator of items
+    :rtype: collections.Iterable[dict]
+    """
+    for _, page in iterate_pages(request_method, *args, **kwargs):
+        for item in page:
+            yield item
+
+
+def iterate_raw_pages(connection, relative_url, parameters=None, limit=None, offset=None):
+    """
+    Walk all pages of a paginated REST API method and yield the raw (not decoded) response bodies.
+
+    This is useful when the pages are decoded and parsed somewhere else (e.g. in another process).
+
+    The pages are not decoded. The server returns at most "X-PAGINATION-LIMIT-MAX" items per page,
+    so the page size is reduced to this maximum (if the header is provided) and the next offset is
+    advanced by the page size. The walk stops on an empty page or when the offset reaches the total
+    number of items ("X-PAGINATION-SIZE" header, if provided).
+
+    :param connection: connection object (must already be logged in)
+    :type connection: Tuleap.RestClient.Connection.Connection
+    :param str relative_url: relative part of URL (e.g. "/trackers/20/artifacts")
+    :param dict parameters: additional parameters that should be added to the URL
+    :param int limit: Optional parameter for the page size (DEFAULT_PAGE_SIZE if not set)
+    :param int offset: Optional parameter for the index of the first item
+
+    :return: generator of (offset, raw page) tuples
+    :rtype: collections.Iterable[(int, bytes)]
+    """
+    parameters = dict(parameters) if parameters is not None else dict()
+
+    if limit is None:
+        limit = DEFAULT_PAGE_SIZE
+
+    if offset is None:
+        offset = 0
+
+    while True:
+        parameters["limit"] = limit
+        parameters["offset"] = offset
+
+        if not connection.call_get_method(relative_url, parameters):
+            raise PageRequestError("Error: page request failed at offset {:}".format(offset))
+
+        response = connection.get_last_response_message()
+        total = response.headers.get("X-PAGINATION-SIZE")
+        limit_max = response.headers.get("X-PAGINATION-LIMIT-MAX")
+        content = response.content
+
+        if _EMPTY_PAGE.match(content):
+            break
+
+        if limit_max is not None:
+            limit = min(limit, int(limit_max))
+
+        yield offset, content
+
+        offset += limit
+
+        if (total is not None) and (offset >= int(total)):
+            break
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+# Response body of an empty page (matching fails on the first item, so a page is never scanned)
+_EMPTY_PAGE = re.compile(rb"\s*\[\s*\]\s*$")
@@ -0,0 +1,285 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+
+from Tuleap.RestClient.ColumnFilter import get_column_length
+
+# Public -------------------------------------------------------------------------------------------
+
+
+DEFAULT_MIN_PARALLEL_ITEMS = 20000
+
+
+def filter_many(query,
+                items,
+                processes=None,
+                chunk_size=None,
+                min_parallel_items=DEFAULT_MIN_PARALLEL_ITEMS,
+                indices=False):
+    """
+    Execute a filter query on a large collection of items in a pool of worker processes.
+
+    The items are partitioned into chunks of consecutive items and every worker executes the
+    compiled query (see "FilterQuery.compile") on a chunk. Where the "fork" start method is
+    available the workers inherit the items from the calling process, so only the chunk bounds and
+    the indices of the matching items are sent between the processes; elsewhere the chunks are
+    pickled. The results of the chunks are merged in the order of the items.
+
+    Small collections (and a single process) are filtered in the calling process, where the
+    overhead of starting the workers would outweigh the gain.
+
+    :param query: filter query (or filter item) that is compiled in every worker, it has to be
+                  picklable
+    :type query: Tuleap.RestClient.Filter.FilterQuery
+    :param items: dictionary objects to filter
+    :type items: list[dict]
+    :param int processes: Optional parameter for the number of worker processes (number of CPUs if
+                          not set)
+    :param int chunk_size: Optional parameter for the number of items per chunk (by default every
+                           worker gets four chunks)
+    :param int min_parallel_items: minimum number of items that are filtered in parallel
+    :param bool indices: return the indices of the matching items instead of the items
+
+    :return: matching items (or their indices), in the order of the items
+    :rtype: list
+    """
+    if not isinstance(items, (list, tuple)):
+        items = list(items)
+
+    count = len(items)
+    processes = _process_count(processes)
+
+    if (processes <= 1) or (count < max(min_parallel_items, 2)):
+        predicate = query.compile()
+        positions = [position for position, item in enumerate(items) if predicate(item)]
+    else:
+        positions = _execute_chunks(query,
+                                    items,
+                                    _chunk_bounds(count, processes, chunk_size),
+                                    processes,
+                                    _filter_shared_chunk,
+                                    _filter_chunk)
+
+    if indices:
+        return positions
+
+    return [items[position] for position in positions]
+
+
+def filter_columns_many(query,
+                        columns,
+                        row_count=None,
+                        processes=None,
+                        chunk_size=None,
+                        min_parallel_items=DEFAULT_MIN_PARALLEL_ITEMS):
+    """
+    Execute a filter query on a large columnar batch of items in a pool of worker processes.
+
+    Every worker executes the query (see "FilterQuery.execute_columns") on a range of rows. The
+    columns are only shared with the workers where the "fork" start method is available (the
+    workers inherit the columns, NumPy arrays and arrays are sliced without copying); elsewhere the
+    query is executed in the calling process, since copying the columns to the workers costs more
+    than the vectorized evaluation.
+
+    :param query: filter query, it has to be picklable
+    :type query: Tuleap.RestClient.Filter.FilterQuery
+    :param dict columns: key -> column (see "FilterQuery.execute_columns")
+    :param int row_count: Optional parameter for the number of rows (by default the length of the
+                          columns)
+    :param int processes: Optional parameter for the number of worker processes (number of CPUs if
+                          not set)
+    :param int chunk_size: Optional parameter for the number of rows per chunk (by default every
+                           worker gets four chunks)
+    :param int min_parallel_items: minimum number of rows that are filtered in parallel
+
+    :return: indices of the matching rows (ascending)
+    :rtype: list[int]
+    """
+    if row_count is None:
+        row_count = get_column_length(columns)
+
+    processes = _process_count(processes)
+
+    if (processes <= 1) or (row_count < max(min_parallel_items, 2)) or (_fork_context() is None):
+        return query.execute_columns(columns, row_count).get_indices()
+
+    return _execute_chunks(query,
+                           columns,
+                           _chunk_bounds(row_count, processes, chunk_size),
+                           processes,
+                           _filter_shared_columns,
+                           None)
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+# Data inherited by the forked worker processes (only set while a pool is running)
+_SHARED_DATA = []
+_SHARED_DATA_LOCK = threading.Lock()
+
+# Predicate compiled in a worker process
+_WORKER_QUERY = []
+
+
+class _ColumnSlice(object):
+    """
+    Range of rows of an ArtifactTable column (see "ColumnFilter.evaluate_column")
+    """
+
+    def __init__(self, column, start, end):
+        self._values = column.get_values()[start:end]
+        self._mask = column.get_mask()[start:end]
+
+    def __len__(self):
+        return len(self._values)
+
+    def get_values(self):
+        return self._values
+
+    def get_mask(self):
+        return self._mask
+
+
+def _process_count(processes):
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    return processes
+
+
+def _chunk_bounds(count, processes, chunk_size):
+    """
+    Split the items into chunks of consecutive items
+
+    :return: list of (start, end) tuples
+    :rtype: list[(int, int)]
+    """
+    if not chunk_size:
+        chunk_size = -(-count // (processes * 4))
+
+    chunk_size = max(chunk_size, 1)
+
+    return [(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+
+
+def _fork_context():
+    """
+    :return: multiprocessing context of the "fork" start method (or None if it is not available)
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+
+    return multiprocessing.get_context("fork")
+
+
+def _execute_chunks(query, data, bounds, processes, shared_function, chunk_function):
+    """
+    Execute the query on all chunks in a pool of worker processes
+
+    :param shared_function: function(start, end) executed on the inherited data (fork)
+    :param chunk_function: function(start, chunk) executed on a pickled chunk of the data
+
+    :return: matching positions in ascending order
+    :rtype: list[int]
+    """
+    context = _fork_context()
+    workers = min(processes, len(bounds))
+
+    if context is not None:
+        with _SHARED_DATA_LOCK:
+            _SHARED_DATA.append(data)
+
+            try:
+                # The worker processes are forked when the first chunk is submitted
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                            mp_context=context,
+                                                            initializer=_initialize_worker,
+                                                            initargs=(query,)) as executor:
+                    futures = [executor.submit(shared_function, start, end)
+                               for start, end in bounds]
+
+                    return _merge_positions(futures)
+            finally:
+                _SHARED_DATA.pop()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                initializer=_initialize_worker,
+                                                initargs=(query,)) as executor:
+        futures = [executor.submit(chunk_function, start, data[start:end])
+                   for start, end in bounds]
+
+        return _merge_positions(futures)
+
+
+def _merge_positions(futures):
+    """
+    Concatenate the matching positions of the chunks (in the order of the chunks)
+    """
+    positions = []
+
+    for future in futures:
+        positions.extend(future.result())
+
+    return positions
+
+
+def _initialize_worker(query):
+    _WORKER_QUERY[:] = [query, None]
+
+
+def _worker_predicate():
+    if _WORKER_QUERY[1] is None:
+        _WORKER_QUERY[1] = _WORKER_QUERY[0].compile()
+
+    return _WORKER_QUERY[1]
+
+
+def _filter_chunk(start, chunk):
+    predicate = _worker_predicate()
+
+    return [start + offset for offset, item in enumerate(chunk) if predicate(item)]
+
+
+def _filter_shared_chunk(start, end):
+    items = _SHARED_DATA[-1]
+    predicate = _worker_predicate()
+
+    return [position for position in range(start, end) if predicate(items[position])]
+
+
+def _filter_shared_columns(start, end):
+    columns = dict((key, _slice_column(column, start, end))
+                   for key, column in _SHARED_DATA[-1].items())
+
+    return [start + offset
+            for offset in _WORKER_QUERY[0].execute_columns(columns, end - start).get_indices()]
+
+
+def _slice_column(column, start, end):
+    if hasattr(column, "get_mask"):
+        return _ColumnSlice(column, start, end)
+
+    return column[start:end]
@@ -0,0 +1,227 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+import collections
+import concurrent.futures
+import json
+import os
+from enum import IntEnum
+
+from Tuleap.RestClient.ArtifactTable import parse_artifact_page
+from Tuleap.RestClient.CompactArtifact import CompactArtifact
+from Tuleap.RestClient.TrackerSchemaParser import TrackerSchemaParser
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class ParseOutput(IntEnum):
+    """
+    Result of parsing a page of artifacts
+    """
+    CompactArtifacts = 0    # list of CompactArtifact objects
+    ArtifactTable = 1       # one ArtifactTable per page
+
+
+class ParallelParser(object):
+    """
+    Decode and parse pages of artifacts in a pool of worker processes.
+
+    For large exports the JSON decoding and parsing of the artifacts is the bottleneck, and it can
+    not be spread over several threads. The raw pages (as received from the server, for example
+    with "Pagination.iterate_raw_pages") are therefore sent to worker processes where they are
+    decoded and parsed, and only the compact results are sent back.
+
+    The number of pages that are being parsed at the same time is limited, so pages are only
+    requested from the source when a worker is (almost) ready to take them.
+
+    Fields type information:
+    :type _output: ParseOutput
+    :type _typed: bool
+    :type _tracker: dict
+    :type _processes: int
+    :type _maxPending: int
+    """
+
+    def __init__(self,
+                 output=ParseOutput.CompactArtifacts,
+                 typed=False,
+                 tracker=None,
+                 processes=None,
+                 max_pending=None):
+        """
+        Constructor
+
+        :param ParseOutput output: Result of parsing a page
+        :param bool typed: Keep the values as native values instead of converting them to strings
+                           (see ValueParser)
+        :param dict tracker: Optional parameter for the tracker structure (as received with
+                             "Tracker.request_tracker"), used to compile a TrackerSchemaParser in
+                             every worker (only for ParseOutput.CompactArtifacts)
+        :param int processes: Optional parameter for the number of worker processes (number of CPUs
+                              if not set)
+        :param int max_pending: Optional parameter for the maximum number of pages that are
+                                submitted to the workers at the same time (two per worker if not
+                                set)
+        """
+        self._output = output
+        self._typed = typed
+        self._tracker = tracker
+        self._processes = processes if processes is not None else (os.cpu_count() or 1)
+        self._maxPending = max_pending if max_pending is not None else (2 * self._processes)
+
+        if self._maxPending < 1:
+            raise ValueError("Error: max_pending must be at least 1")
+
+    def parse_pages(self, pages, ordered=True):
+        """
+        Parse the pages in the worker processes
+
+        :param pages: raw pages, either the response bodies (JSON list of artifacts) or
+                      (offset, response body) tuples as yielded by "Pagination.iterate_raw_pages"
+        :type pages: collections.Iterable[bytes | str | (int, bytes | str)]
+        :param bool ordered: Yield the results in the order of the pages (otherwise they are yielded
+                             as soon as they are ready)
+
+        :return: generator of (page index, result) tuples, where page index is the offset (for
+                 (offset, body) tuples) or the position of the page, and result is a list of
+                 CompactArtifact objects or an ArtifactTable (see ParseOutput)
+        :rtype: collections.Iterable[(int, list[CompactArtifact] | ArtifactTable)]
+        """
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self._processes,
+                                                    initializer=_initialize_worker,
+                                                    initargs=(self._output,
+                                                              self._typed,
+                                                              self._tracker)) as executor:
+            pending = collections.deque()
+
+            for page_index, page in _indexed_pages(pages):
+                if len(pending) >= self._maxPending:
+                    for result in self._collect(pending, ordered):
+                        yield result
+
+                pending.append((page_index, executor.submit(_parse_page, page)))
+
+            while pending:
+                for result in self._collect(pending, ordered):
+                    yield result
+
+    def parse_pages_serially(self, pages):
+        """
+        Parse the pages in the current process (same results as "parse_pages", useful for small
+        exports and debugging)
+
+        :param pages: raw pages (see "parse_pages")
+
+        :return: generator of (page index, result) tuples
+        :rtype: collections.Iterable[(int, list[CompactArtifact] | ArtifactTable)]
+        """
+        page_parser = _PageParser(self._output, self._typed, self._tracker)
+
+        for page_index, page in _indexed_pages(pages):
+            yield page_index, page_parser.parse(page)
+
+# Private-------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _collect(pending, ordered):
+        """
+        Wait for (at least) one of the pending pages and return its result(s)
+
+        :param collections.deque pending: pending (page index, future) tuples
+
+        :return: list of (page index, result) tuples
+        """
+        if ordered:
+            page_index, future = pending.popleft()
+            return [(page_index, future.result())]
+
+        concurrent.futures.wait([future for _, future in pending],
+                                return_when=concurrent.futures.FIRST_COMPLETED)
+
+        results = []
+        still_pending = collections.deque()
+
+        for page_index, future in pending:
+            if future.done():
+                results.append((page_index, future.result()))
+            else:
+                still_pending.append((page_index, future))
+
+        pending.clear()
+        pending.extend(still_pending)
+
+        return results
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+class _PageParser(object):
+    """
+    Decodes and parses one page of artifacts
+    """
+
+    def __init__(self, output, typed, tracker):
+        self.output = output
+        self.typed = typed
+        self.schema = None
+
+        if (tracker is not None) and (output == ParseOutput.CompactArtifacts):
+            self.schema = TrackerSchemaParser(tracker, typed=typed)
+
+    def parse(self, page):
+        if isinstance(page, (bytes, bytearray)):
+            page = page.decode("utf-8")
+
+        items = json.loads(page)
+
+        if self.output == ParseOutput.ArtifactTable:
+            return parse_artifact_page(items, self.typed)
+
+        if self.schema is not None:
+            return [self.schema.parse(item) for item in items]
+
+        return [CompactArtifact(item, self.typed) for item in items]
+
+
+# Page parser of the worker process (set up once per worker by the pool initializer)
+_WORKER_PAGE_PARSER = None
+
+
+def _initialize_worker(output, typed, tracker):
+    global _WORKER_PAGE_PARSER
+    _WORKER_PAGE_PARSER = _PageParser(output, typed, tracker)
+
+
+def _parse_page(page):
+    return _WORKER_PAGE_PARSER.parse(page)
+
+
+def _indexed_pages(pages):
+    """
+    Attach the page index to every page
+
+    :return: generator of (page index, page body) tuples
+    """
+    for position, page in enumerate(pages):
+        if isinstance(page, tuple):
+            yield page
+        else:
+            yield position, page
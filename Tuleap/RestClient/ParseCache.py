@@ -0,0 +1,279 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import collections
+import pickle
+import sqlite3
+import threading
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class ParseCache(object):
+    """
+    Cache of parsed artifacts.
+
+    An artifact only has to be parsed again when it was modified, so the parsed artifacts are
+    cached by the artifact ID and the version of the artifact (by default the "last_modified_date"
+    of the artifact). Artifacts without a version are always parsed and never cached.
+
+    The most recently used artifacts are kept in memory (up to "max_entries" of them, only the
+    latest version of each artifact). Optionally
+    all parsed artifacts are also stored (pickled) in an SQLite database, so they survive the
+    eviction from memory and can be shared between runs.
+
+    The cache can be used from several threads at the same time.
+
+    Fields type information:
+    :type _parserFactory: function
+    :type _versionKey: str
+    :type _maxEntries: int
+    :type _entries: collections.OrderedDict[int, (str, object)]
+    :type _lock: threading.Lock
+    :type _database: sqlite3.Connection
+    :type _hits: int
+    :type _diskHits: int
+    :type _misses: int
+    :type _uncached: int
+    :type _evictions: int
+    """
+
+    def __init__(self,
+                 max_entries=1024,
+                 path=None,
+                 parser_factory=ArtifactParser,
+                 version_key="last_modified_date"):
+        """
+        Constructor
+
+        :param int max_entries: Maximum number of parsed artifacts kept in memory
+        :param str path: Optional parameter for the path to the SQLite database file of the on-disk
+                         cache (no on-disk cache if not set)
+        :param parser_factory: Function (or class) that parses the artifact item (e.g.
+                               ArtifactParser, CompactArtifact or "lambda item:
+                               ArtifactParser(item, lazy=True)"), the result has to be picklable
+                               for the on-disk cache
+        :param str version_key: Key of the artifact item that holds its version (e.g.
+                                "last_modified_date")
+        """
+        if max_entries < 1:
+            raise ValueError("Error: max_entries must be at least 1")
+
+        self._parserFactory = parser_factory
+        self._versionKey = version_key
+        self._maxEntries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._database = None
+        self._hits = 0
+        self._diskHits = 0
+        self._misses = 0
+        self._uncached = 0
+        self._evictions = 0
+
+        if path is not None:
+            self._database = sqlite3.connect(path, check_same_thread=False)
+
+            with self._database:
+                self._database.execute("CREATE TABLE IF NOT EXISTS parsed_artifacts ("
+                                       "artifact_id INTEGER NOT NULL, "
+                                       "version TEXT NOT NULL, "
+                                       "data BLOB NOT NULL, "
+                                       "PRIMARY KEY (artifact_id, version))")
+
+    def close(self):
+        """
+        Close the on-disk cache
+        """
+        with self._lock:
+            if self._database is not None:
+                self._database.close()
+                self._database = None
+
+    def parse(self, item, version=None):
+        """
+        Get the parsed artifact from the cache or parse it (and add it to the cache).
+
+        :param dict item: artifact (as received from the server)
+        :param version: Optional parameter for the version of the artifact (e.g. the ID of its last
+                        changeset), by default the value of the version key of the artifact item
+
+        :return: parsed artifact
+        """
+        artifact_id = item.get("id")
+
+        if version is None:
+            version = item.get(self._versionKey)
+
+        if (artifact_id is None) or (version is None):
+            with self._lock:
+                self._uncached += 1
+
+            return self._parserFactory(item)
+
+        key = (artifact_id, str(version))
+
+        with self._lock:
+            entry = self._entries.get(artifact_id)
+
+            if (entry is not None) and (entry[0] == key[1]):
+                self._entries.move_to_end(artifact_id)
+                self._hits += 1
+                return entry[1]
+
+            parsed = self._load(key)
+
+            if parsed is not None:
+                self._diskHits += 1
+                self._insert(key, parsed)
+                return parsed
+
+            self._misses += 1
+
+        # Parse outside of the lock, so that other threads can use the cache in the meantime
+        parsed = self._parserFactory(item)
+
+        with self._lock:
+            self._insert(key, parsed)
+            self._store(key, parsed)
+
+        return parsed
+
+    def parse_all(self, items):
+        """
+        Parse all artifacts (see "parse")
+
+        :param items: artifacts (e.g. a page of artifacts)
+        :type items: collections.Iterable[dict]
+
+        :return: parsed artifacts
+        :rtype: list
+        """
+        return [self.parse(item) for item in items]
+
+    def invalidate(self, artifact_id):
+        """
+        Remove all cached versions of the artifact
+
+        :param int artifact_id: Artifact ID
+        """
+        with self._lock:
+            self._entries.pop(artifact_id, None)
+
+            if self._database is not None:
+                with self._database:
+                    self._database.execute("DELETE FROM parsed_artifacts WHERE artifact_id = ?",
+                                           (artifact_id,))
+
+    def clear(self):
+        """
+        Remove all cached artifacts (also from the on-disk cache) and reset the metrics
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._diskHits = 0
+            self._misses = 0
+            self._uncached = 0
+            self._evictions = 0
+
+            if self._database is not None:
+                with self._database:
+                    self._database.execute("DELETE FROM parsed_artifacts")
+
+    def get_size(self):
+        """
+        :return: Number of parsed artifacts kept in memory
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def get_metrics(self):
+        """
+        Get the cache metrics
+
+        :return: dictionary with the number of memory hits ("hits"), on-disk hits ("disk_hits"),
+                 misses ("misses"), artifacts without a version ("uncached"), evictions from
+                 memory ("evictions") and the ratio of hits (memory or on-disk) to all requests
+                 ("hit_ratio")
+        :rtype: dict
+        """
+        with self._lock:
+            requests = self._hits + self._diskHits + self._misses + self._uncached
+            hit_ratio = 0.0
+
+            if requests > 0:
+                hit_ratio = float(self._hits + self._diskHits) / requests
+
+            return {"hits": self._hits,
+                    "disk_hits": self._diskHits,
+                    "misses": self._misses,
+                    "uncached": self._uncached,
+                    "evictions": self._evictions,
+                    "hit_ratio": hit_ratio}
+
+# Private-------------------------------------------------------------------------------------------
+
+    def _insert(self, key, parsed):
+        """
+        Insert the parsed artifact into the memory cache and evict the least recently used
+        artifacts if needed (the lock has to be held).
+        """
+        self._entries[key[0]] = (key[1], parsed)
+        self._entries.move_to_end(key[0])
+
+        while len(self._entries) > self._maxEntries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _load(self, key):
+        """
+        Load the parsed artifact from the on-disk cache (the lock has to be held).
+
+        :return: parsed artifact or None
+        """
+        if self._database is None:
+            return None
+
+        row = self._database.execute("SELECT data FROM parsed_artifacts "
+                                     "WHERE artifact_id = ? AND version = ?", key).fetchone()
+
+        if row is None:
+            return None
+
+        return pickle.loads(row[0])
+
+    def _store(self, key, parsed):
+        """
+        Store the parsed artifact in the on-disk cache (the lock has to be held). The older
+        versions of the artifact are removed.
+        """
+        if self._database is None:
+            return
+
+        with self._database:
+            self._database.execute("DELETE FROM parsed_artifacts WHERE artifact_id = ?", (key[0],))
+            self._database.execute("INSERT INTO parsed_artifacts (artifact_id, version, data) "
+                                   "VALUES (?, ?, ?)",
+                                   (key[0], key[1], pickle.dumps(parsed,
+                                                                 pickle.HIGHEST_PROTOCOL)))
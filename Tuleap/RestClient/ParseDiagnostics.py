@@ -0,0 +1,149 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import collections
+import threading
+from enum import IntEnum
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class ParseProblem(IntEnum):
+    """
+    Problems found while parsing artifacts
+    """
+    MalformedItem = 0           # item is not a dictionary
+    MissingType = 1             # value item without a type
+    MissingFieldId = 2          # value item without a field ID
+    MissingLabel = 3            # value item without a label
+    MissingValue = 4            # value item without the value key of its type
+    MalformedValue = 5          # value could not be converted
+    UnknownType = 6             # value item of an unknown type
+    MalformedLink = 7           # artifact link without an artifact ID
+    MalformedReference = 8      # cross-reference without a reference or a direction
+
+
+class ParseDiagnostics(object):
+    """
+    Summary of the problems found while parsing artifacts.
+
+    Instead of raising an exception (or logging a message) for every malformed item, the parsers
+    count the problems by their kind and value type. One object is typically passed to all parsers
+    of a run (e.g. an export) and inspected at the end. The object can be shared between threads.
+
+    Fields type information:
+    :type _counts: collections.Counter[(ParseProblem, str), int]
+    :type _fieldIds: dict[(ParseProblem, str), set[int]]
+    :type _lock: threading.Lock
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self._counts = collections.Counter()
+        self._fieldIds = dict()
+        self._lock = threading.Lock()
+
+    def record(self, problem, value_type=None, field_id=None):
+        """
+        Record a problem
+
+        :param ParseProblem problem: kind of the problem
+        :param str value_type: Optional parameter for the type of the value item
+        :param int field_id: Optional parameter for the field ID of the value item
+        """
+        key = (problem, value_type)
+
+        with self._lock:
+            self._counts[key] += 1
+
+            if field_id is not None:
+                self._fieldIds.setdefault(key, set()).add(field_id)
+
+    def merge(self, other):
+        """
+        Add the problems recorded by other diagnostics (e.g. from another process)
+
+        :param ParseDiagnostics other: diagnostics
+        """
+        with self._lock:
+            self._counts.update(other._counts)
+
+            for key, field_ids in other._fieldIds.items():
+                self._fieldIds.setdefault(key, set()).update(field_ids)
+
+    def is_empty(self):
+        """
+        :return: True if no problem was recorded
+        :rtype: bool
+        """
+        return len(self._counts) == 0
+
+    def get_count(self, problem=None):
+        """
+        Get the number of recorded problems
+
+        :param ParseProblem problem: Optional parameter for the kind of the problems to count (all
+                                     problems are counted if not set)
+
+        :return: number of problems
+        :rtype: int
+        """
+        with self._lock:
+            return sum(count for (recorded_problem, _), count in self._counts.items()
+                       if (problem is None) or (recorded_problem == problem))
+
+    def get_summary(self):
+        """
+        Get the summary of all recorded problems
+
+        :return: list of (problem, value type, count, sorted field IDs) tuples, most frequent
+                 problems first
+        :rtype: list[(ParseProblem, str, int, list[int])]
+        """
+        with self._lock:
+            return [(problem, value_type, count, sorted(self._fieldIds.get((problem, value_type),
+                                                                           ())))
+                    for (problem, value_type), count in self._counts.most_common()]
+
+    def __getstate__(self):
+        return self._counts, self._fieldIds
+
+    def __setstate__(self, state):
+        self._counts, self._fieldIds = state
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        lines = []
+
+        for problem, value_type, count, field_ids in self.get_summary():
+            line = "{:}: {:}".format(problem.name, count)
+
+            if value_type is not None:
+                line += " (type: {:})".format(value_type)
+
+            if field_ids:
+                line += " (fields: {:})".format(", ".join(str(field_id) for field_id in field_ids))
+
+            lines.append(line)
+
+        return "\n".join(lines)
@@ -0,0 +1,465 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import collections
+import concurrent.futures
+import csv
+import itertools
+import json
+import queue
+import threading
+from enum import IntEnum
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.Filter import FilterQuery
+from Tuleap.RestClient.Pagination import iterate_items
+
+# Public -------------------------------------------------------------------------------------------
+
+
+DEFAULT_BUFFER_SIZE = 64
+
+
+class Parallelism(IntEnum):
+    """
+    Parallelism of a pipeline stage
+    """
+    Threads = 0     # for stages that wait (e.g. on the network)
+    Processes = 1   # for CPU bound stages (the functions and items must be picklable)
+
+
+class Pipeline(object):
+    """
+    Lazy pipeline of stages over a stream of items.
+
+    Every stage is a generator that consumes the items of the previous stage, so the items flow
+    through the pipeline one by one and nothing is materialized: even very large exports run in
+    constant memory. The pipeline is executed when it is iterated or written to a sink.
+
+    Stages can be executed by several worker threads or processes. Only a bounded number of items
+    ("buffer_size") is in flight in a parallel stage, so a slow stage slows down the stages
+    before it instead of accumulating items. The order of the items is kept.
+
+    Example:
+        count = Pipeline.from_request(tracker.request_artifact_list,
+                                      tracker_id=20,
+                                      field_values=FieldValues.All,
+                                      limit=100) \\
+            .parse(workers=4, parallelism=Parallelism.Processes) \\
+            .map(artifact_to_dict) \\
+            .filter(query) \\
+            .project(["name", "Status", "Summary"]) \\
+            .to_csv("stories.csv")
+
+    Fields type information:
+    :type _items: collections.Iterable
+    """
+
+    def __init__(self, items):
+        """
+        Constructor
+
+        :param items: source of the pipeline (any iterable, e.g. a generator)
+        :type items: collections.Iterable
+        """
+        self._items = items
+
+    @staticmethod
+    def from_request(request_method, *args, **kwargs):
+        """
+        Create a pipeline over all items of a paginated list method (see "Pagination.iterate_items")
+
+        :param request_method: bound request method (e.g. tracker.request_artifact_list)
+        :param args: positional parameters passed to the request method
+        :param kwargs: keyword parameters passed to the request method (including "limit")
+
+        :rtype: Pipeline
+        """
+        return Pipeline(iterate_items(request_method, *args, **kwargs))
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def map(self,
+            function,
+            workers=0,
+            parallelism=Parallelism.Threads,
+            buffer_size=DEFAULT_BUFFER_SIZE,
+            chunk_size=1):
+        """
+        Add a stage that converts every item
+
+        :param function: conversion function (must be picklable for Parallelism.Processes, i.e. a
+                         module level function or an object of a module level class)
+        :param int workers: number of worker threads or processes (0: executed in the thread that
+                            iterates the pipeline)
+        :param Parallelism parallelism: worker threads or processes
+        :param int buffer_size: maximum number of chunks in flight in the stage
+        :param int chunk_size: number of items sent to a worker at once (larger chunks reduce the
+                               overhead of Parallelism.Processes)
+
+        :rtype: Pipeline
+        """
+        if workers <= 0:
+            return Pipeline(map(function, self._items))
+
+        return Pipeline(_parallel_map(_MapChunk(function),
+                                      self._items,
+                                      workers,
+                                      parallelism,
+                                      buffer_size,
+                                      chunk_size))
+
+    def parse(self,
+              parser=ArtifactParser,
+              workers=0,
+              parallelism=Parallelism.Threads,
+              buffer_size=DEFAULT_BUFFER_SIZE,
+              chunk_size=1):
+        """
+        Add a stage that parses the artifacts (see "map")
+
+        :param parser: parser class or function (e.g. ArtifactParser, CompactArtifact or a
+                       TrackerSchemaParser object's "parse" method)
+
+        :rtype: Pipeline
+        """
+        return self.map(parser, workers, parallelism, buffer_size, chunk_size)
+
+    def filter(self,
+               query,
+               workers=0,
+               parallelism=Parallelism.Threads,
+               buffer_size=DEFAULT_BUFFER_SIZE,
+               chunk_size=1):
+        """
+        Add a stage that drops the items that do not match
+
+        :param query: filter query (compiled once per worker, see "FilterQuery.compile") or a
+                      predicate function
+        :type query: FilterQuery | function
+
+        :rtype: Pipeline
+        """
+        predicate = _Predicate(query)
+
+        if workers <= 0:
+            return Pipeline(item for item in self._items if predicate(item))
+
+        return Pipeline(itertools.chain.from_iterable(
+            _parallel_map(_FilterChunk(predicate),
+                          self._items,
+                          workers,
+                          parallelism,
+                          buffer_size,
+                          chunk_size,
+                          flatten=False)))
+
+    def project(self, fields):
+        """
+        Add a stage that keeps only the selected keys of the (dictionary) items
+
+        :param fields: keys to keep, or a dictionary of output key: input key
+        :type fields: list[str] | dict[str, str]
+
+        :rtype: Pipeline
+        """
+        if isinstance(fields, dict):
+            mapping = list(fields.items())
+        else:
+            mapping = [(field, field) for field in fields]
+
+        return Pipeline(dict((output_key, item.get(input_key)) for output_key, input_key in mapping)
+                        for item in self._items)
+
+    def prefetch(self, buffer_size=DEFAULT_BUFFER_SIZE):
+        """
+        Add a stage that executes the previous stages in a background thread (e.g. to request the
+        next pages while the current page is processed). At most "buffer_size" items are buffered.
+
+        :rtype: Pipeline
+        """
+        return Pipeline(_prefetch(self._items, buffer_size))
+
+    def to_list(self):
+        """
+        Execute the pipeline and collect all items
+
+        :rtype: list
+        """
+        return list(self._items)
+
+    def to_jsonl(self, path):
+        """
+        Execute the pipeline and write every item as a JSON line
+
+        :param str path: path of the output file
+
+        :return: Number of written items
+        :rtype: int
+        """
+        count = 0
+
+        with open(path, "w") as output_file:
+            for item in self._items:
+                output_file.write(json.dumps(item, default=str))
+                output_file.write("\n")
+                count += 1
+
+        return count
+
+    def to_csv(self, path, fields=None):
+        """
+        Execute the pipeline and write the (dictionary) items as CSV rows
+
+        :param str path: path of the output file
+        :param list[str] fields: Optional parameter for the columns (by default the keys of the
+                                 first item)
+
+        :return: Number of written items
+        :rtype: int
+        """
+        count = 0
+        items = iter(self._items)
+
+        with open(path, "w", newline="") as output_file:
+            writer = None
+
+            for item in items:
+                if writer is None:
+                    writer = csv.DictWriter(output_file,
+                                            fieldnames=fields if fields is not None
+                                            else list(item.keys()),
+                                            extrasaction="ignore")
+                    writer.writeheader()
+
+                writer.writerow(dict((key, _csv_value(value)) for key, value in item.items()))
+                count += 1
+
+            if (writer is None) and (fields is not None):
+                csv.DictWriter(output_file, fieldnames=fields).writeheader()
+
+        return count
+
+    def to_artifact_store(self, store, batch_size=500):
+        """
+        Execute the pipeline and store the (raw) artifacts in an SQLite artifact store, one
+        transaction per batch
+
+        :param store: artifact store
+        :type store: Tuleap.RestClient.ArtifactStore.ArtifactStore
+        :param int batch_size: number of artifacts per transaction
+
+        :return: Number of stored artifacts
+        :rtype: int
+        """
+        count = 0
+        items = iter(self._items)
+
+        while True:
+            batch = list(itertools.islice(items, batch_size))
+
+            if not batch:
+                break
+
+            count += store.upsert_artifacts(batch)
+
+        return count
+
+
+def artifact_to_dict(artifact):
+    """
+    Convert a parsed artifact to a flat dictionary: "name", "project_id", "tracker_id", "links",
+    "reverse_links" and the value of every field by its label
+
+    :param artifact: parsed artifact
+    :type artifact: ArtifactParser | Tuleap.RestClient.CompactArtifact.CompactArtifact
+
+    :rtype: dict
+    """
+    result = {"name": artifact.get_name(),
+              "project_id": artifact.get_project_id(),
+              "tracker_id": artifact.get_tracker_id(),
+              "links": list(artifact.get_links()),
+              "reverse_links": list(artifact.get_reverse_links())}
+
+    for value in artifact.get_values():
+        result[value["label"]] = value["value"]
+
+    return result
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+# End of the items in a prefetch queue
+_END = object()
+
+
+class _Predicate(object):
+    """
+    Picklable predicate of a filter stage (the filter query is compiled on first use)
+    """
+
+    def __init__(self, query):
+        self.query = query
+        self.compiled = None
+
+    def __getstate__(self):
+        return self.query
+
+    def __setstate__(self, state):
+        self.query = state
+        self.compiled = None
+
+    def __call__(self, item):
+        if self.compiled is None:
+            if isinstance(self.query, FilterQuery):
+                self.compiled = self.query.compile()
+            else:
+                self.compiled = self.query
+
+        return self.compiled(item)
+
+
+class _MapChunk(object):
+    """
+    Converts a chunk of items (picklable if the function is)
+    """
+
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, chunk):
+        return [self.function(item) for item in chunk]
+
+
+class _FilterChunk(object):
+    """
+    Filters a chunk of items (picklable if the predicate is)
+    """
+
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+    def __call__(self, chunk):
+        return [item for item in chunk if self.predicate(item)]
+
+
+def _parallel_map(chunk_function, items, workers, parallelism, buffer_size, chunk_size,
+                  flatten=True):
+    """
+    Apply the chunk function to chunks of the items in worker threads or processes, keeping the
+    order of the items and at most "buffer_size" chunks in flight
+
+    :return: generator of the converted items (or of the converted chunks if not flatten)
+    """
+    if parallelism == Parallelism.Processes:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+    pending = collections.deque()
+    items = iter(items)
+
+    try:
+        while True:
+            chunk = list(itertools.islice(items, max(chunk_size, 1)))
+
+            if chunk:
+                pending.append(executor.submit(chunk_function, chunk))
+
+            if pending and ((not chunk) or (len(pending) >= max(buffer_size, 1))):
+                result = pending.popleft().result()
+
+                if flatten:
+                    for item in result:
+                        yield item
+                else:
+                    yield result
+
+            if (not chunk) and (not pending):
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=True)
+
+
+def _prefetch(items, buffer_size):
+    """
+    Iterate the items in a background thread, buffering at most "buffer_size" items
+    """
+    buffer = queue.Queue(maxsize=max(buffer_size, 1))
+    stopped = threading.Event()
+    errors = []
+
+    def produce():
+        try:
+            for item in items:
+                while not stopped.is_set():
+                    try:
+                        buffer.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+
+                if stopped.is_set():
+                    return
+        except Exception as error:
+            errors.append(error)
+        finally:
+            while not stopped.is_set():
+                try:
+                    buffer.put(_END, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    producer = threading.Thread(target=produce)
+    producer.daemon = True
+    producer.start()
+
+    try:
+        while True:
+            item = buffer.get()
+
+            if item is _END:
+                break
+
+            yield item
+
+        if errors:
+            raise errors[0]
+    finally:
+        stopped.set()
+        producer.join()
+
+
+def _csv_value(value):
+    """
+    Convert a value for a CSV cell (lists are joined)
+    """
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(element) for element in value)
+
+    return value
@@ -0,0 +1,574 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+
+import collections
+import csv
+import datetime
+import glob
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+
+from Tuleap.RestClient.Commons import FieldValues, Order
+from Tuleap.RestClient.Trackers import Tracker
+from Tuleap.RestClient.TrackerSchemaParser import TrackerSchemaParser
+
+# Public -------------------------------------------------------------------------------------------
+
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+
+class ExportFormat(IntEnum):
+    """
+    Output format of a tracker export
+    """
+    Csv = 0         # one CSV file with a header row
+    JsonLines = 1   # one JSON object per line
+    Parquet = 2     # directory with one Parquet file per row group (requires pyarrow)
+
+
+class ExportProgress(collections.namedtuple("ExportProgress",
+                                            ["rows", "pages", "offset", "total", "seconds",
+                                             "rows_per_second"])):
+    """
+    Progress of a tracker export: rows and pages written in total (including the rows written
+    before a resumed export), offset of the next artifact, number of artifacts in the tracker (None
+    if unknown), duration of the current run and rows per second in the current run
+    """
+
+    __slots__ = ()
+
+
+class TrackerExporter(object):
+    """
+    Export all artifacts of a tracker to a file in constant memory.
+
+    The artifact pages are requested in parallel (each worker thread has its own copy of the
+    connection) and written in the order of the artifacts. The field values are converted with a
+    TrackerSchemaParser compiled from the tracker structure, so every field becomes a column with a
+    fixed type. The first column ("artifact_id") contains the artifact IDs and the other columns are
+    named after the field labels ("label (field_id)" if several fields have the same label).
+
+    The rows are written in row groups: after every "row_group_size" rows the output is flushed and
+    a state file is updated with the offset of the next artifact. If an export fails, running it
+    again with the same parameters resumes from the last completed row group (the partially
+    written rows are discarded). The state file is deleted when the export is complete.
+
+    Example:
+        exporter = TrackerExporter(connection, 20, "stories.parquet", ExportFormat.Parquet)
+        progress = exporter.export(progress=lambda p: print("{:.0f} rows/s".format(
+            p.rows_per_second)))
+
+    Fields type information:
+    :type _connection: Tuleap.RestClient.Connection.Connection
+    :type _trackerId: int
+    :type _path: str
+    :type _format: ExportFormat
+    :type _typed: bool
+    :type _pageSize: int
+    :type _parallelRequests: int
+    :type _rowGroupSize: int
+    :type _fieldIds: list[int]
+    :type _skippedTypes: list[str]
+    :type _expertQuery: str
+    :type _statePath: str
+    :type _tracker: dict
+    :type _threadData: threading.local
+    """
+
+    def __init__(self,
+                 connection,
+                 tracker_id,
+                 path,
+                 export_format=ExportFormat.Csv,
+                 typed=True,
+                 page_size=DEFAULT_PAGE_SIZE,
+                 parallel_requests=4,
+                 row_group_size=DEFAULT_ROW_GROUP_SIZE,
+                 field_ids=None,
+                 skipped_types=None,
+                 expert_query=None,
+                 state_path=None,
+                 tracker=None):
+        """
+        Constructor
+
+        :param connection: connection object (must already be logged in)
+        :type connection: Tuleap.RestClient.Connection.Connection
+        :param int tracker_id: Tracker ID
+        :param str path: path of the output file (directory for ExportFormat.Parquet)
+        :param ExportFormat export_format: Output format
+        :param bool typed: Export native values (numbers, dates, ID lists) instead of strings
+        :param int page_size: number of artifacts per request
+        :param int parallel_requests: number of pages that are requested at the same time
+        :param int row_group_size: number of rows written between two checkpoints
+        :param field_ids: Optional parameter for the IDs of the exported fields (all fields if
+                          not set)
+        :type field_ids: collections.Iterable[int]
+        :param skipped_types: Optional parameter for the field types that are not exported (e.g.
+                              ["text", "file"])
+        :type skipped_types: collections.Iterable[str]
+        :param str expert_query: Optional parameter for the search criteria, expert format
+        :param str state_path: Optional parameter for the path of the state file (output path
+                               with the ".state.json" suffix if not set)
+        :param dict tracker: Optional parameter for the tracker structure (as received with
+                             "Tracker.request_tracker", requested from the server if not set)
+        """
+        self._connection = connection
+        self._trackerId = tracker_id
+        self._path = path
+        self._format = export_format
+        self._typed = typed
+        self._pageSize = page_size
+        self._parallelRequests = max(parallel_requests, 1)
+        self._rowGroupSize = max(row_group_size, 1)
+        self._fieldIds = list(field_ids) if field_ids is not None else None
+        self._skippedTypes = list(skipped_types) if skipped_types is not None else None
+        self._expertQuery = expert_query
+        self._statePath = state_path if state_path is not None else path + ".state.json"
+        self._tracker = tracker
+        self._threadData = threading.local()
+
+    def get_state_path(self):
+        """
+        :return: path of the state file
+        :rtype: str
+        """
+        return self._statePath
+
+    def export(self, progress=None, resume=True):
+        """
+        Export the artifacts
+
+        :param progress: Optional parameter for a function that is called with an ExportProgress
+                         after every row group
+        :param bool resume: Resume an interrupted export (if a matching state file exists),
+                            otherwise the export starts from the beginning
+
+        :return: progress at the end of the export
+        :rtype: ExportProgress
+        """
+        schema, columns = self._load_schema()
+        column_names = [column[0] for column in columns]
+        state = self._load_state(column_names) if resume else None
+
+        if state is None:
+            state = {"tracker_id": self._trackerId,
+                     "format": int(self._format),
+                     "columns": column_names,
+                     "offset": 0,
+                     "rows": 0,
+                     "pages": 0,
+                     "position": None}
+
+        writer = _create_writer(self._format, self._path, columns, state["position"])
+        start_time = time.time()
+        start_rows = state["rows"]
+        rows_in_group = 0
+        total = None
+
+        try:
+            for offset, items, total in self._iterate_pages(state["offset"]):
+                writer.write_rows([_artifact_row(schema, columns, item) for item in items])
+                rows_in_group += len(items)
+                state["offset"] = offset + len(items)
+                state["rows"] += len(items)
+                state["pages"] += 1
+
+                if rows_in_group >= self._rowGroupSize:
+                    self._checkpoint(writer, state)
+                    rows_in_group = 0
+
+                    if progress is not None:
+                        progress(_progress(state, total, start_time, start_rows))
+
+            writer.flush()
+        finally:
+            writer.close()
+
+        if os.path.exists(self._statePath):
+            os.remove(self._statePath)
+
+        result = _progress(state, total, start_time, start_rows)
+
+        if progress is not None:
+            progress(result)
+
+        return result
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _load_schema(self):
+        """
+        Compile the tracker schema and select the columns
+
+        :return: (schema, list of (column name, field ID, value type) tuples)
+        :rtype: (TrackerSchemaParser, list[(str, int, str)])
+        """
+        tracker = self._tracker
+
+        if tracker is None:
+            tracker_api = Tracker(self._connection)
+
+            if not tracker_api.request_tracker(self._trackerId):
+                raise Exception("Error: tracker {:} could not be requested".format(self._trackerId))
+
+            tracker = tracker_api.get_data()
+
+        schema = TrackerSchemaParser(tracker, self._fieldIds, self._skippedTypes, self._typed)
+        field_ids = schema.get_field_ids()
+        label_count = collections.Counter(schema.get_field_label(field_id) for field_id in field_ids)
+        columns = [("artifact_id", None, "INTEGER")]
+
+        for field_id in field_ids:
+            label = schema.get_field_label(field_id)
+
+            if label_count[label] > 1:
+                label = "{:} ({:})".format(label, field_id)
+
+            columns.append((label, field_id, schema.get_field_type(field_id) if self._typed
+                            else "TEXT"))
+
+        return schema, columns
+
+    def _load_state(self, column_names):
+        """
+        Load the state of an interrupted export with the same parameters
+
+        :return: state or None if there is no matching state
+        :rtype: dict
+        """
+        if not os.path.exists(self._statePath):
+            return None
+
+        with open(self._statePath, "r") as state_file:
+            state = json.load(state_file)
+
+        if (state.get("tracker_id") != self._trackerId) or \
+                (state.get("format") != int(self._format)) or \
+                (state.get("columns") != column_names):
+            return None
+
+        return state
+
+    def _checkpoint(self, writer, state):
+        """
+        Flush the written rows and save the state (atomically)
+        """
+        state["position"] = writer.flush()
+        temporary_path = self._statePath + ".tmp"
+
+        with open(temporary_path, "w") as state_file:
+            json.dump(state, state_file)
+
+        os.replace(temporary_path, self._statePath)
+
+    def _iterate_pages(self, offset):
+        """
+        Request the pages starting at the offset, several pages at the same time
+
+        :return: generator of (offset, page, total number of artifacts) tuples, in offset order
+        """
+        items, total = self._request_page(offset, self._pageSize)
+
+        if not items:
+            return
+
+        yield offset, items, total
+
+        limit = self._pageSize
+
+        # The server limits the page size, so the size of the first page is the real page size
+        if (total is not None) and (len(items) < limit) and (offset + len(items) < total):
+            limit = len(items)
+
+        offset += len(items)
+
+        if total is None:
+            while True:
+                items, _ = self._request_page(offset, limit)
+
+                if not items:
+                    break
+
+                yield offset, items, None
+
+                offset += len(items)
+
+            return
+
+        with ThreadPoolExecutor(max_workers=self._parallelRequests) as executor:
+            pending = collections.deque()
+            offsets = iter(range(offset, total, limit))
+
+            while True:
+                for next_offset in offsets:
+                    pending.append((next_offset,
+                                    executor.submit(self._request_page, next_offset, limit)))
+
+                    if len(pending) >= 2 * self._parallelRequests:
+                        break
+
+                if not pending:
+                    break
+
+                page_offset, future = pending.popleft()
+                items, _ = future.result()
+
+                if not items:
+                    break
+
+                if (len(items) < limit) and (page_offset + len(items) < total):
+                    raise Exception("Error: incomplete page at offset {:}".format(page_offset))
+
+                yield page_offset, items, total
+
+    def _request_page(self, offset, limit):
+        """
+        Request a page of artifacts (with the tracker object of the current thread)
+
+        :return: (artifacts, total number of artifacts or None if unknown)
+        :rtype: (list[dict], int)
+        """
+        tracker = getattr(self._threadData, "tracker", None)
+
+        if tracker is None:
+            tracker = Tracker(self._connection.clone())
+            self._threadData.tracker = tracker
+
+        if not tracker.request_artifact_list(self._trackerId,
+                                             field_values=FieldValues.All,
+                                             limit=limit,
+                                             offset=offset,
+                                             expert_query=self._expertQuery,
+                                             order=Order.Ascending):
+            raise Exception("Error: page request failed at offset {:}".format(offset))
+
+        return tracker.get_data(), tracker.get_count()
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+class _TextWriter(object):
+    """
+    Writer of a text file (the position is the size of the file)
+    """
+
+    def __init__(self, path, position):
+        if position is None:
+            self._file = open(path, "w", newline="", encoding="utf-8")
+            self._write_header()
+        else:
+            # Discard the rows written after the last checkpoint
+            with open(path, "r+b") as output_file:
+                output_file.truncate(position)
+
+            self._file = open(path, "a", newline="", encoding="utf-8")
+
+    def _write_header(self):
+        pass
+
+    def write_rows(self, rows):
+        raise NotImplementedError()
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+
+class _CsvWriter(_TextWriter):
+    def __init__(self, path, columns, position):
+        self._columnNames = [column[0] for column in columns]
+        self._file = None
+        self._writer = None
+        _TextWriter.__init__(self, path, position)
+        self._writer = csv.writer(self._file)
+
+    def _write_header(self):
+        csv.writer(self._file).writerow(self._columnNames)
+
+    def write_rows(self, rows):
+        self._writer.writerows([_csv_value(value) for value in row] for row in rows)
+
+
+class _JsonLinesWriter(_TextWriter):
+    def __init__(self, path, columns, position):
+        self._columnNames = [column[0] for column in columns]
+        _TextWriter.__init__(self, path, position)
+
+    def write_rows(self, rows):
+        for row in rows:
+            self._file.write(json.dumps(dict(zip(self._columnNames, row)), default=_json_value))
+            self._file.write("\n")
+
+
+class _ParquetWriter(object):
+    """
+    Writer of a directory of Parquet files, one file per row group (the position is the number of
+    files)
+    """
+
+    def __init__(self, path, columns, position):
+        import pyarrow
+
+        self._path = path
+        self._columns = columns
+        self._schema = pyarrow.schema([(name, _arrow_type(pyarrow, value_type))
+                                       for name, _, value_type in columns])
+        self._rows = []
+        self._partCount = position if position is not None else 0
+
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        # Discard the files written after the last checkpoint (or by an earlier export)
+        for part_path in glob.glob(os.path.join(path, "part-*.parquet")):
+            if _part_number(part_path) >= self._partCount:
+                os.remove(part_path)
+
+    def write_rows(self, rows):
+        self._rows.extend(rows)
+
+    def flush(self):
+        import pyarrow
+        import pyarrow.parquet
+
+        if self._rows:
+            arrays = []
+
+            for index, (_, _, value_type) in enumerate(self._columns):
+                values = [row[index] for row in self._rows]
+
+                if value_type == "DATE":
+                    values = [_utc_date(value) for value in values]
+
+                arrays.append(pyarrow.array(values, type=self._schema.field(index).type))
+
+            part_path = os.path.join(self._path, "part-{:05d}.parquet".format(self._partCount))
+            temporary_path = part_path + ".tmp"
+            pyarrow.parquet.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema),
+                                        temporary_path)
+            os.replace(temporary_path, part_path)
+            self._partCount += 1
+            self._rows = []
+
+        return self._partCount
+
+    def close(self):
+        self._rows = []
+
+
+def _create_writer(export_format, path, columns, position):
+    if export_format == ExportFormat.Csv:
+        return _CsvWriter(path, columns, position)
+
+    if export_format == ExportFormat.JsonLines:
+        return _JsonLinesWriter(path, columns, position)
+
+    if export_format == ExportFormat.Parquet:
+        return _ParquetWriter(path, columns, position)
+
+    raise Exception("Error: invalid export format")
+
+
+def _artifact_row(schema, columns, item):
+    """
+    Convert an artifact to a row (one value per column, None for missing values)
+    """
+    values = schema.extract_values(item)
+
+    return [item.get("id")] + [values.get(field_id) for _, field_id, _ in columns[1:]]
+
+
+def _progress(state, total, start_time, start_rows):
+    seconds = time.time() - start_time
+    rows = state["rows"] - start_rows
+
+    return ExportProgress(state["rows"],
+                          state["pages"],
+                          state["offset"],
+                          total,
+                          seconds,
+                          rows / seconds if seconds > 0 else 0.0)
+
+
+def _csv_value(value):
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(element) for element in value)
+
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+
+    return value
+
+
+def _json_value(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+
+    return str(value)
+
+
+def _arrow_type(pyarrow, value_type):
+    if value_type in ("INTEGER", "ID"):
+        return pyarrow.int64()
+
+    if value_type == "FLOAT":
+        return pyarrow.float64()
+
+    if value_type == "DATE":
+        return pyarrow.timestamp("us", tz="UTC")
+
+    if value_type == "ID_LIST":
+        return pyarrow.list_(pyarrow.int64())
+
+    return pyarrow.string()
+
+
+def _utc_date(value):
+    """
+    Convert a date to UTC (dates without a time zone are taken as UTC)
+    """
+    if value is None:
+        return None
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=datetime.timezone.utc)
+
+    return value.astimezone(datetime.timezone.utc)
+
+
+def _part_number(part_path):
+    try:
+        return int(os.path.basename(part_path)[len("part-"):-len(".parquet")])
+    except ValueError:
+        return -1
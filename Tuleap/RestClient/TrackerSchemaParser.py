@@ -0,0 +1,265 @@
+"""
+Created on 19.10.2026
+
+:author: Djuro Drljaca
+
+Tuleap REST API Client for Python
+Copyright (c) Djuro Drljaca, All rights reserved.
+
+This Python module is free software; you can redistribute it and/or modify it under the terms of the
+GNU Lesser General Public License as published by the Free Software Foundation; either version 3.0
+of the License, or (at your option) any later version.
+
+This Python module is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with this library. If
+not, see <http://www.gnu.org/licenses/>.
+"""
+
+from Tuleap.RestClient.CompactArtifact import CompactArtifact, CompactValue, intern_string
+from Tuleap.RestClient.ParseDiagnostics import ParseProblem
+from Tuleap.RestClient.ValueParser import CONVERSION_ERRORS, VALUE_HANDLERS, get_list
+
+# Public -------------------------------------------------------------------------------------------
+
+
+class TrackerSchemaParser(object):
+    """
+    Artifact parser compiled from the tracker structure.
+
+    All artifacts of a tracker have the same fields, so the value conversion of every field is
+    selected once (from the tracker structure received with "Tracker.request_tracker") instead of
+    for every value of every artifact. Only the selected fields are parsed, the values of all other
+    fields (for example large text or file fields) are skipped without creating any objects.
+
+    The values are converted in the same way as by the ValueParser. Fields of types unknown to the
+    ValueParser are skipped. Malformed value items (items that are not dictionaries, items without
+    the value key of their type or values that can not be converted) are skipped as well and
+    recorded in the diagnostics (if supplied), like the ValueParser does for invalid items.
+
+    Fields type information:
+    :type _trackerId: int
+    :type _typed: bool
+    :type _fields: dict[int, (str, str, function, str)]
+    :type _linkFieldIds: set[int]
+    :type _crossReferenceFieldIds: set[int]
+    :type _diagnostics: Tuleap.RestClient.ParseDiagnostics.ParseDiagnostics
+    """
+
+    def __init__(self, tracker, field_ids=None, skipped_types=None, typed=False, diagnostics=None):
+        """
+        Constructor
+
+        :param dict tracker: tracker structure (as received with "Tracker.request_tracker")
+        :param field_ids: Optional parameter for the IDs of the fields to parse (all fields are
+                          parsed if not set)
+        :type field_ids: collections.Iterable[int]
+        :param skipped_types: Optional parameter for the field types that are never parsed
+                              (e.g. ["text", "file"])
+        :type skipped_types: collections.Iterable[str]
+        :param bool typed: Keep the values as native values instead of converting them to strings
+                           (see ValueParser)
+        :param diagnostics: Optional parameter for the diagnostics where the problems found in the
+                            artifacts are recorded
+        :type diagnostics: Tuleap.RestClient.ParseDiagnostics.ParseDiagnostics
+        """
+        self._trackerId = tracker.get("id", -1)
+        self._typed = typed
+        self._diagnostics = diagnostics
+        self._fields = dict()
+        self._linkFieldIds = set()
+        self._crossReferenceFieldIds = set()
+
+        selected_field_ids = set(field_ids) if field_ids is not None else None
+        skipped_types = set(skipped_types) if skipped_types is not None else set()
+
+        for field in tracker.get("fields") or []:
+            field_id = field.get("field_id")
+            field_type = field.get("type")
+
+            if (field_type in skipped_types) or \
+                    ((selected_field_ids is not None) and (field_id not in selected_field_ids)):
+                continue
+
+            if field_type == "art_link":
+                self._linkFieldIds.add(field_id)
+            elif field_type == "cross":
+                self._crossReferenceFieldIds.add(field_id)
+            elif field_type in VALUE_HANDLERS:
+                value_key, to_string, to_native, string_type, native_type = \
+                    VALUE_HANDLERS[field_type]
+
+                if typed:
+                    self._fields[field_id] = (intern_string(field.get("label", "")),
+                                              value_key,
+                                              to_native,
+                                              native_type)
+                else:
+                    self._fields[field_id] = (intern_string(field.get("label", "")),
+                                              value_key,
+                                              to_string,
+                                              string_type)
+
+    def get_tracker_id(self):
+        """
+        :return: Tracker ID
+        :rtype: int
+        """
+        return self._trackerId
+
+    def is_typed(self):
+        """
+        :return: True if the values are kept as native values
+        :rtype: bool
+        """
+        return self._typed
+
+    def get_field_ids(self):
+        """
+        Get the IDs of the parsed value fields (without link and cross-reference fields)
+
+        :return: Field IDs
+        :rtype: list[int]
+        """
+        return list(self._fields.keys())
+
+    def get_field_label(self, field_id):
+        """
+        :param int field_id: Field ID
+
+        :return: Field label (or None if the field is not parsed)
+        :rtype: str
+        """
+        field = self._fields.get(field_id)
+
+        if field is None:
+            return None
+
+        return field[0]
+
+    def get_field_type(self, field_id):
+        """
+        :param int field_id: Field ID
+
+        :return: Value type (as returned by ValueParser.get_type()) or None if the field is not
+                 parsed
+        :rtype: str
+        """
+        field = self._fields.get(field_id)
+
+        if field is None:
+            return None
+
+        return field[3]
+
+    def extract_values(self, item):
+        """
+        Extract the values of the selected fields from the artifact.
+
+        :param dict item: artifact (with field values)
+
+        :return: dictionary of field_id: value
+        :rtype: dict[int, object]
+        """
+        values = dict()
+        fields = self._fields
+
+        for value_item in get_list(item.get("values"), self._diagnostics):
+            try:
+                field_id = value_item.get("field_id")
+            except AttributeError:
+                self._record(ParseProblem.MalformedItem, None, None)
+                continue
+
+            field = fields.get(field_id)
+
+            if field is not None:
+                value = self._convert_value(field_id, field, value_item)
+
+                if value is not _INVALID:
+                    values[field_id] = value
+
+        return values
+
+    def split_values(self, value_items):
+        """
+        Convert the selected value items and separate them from the link and cross-reference
+        value items.
+
+        :param list[dict] value_items: "values" of the artifact
+
+        :return: (values, link value items, cross-reference value items)
+        :rtype: (tuple[CompactValue], list[dict], list[dict])
+        """
+        values = []
+        link_items = []
+        cross_reference_items = []
+        fields = self._fields
+
+        for value_item in get_list(value_items, self._diagnostics):
+            try:
+                field_id = value_item.get("field_id")
+            except AttributeError:
+                self._record(ParseProblem.MalformedItem, None, None)
+                continue
+
+            field = fields.get(field_id)
+
+            if field is not None:
+                value = self._convert_value(field_id, field, value_item)
+
+                if value is not _INVALID:
+                    values.append(CompactValue(field_id, field[0], value, field[3]))
+            elif field_id in self._linkFieldIds:
+                link_items.append(value_item)
+            elif field_id in self._crossReferenceFieldIds:
+                cross_reference_items.append(value_item)
+
+        return tuple(values), link_items, cross_reference_items
+
+    def parse(self, item):
+        """
+        Parse the artifact
+
+        :param dict item: artifact (with field values)
+
+        :return: parsed artifact
+        :rtype: CompactArtifact
+        """
+        return CompactArtifact(item, self._typed, self)
+
+# Private ------------------------------------------------------------------------------------------
+
+    def _convert_value(self, field_id, field, value_item):
+        """
+        Convert the value of the value item (same error handling as in the ValueParser)
+
+        :return: converted value or _INVALID if the value item is malformed
+        """
+        value_key = field[1]
+
+        if value_key not in value_item:
+            self._record(ParseProblem.MissingValue, value_item.get("type"), field_id)
+            return _INVALID
+
+        try:
+            return field[2](value_item[value_key], value_item)
+        except CONVERSION_ERRORS:
+            self._record(ParseProblem.MalformedValue, value_item.get("type"), field_id)
+            return _INVALID
+
+    def _record(self, problem, value_type, field_id):
+        """
+        Record the problem if diagnostics are used
+        """
+        if self._diagnostics is not None:
+            self._diagnostics.record(problem, value_type, field_id)
+
+
+# Private ------------------------------------------------------------------------------------------
+
+
+# Marker of a value item that could not be converted
+_INVALID = object()
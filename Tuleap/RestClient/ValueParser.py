@@ -18,6 +18,10 @@ You should have received a copy of the GNU Lesser General Public License along w
 not, see <http://www.gnu.org/licenses/>.
 """
 
+from datetime import datetime
+
+from Tuleap.RestClient.ParseDiagnostics import ParseProblem
+
 # Public -------------------------------------------------------------------------------------------
 
 
@@ -30,8 +34,22 @@ class ValueParser(object):
     - the actual string representation of the value item data
     - the data type for the artifact (INTEGER, TEXT)
 
+    In typed mode the values are not converted to strings, but kept as native values instead:
+    - INTEGER: int ("aid", "int")
+    - FLOAT: float ("float")
+    - TEXT: str ("string", "text")
+    - DATE: datetime.datetime ("date", "subon", "lud")
+    - ID: int, a bind value or user ID ("sb", "rb", "subby", "luby")
+    - ID_LIST: list[int], bind value, user or file IDs ("msb", "cb", "tbl", "file")
+    Missing values are represented with None (or an empty list).
+
+    Malformed value items (missing keys, values that can not be converted or items that are not
+    dictionaries) are reported as invalid instead of raising an exception. When diagnostics are
+    supplied the problem is also recorded there.
+
     Fields type information:
     :type __item: dict
+    :type __typed: bool
     :type __label: string
     :type __id: int
     :type __value: string
@@ -40,14 +58,18 @@ class ValueParser(object):
     :type __valid: bool
     """
 
-    def __init__(self, item):
+    def __init__(self, item, typed=False, diagnostics=None):
         """
         Constructor
 
         :param item: the artifact item to ber parsed
         :type item: dict
+        :param bool typed: Keep the values as native values instead of converting them to strings
+        :param diagnostics: Optional parameter for the diagnostics where the problems are recorded
+        :type diagnostics: Tuleap.RestClient.ParseDiagnostics.ParseDiagnostics
         """
         self.__item = item
+        self.__typed = typed
         self.__value = ''
         self.__type = ''
         self.__label = ''
@@ -55,7 +77,7 @@ class ValueParser(object):
         self.__links = False
         self.__cross_refs = False
         self.__valid = False
-        self.__convert_item_to_string()
+        self.__convert_item(diagnostics)
 
     def is_valid(self):
         """
@@ -86,7 +108,7 @@ class ValueParser(object):
 
     def get_value(self):
         """
-        Get the string representation of the supplied item
+        Get the string representation of the supplied item (or the native value in typed mode)
 
         :return: item string representation
         :rtype: string
@@ -122,471 +144,349 @@ class ValueParser(object):
 
 # Private -------------------------------------------------------------------------------------------
 
-    def __get_aid_item_value(self):
+    def __convert_item(self, diagnostics):
         """
-        Extract the artifact ID. This is an int and needs to be converted to string.
+        Convert the given value item to its string representation (or native value).
+        The exact conversion method is selected from the value handler table by the type of the
+        item.
         """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+        item = self.__item
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
-
-        if "value" in self.__item:
-            self.__value = str(self.__item["value"])
-            if self.__value is None:
-                self.__value = -1
-        else:
+        try:
+            value_type = item.get("type", _MISSING)
+            handler = VALUE_HANDLERS.get(value_type)
+        except (AttributeError, TypeError):
+            _record(diagnostics, ParseProblem.MalformedItem, None, None)
             return
 
-        self.__type = 'INTEGER'
+        if handler is not None:
+            value_key, to_string, to_native, string_type, native_type = handler
 
-        self.__valid = True
+            # All handled value items have the same structure: field ID, label and the value
+            # stored under a type specific key
+            field_id = item.get("field_id", _MISSING)
+            label = item.get("label", _MISSING)
+            value = item.get(value_key, _MISSING)
 
-    def __get_int_item_value(self):
-        """
-        Extract the value of an integer element. This will be converted to a string.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+            if (field_id is _MISSING) or (label is _MISSING) or (value is _MISSING):
+                self.__id = field_id if field_id is not _MISSING else -1
+                self.__label = label if label is not _MISSING else ''
+                _record_missing_key(diagnostics, value_type, field_id, label)
+                return
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+            self.__id = field_id
+            self.__label = label
 
-        if "value" in self.__item:
-            self.__value = str(self.__item["value"])
-            if self.__value is None:
+            try:
+                if self.__typed:
+                    self.__value = to_native(value, item)
+                    self.__type = native_type
+                else:
+                    self.__value = to_string(value, item)
+                    self.__type = string_type
+            except CONVERSION_ERRORS:
                 self.__value = ''
-        else:
-            return
-
-        self.__type = 'TEXT'
-
-        self.__valid = True
-
-    def __get_float_item_value(self):
-        """
-        Extract the value of a float element. This will be converted to a string.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+                self.__type = ''
+                _record(diagnostics, ParseProblem.MalformedValue, value_type, field_id)
+                return
+
+            self.__valid = True
+        elif value_type == "art_link":
+            # This value item contains the artifact links. these will be parsed out later.
+            # Just remember that the links are there.
+            self.__links = True
+            self.__valid = True
+        elif value_type == "cross":
+            # This value item contains the cross-references. The git references will be parsed out
+            # later, but not the other ones.
+            self.__valid = True
+            self.__cross_refs = True
+        elif value_type is _MISSING:
+            _record(diagnostics, ParseProblem.MissingType, None, item.get("field_id"))
+        else:
+            # The type of the item is not known. Remember the type name. Mostly for debugging
+            # purposes.
+            self.__value = unknown_type_value(value_type)
+            self.__valid = True
+            _record(diagnostics, ParseProblem.UnknownType, value_type, item.get("field_id"))
+
+
+def unknown_type_value(value_type):
+    """
+    Get the value used for the items of an unknown type ("Unknown_" + type). The strings are
+    created only once per type.
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+    :param str value_type: value type
 
-        if "value" in self.__item:
-            self.__value = str(self.__item["value"])
-            if self.__value is None:
-                self.__value = ''
-        else:
-            return
+    :return: value
+    :rtype: str
+    """
+    value = _UNKNOWN_TYPE_VALUES.get(value_type)
 
-        self.__type = 'TEXT'
+    if value is None:
+        value = "Unknown_" + str(value_type)
 
-        self.__valid = True
+        if len(_UNKNOWN_TYPE_VALUES) < _MAX_UNKNOWN_TYPE_VALUES:
+            _UNKNOWN_TYPE_VALUES[value_type] = value
 
-    def __get_string_item_value(self):
-        """
-        Extract the value of a string element. This is just copied as it is. It is already a string.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+    return value
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
 
-        if "value" in self.__item:
-            self.__value = self.__item["value"]
-            if self.__value is None:
-                self.__value = ''
-        else:
-            return
+def get_list(value, diagnostics=None, value_type=None, field_id=None):
+    """
+    Get a list received from the server (e.g. the "values" of an artifact or the "links" of a link
+    value item). None stands for an empty list, any other value that is not a list is malformed: it
+    is recorded in the diagnostics and treated as an empty list.
+
+    :param value: the list
+    :param diagnostics: Optional parameter for the diagnostics where the problems are recorded
+    :type diagnostics: Tuleap.RestClient.ParseDiagnostics.ParseDiagnostics
+    :param str value_type: Optional parameter for the type of the value item (for diagnostics)
+    :param int field_id: Optional parameter for the field ID of the value item (for diagnostics)
+
+    :return: the list (or an empty tuple)
+    :rtype: list | tuple
+    """
+    if isinstance(value, list):
+        return value
 
-        self.__type = 'TEXT'
+    if value is not None:
+        _record(diagnostics, ParseProblem.MalformedItem, value_type, field_id)
 
-        self.__valid = True
+    return ()
 
-    def __get_text_item_value(self):
-        """
-        Extract the value of a text element. This is just copied as it is. the data handler will have to make
-        sure it correctly accounts for the text peculiarities (line breaks, special characters, e.g. tabs, ..)
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
-
-        if "value" in self.__item:
-            self.__value = self.__item["value"]
-            if self.__value is None:
-                self.__value = ''
-        else:
-            return
+def get_dicts(value, diagnostics=None, value_type=None, field_id=None):
+    """
+    Get the dictionary entries of a list received from the server (e.g. the "links" of a link value
+    item or the "value" of a cross-reference value item). Entries that are not dictionaries are
+    malformed: they are recorded in the diagnostics and skipped (see also "get_list").
+
+    :param value: the list
+    :param diagnostics: Optional parameter for the diagnostics where the problems are recorded
+    :type diagnostics: Tuleap.RestClient.ParseDiagnostics.ParseDiagnostics
+    :param str value_type: Optional parameter for the type of the value item (for diagnostics)
+    :param int field_id: Optional parameter for the field ID of the value item (for diagnostics)
+
+    :return: dictionary entries
+    :rtype: list[dict]
+    """
+    entries = get_list(value, diagnostics, value_type, field_id)
+    dicts = [entry for entry in entries if isinstance(entry, dict)]
 
-        self.__type = 'TEXT'
+    for _ in range(len(entries) - len(dicts)):
+        _record(diagnostics, ParseProblem.MalformedItem, value_type, field_id)
 
-        self.__valid = True
+    return dicts
 
-    def __get_date_item_value(self):
-        """
-        Extract the value of a date element. This is just copied as it is. It is already a string.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+def parse_date(value):
+    """
+    Parse a date value received from the server (ISO 8601 format, e.g.
+    "2017-05-19T11:46:21+02:00" or "2017-05-19").
 
-        if "value" in self.__item:
-            self.__value = self.__item["value"]
-            if self.__value is None:
-                self.__value = ''
-        else:
-            return
+    :param str value: date string
 
-        self.__type = 'TEXT'
+    :return: date or None if the value is empty or in an unknown format
+    :rtype: datetime.datetime | None
+    """
+    if not value:
+        return None
 
-        self.__valid = True
+    # Remove the colon from the UTC offset ("+02:00" -> "+0200") so that "%z" can parse it
+    if (len(value) > 6) and (value[-3] == ":") and (value[-6] in "+-"):
+        value = value[:-3] + value[-2:]
 
-    def __get_subby_item_value(self):
-        """
-        Extract the user ID of the artifact creator.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            pass
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+    return None
 
-        if "value" in self.__item:
-            value_subitem = self.__item["value"]
-            if "display_name" in value_subitem:
-                self.__value = value_subitem["display_name"]
-            if self.__value is None:
-                self.__value = ''
-        else:
-            return
 
-        self.__type = 'TEXT'
+# Private ------------------------------------------------------------------------------------------
 
-        self.__valid = True
 
-    def __get_subon_item_value(self):
-        """
-        Extract the date of the artifact creation.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+_DATE_FORMATS = ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d")
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+# Marker for missing keys (None is a valid value of some keys)
+_MISSING = object()
 
-        if "value" in self.__item:
-            self.__value = self.__item["value"]
-            if self.__value is None:
-                self.__value = ''
-        else:
-            return
+# Errors raised by the value conversions (see VALUE_HANDLERS) for malformed values
+CONVERSION_ERRORS = (AttributeError, IndexError, KeyError, TypeError, ValueError)
 
-        self.__type = 'TEXT'
+# Values of the items of unknown types ("priority", "perm", ...), by type. The number of cached
+# values is limited in case of items with arbitrary types.
+_MAX_UNKNOWN_TYPE_VALUES = 256
+_UNKNOWN_TYPE_VALUES = dict((value_type, "Unknown_" + value_type)
+                            for value_type in ("priority", "perm", "burndown", "computed",
+                                               "ttmstepdef", "ttmstepexec"))
 
-        self.__valid = True
 
-    def __get_lud_item_value(self):
-        """
-        Extract the date of the last update of the artifact.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+def _record(diagnostics, problem, value_type, field_id):
+    """
+    Record the problem if diagnostics are used
+    """
+    if diagnostics is not None:
+        diagnostics.record(problem, value_type, field_id)
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
 
-        if "value" in self.__item:
-            self.__value = self.__item["value"]
-            if self.__value is None:
-                self.__value = ''
-        else:
-            return
-
-        self.__type = 'TEXT'
+def _record_missing_key(diagnostics, value_type, field_id, label):
+    """
+    Record which key of the value item is missing
+    """
+    if diagnostics is None:
+        return
 
-        self.__valid = True
+    if field_id is _MISSING:
+        diagnostics.record(ParseProblem.MissingFieldId, value_type, None)
+    elif label is _MISSING:
+        diagnostics.record(ParseProblem.MissingLabel, value_type, field_id)
+    else:
+        diagnostics.record(ParseProblem.MissingValue, value_type, field_id)
 
-    def __get_luby_item_value(self):
-        """
-        Extract the user ID of the artifact last updator.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+def _to_string(value, item):
+    """
+    Numeric value (int, float) converted to a string
+    """
+    return str(value)
 
-        if "value" in self.__item:
-            value_subitem = self.__item["value"]
-            if "display_name" in value_subitem:
-                self.__value = value_subitem["display_name"]
-            if self.__value is None:
-                self.__value = ''
-        else:
-            return
 
-        self.__type = 'TEXT'
+def _text(value, item):
+    """
+    Text value copied as it is
+    """
+    if value is None:
+        return ''
 
-        self.__valid = True
+    return value
 
-    def __get_sb_item_value(self):
-        """
-        Extract the data from the selection-box element. Only one item can be selected at any given time.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+def _display_name(value, item):
+    """
+    Display name of a user value
+    """
+    if value and ("display_name" in value) and (value["display_name"] is not None):
+        return value["display_name"]
 
-        if "values" in self.__item:
-            value_list = self.__item["values"]
-            # Even though only a single item can be selected, the select-box value is presented as a list.
-            # Only the first element of the list needs to be considered. In fact, the list should only
-            # contain a single element at most.
-            if len(value_list) > 0:
-                if "label" in value_list[0]:
-                    self.__value = value_list[0]["label"]
-        else:
-            return
+    return ''
 
-        self.__type = 'TEXT'
 
-        self.__valid = True
+def _first_label(value, item):
+    """
+    Label of the selected item. Even though only a single item can be selected, the value is
+    presented as a list. Only the first element of the list needs to be considered.
+    """
+    if (len(value) > 0) and ("label" in value[0]):
+        return value[0]["label"]
 
-    def __get_msb_item_value(self):
-        """
-        Extract the data from the multiple-selection-box element. Multiple items can be selected.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+    return ''
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
 
-        if "values" in self.__item:
-            self.__value = ", ".join([val["label"] for val in self.__item["values"] if "label" in val])
-                
-        else:
-            return
+def _joined_labels(value, item):
+    """
+    Labels of all selected items
+    """
+    return ", ".join([val["label"] for val in value if "label" in val])
 
-        self.__type = 'TEXT'
 
-        self.__valid = True
+def _joined_display_names(value, item):
+    """
+    Display names of all selected users
+    """
+    return ", ".join([val["display_name"] for val in value if "display_name" in val])
 
-    def __get_cb_item_value(self):
-        """
-        Extract the data from the check-box element. Multiple items can be selected.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+def _joined_file_names(value, item):
+    """
+    IDs and names of all files
+    """
+    return ", ".join(["{:}-{:}".format(f["id"], f["name"]) for f in value if "name" in f])
 
-        if "values" in self.__item:
-            val_lst = self.__item["values"]
-            first_item = True
-            # Extract and concatenate all the selected items in the check box.
-            for val_tmp in val_lst:
-                if "label" in val_tmp:
-                    if first_item:
-                        self.__value = val_tmp["label"]
-                        first_item = False
-                    else:
-                        self.__value = self.__value + ", " + val_tmp["label"]
-        else:
-            return
 
-        self.__type = 'TEXT'
+def _to_int(value, item):
+    """
+    Native integer value
+    """
+    if value is None:
+        return None
 
-        self.__valid = True
+    return int(value)
 
-    def __get_tbl_item_value(self):
-        """
-        Extract the user ID of the cc field.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+def _to_float(value, item):
+    """
+    Native float value
+    """
+    if value is None:
+        return None
 
-        if "bind_value_objects" in self.__item:
-            value_subitem = self.__item.get("bind_value_objects", [])
-            self.__value = ", ".join([val["display_name"] for val in value_subitem if "display_name" in val])
-        else:
-            return
+    return float(value)
 
-        self.__type = 'TEXT'
 
-        self.__valid = True
+def _to_date(value, item):
+    """
+    Native date value
+    """
+    return parse_date(value)
 
-    def __get_rb_item_value(self):
-        """
-        Extract the data (currently selected item) from the radio button element.
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+def _user_id(value, item):
+    """
+    ID of a user value
+    """
+    if value:
+        return value.get("id")
 
-        if "values" in self.__item:
-            value_list = self.__item["values"]
-            if len(value_list) > 0:
-                if "label" in value_list[0]:
-                    self.__value = value_list[0]["label"]
-        else:
-            return
+    return None
 
-        self.__type = 'TEXT'
 
-        self.__valid = True
+def _first_bind_value_id(value, item):
+    """
+    Bind value ID of the selected item
+    """
+    bind_value_ids = item.get("bind_value_ids")
 
-    def __get_file_item_value(self):
-        """
-        Extract the data from the file list item (list of files).
-        """
-        if "field_id" in self.__item:
-            self.__id = self.__item["field_id"]
-        else:
-            return
+    if bind_value_ids:
+        return bind_value_ids[0]
 
-        if "label" in self.__item:
-            self.__label = self.__item["label"]
-        else:
-            return
+    return None
 
-        if "file_descriptions" in self.__item:
-            file_list = self.__item["file_descriptions"]
-            if len(file_list) > 0:
-                self.__value = ", ".join([f"{f['id']}-{f['name']}" for f in file_list if "name" in f])
-        else:
-            return
 
-        self.__type = 'TEXT'
+def _bind_value_ids(value, item):
+    """
+    Bind value IDs of all selected items
+    """
+    return list(item.get("bind_value_ids") or [])
 
-        self.__valid = True
 
-    def __convert_item_to_string(self):
-        """
-        Convert the given value item to its string representation.
-        The exact conversion method depends on the type of the item.
-        """
-        if "type" in self.__item:
-            value_type = self.__item["type"]
-            if value_type == "aid":
-                self.__get_aid_item_value()
-            elif value_type == "int":
-                self.__get_int_item_value()
-            elif value_type == "float":
-                self.__get_float_item_value()
-            elif value_type == "string":
-                self.__get_string_item_value()
-            elif value_type == "text":
-                self.__get_text_item_value()
-            elif value_type == "date":
-                self.__get_date_item_value()
-            elif value_type == "subby":
-                self.__get_subby_item_value()
-            elif value_type == "subon":
-                self.__get_subon_item_value()
-            elif value_type == "lud":
-                self.__get_lud_item_value()
-            elif value_type == "luby":
-                self.__get_luby_item_value()
-            elif value_type == "sb":
-                self.__get_sb_item_value()
-            elif value_type == "msb":
-                self.__get_msb_item_value()
-            elif value_type == "cb":
-                self.__get_cb_item_value()
-            elif value_type == "tbl":
-                self.__get_tbl_item_value()
-            elif value_type == "rb":
-                self.__get_rb_item_value()
-            elif value_type == "file":
-                self.__get_file_item_value()
-            elif value_type == "art_link":
-                # This value item contains the artifact links. these will be parsed out later.
-                # Just remember that the links are there.
-                self.__links = True
-                self.__valid = True
-            elif value_type == "cross":
-                # This value item contains the cross-references. The git references will be parsed out later, but not
-                # the other ones.
-                self.__valid = True
-                self.__cross_refs = True
-            else:
-                # The type of the item is not known. Remember the type name. Mostly for debugging purposes.
-                self.__value = "Unknown_" + value_type
-                self.__valid = True
+def _file_ids(value, item):
+    """
+    IDs of all files
+    """
+    return [f["id"] for f in value if "id" in f]
+
+
+# Value handler table: value type -> (value key, string conversion, native conversion, string type
+# name, native type name)
+VALUE_HANDLERS = {
+    "aid": ("value", _to_string, _to_int, 'INTEGER', 'INTEGER'),
+    "int": ("value", _to_string, _to_int, 'TEXT', 'INTEGER'),
+    "float": ("value", _to_string, _to_float, 'TEXT', 'FLOAT'),
+    "string": ("value", _text, _text, 'TEXT', 'TEXT'),
+    "text": ("value", _text, _text, 'TEXT', 'TEXT'),
+    "date": ("value", _text, _to_date, 'TEXT', 'DATE'),
+    "subby": ("value", _display_name, _user_id, 'TEXT', 'ID'),
+    "subon": ("value", _text, _to_date, 'TEXT', 'DATE'),
+    "lud": ("value", _text, _to_date, 'TEXT', 'DATE'),
+    "luby": ("value", _display_name, _user_id, 'TEXT', 'ID'),
+    "sb": ("values", _first_label, _first_bind_value_id, 'TEXT', 'ID'),
+    "msb": ("values", _joined_labels, _bind_value_ids, 'TEXT', 'ID_LIST'),
+    "cb": ("values", _joined_labels, _bind_value_ids, 'TEXT', 'ID_LIST'),
+    "tbl": ("bind_value_objects", _joined_display_names, _bind_value_ids, 'TEXT', 'ID_LIST'),
+    "rb": ("values", _first_label, _first_bind_value_id, 'TEXT', 'ID'),
+    "file": ("file_descriptions", _joined_file_names, _file_ids, 'TEXT', 'ID_LIST'),
+}
@@ -0,0 +1,437 @@
+"""
+Benchmarks of the artifact parsers, the JSON decoding and the filter queries.
+
+The benchmarks are run on synthetic pages of artifacts with a realistic mix of field types
+(selection boxes, multi selection boxes, links, cross-references, text and file fields), based on
+the structure of the recorded test fixtures. For every implementation the number of items per
+second and the peak memory (of a separate run with tracemalloc enabled) are reported.
+
+Usage:
+    python Tuleap/RestClient/test/benchmark_parsers.py [--sizes 1000,10000,100000] [--only name]
+                                                       [--fixtures]
+
+With "--fixtures" the pages are built from the recorded artifacts of the test fixtures instead of
+the generated artifacts (the filter query benchmarks always use the generated artifacts).
+
+The parsed results are kept until the end of each run, so the peak memory also shows the size of
+the parsed representation. For very large sizes (e.g. 1000000) use "--only" to limit the run to the
+interesting implementations.
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.ArtifactTable import parse_artifact_page
+from Tuleap.RestClient.CompactArtifact import CompactArtifact
+from Tuleap.RestClient.Filter import CaseSensitivity, ComparisonOperation, FilterQuery, \
+    LogicalOperation, NumericFilterItem, NumericInRangeFilterItem, StringComparisonOperation, \
+    StringFilterItem
+from Tuleap.RestClient.TrackerSchemaParser import TrackerSchemaParser
+from Tuleap.RestClient.ValueParser import ValueParser
+
+# Public -------------------------------------------------------------------------------------------
+
+
+PAGE_SIZE = 100
+
+# Number of distinct generated pages, larger runs cycle over them
+DISTINCT_PAGES = 20
+
+FIXTURES = ["request_artifact_response.txt", "artifact_response_crossrefs.txt"]
+
+STATUSES = ["New", "Open", "In progress", "Review", "Done", "Closed"]
+USERS = ["Manuel Vacelet (vaceletm)", "Djuro Drljaca (djurodrljaca)", "Jane Doe (jdoe)",
+         "John Smith (jsmith)"]
+WORDS = ["display", "error", "name", "field", "tracker", "report", "artifact", "link", "commit",
+         "release", "burndown", "milestone", "backlog", "planning"]
+
+
+def generate_artifact(generator, artifact_id):
+    """
+    Generate an artifact with all field values
+
+    :param random.Random generator: random number generator
+    :param int artifact_id: Artifact ID
+
+    :return: artifact (same structure as received from the server)
+    :rtype: dict
+    """
+    status = generator.randrange(len(STATUSES))
+    assigned = generator.sample(range(len(USERS)), generator.randint(0, 2))
+    links = [{"id": generator.randint(1, 1000000), "type": generator.choice([None, "_is_child"]),
+              "uri": "artifacts/1", "tracker": {"id": 20}}
+             for _ in range(generator.randint(0, 5))]
+    reverse_links = [{"id": generator.randint(1, 1000000), "type": None, "uri": "artifacts/1",
+                      "tracker": {"id": 20}}
+                     for _ in range(generator.randint(0, 2))]
+    references = [{"ref": "git #tuleap/stable/{:040x}".format(generator.getrandbits(160)),
+                   "url": "https://tuleap.example.com/plugins/git/",
+                   "direction": generator.choice(["in", "out"])}
+                  for _ in range(generator.randint(0, 3))]
+    references += [{"ref": "gerrit #{:}".format(generator.randint(1000, 99999)),
+                    "url": "https://tuleap.example.com/goto",
+                    "direction": "out"}
+                   for _ in range(generator.randint(0, 2))]
+    files = [{"id": generator.randint(1, 100000), "name": "screenshot_{:}.png".format(index),
+              "description": "", "type": "image/png", "size": generator.randint(1000, 100000)}
+             for index in range(generator.randint(0, 1))]
+
+    return {
+        "id": artifact_id,
+        "uri": "artifacts/{:}".format(artifact_id),
+        "xref": "story #{:}".format(artifact_id),
+        "tracker": {"id": 20, "uri": "trackers/20", "label": "Stories"},
+        "project": {"id": 101, "uri": "projects/101", "label": "Tuleap"},
+        "submitted_by": 105,
+        "submitted_on": "2017-05-19T11:46:21+02:00",
+        "last_modified_date": "2018-0{:}-1{:}T10:00:00+02:00".format(generator.randint(1, 9),
+                                                                   generator.randint(0, 9)),
+        "values": [
+            {"field_id": 101, "type": "aid", "label": "Artifact ID", "value": artifact_id},
+            {"field_id": 102, "type": "string", "label": "Summary",
+             "value": " ".join(generator.choice(WORDS) for _ in range(6))},
+            {"field_id": 103, "type": "text", "label": "Description", "format": "text",
+             "value": " ".join(generator.choice(WORDS) for _ in range(generator.randint(20, 200)))},
+            {"field_id": 104, "type": "sb", "label": "Status",
+             "values": [{"id": 1000 + status, "label": STATUSES[status], "color": None}],
+             "bind_value_ids": [1000 + status]},
+            {"field_id": 105, "type": "msb", "label": "Assigned to",
+             "values": [{"id": 200 + user, "label": USERS[user],
+                         "display_name": USERS[user]} for user in assigned],
+             "bind_value_ids": [200 + user for user in assigned]},
+            {"field_id": 106, "type": "int", "label": "Story points",
+             "value": generator.choice([None, 1, 2, 3, 5, 8, 13])},
+            {"field_id": 107, "type": "float", "label": "Remaining effort",
+             "value": round(generator.uniform(0, 40), 1)},
+            {"field_id": 108, "type": "date", "label": "Due date",
+             "value": "2018-0{:}-2{:}T00:00:00+02:00".format(generator.randint(1, 9),
+                                                           generator.randint(0, 8))},
+            {"field_id": 109, "type": "subby", "label": "Submitted by",
+             "value": {"id": 105, "display_name": USERS[0], "username": "vaceletm"}},
+            {"field_id": 110, "type": "lud", "label": "Last update date",
+             "value": "2018-01-10T10:00:00+02:00"},
+            {"field_id": 111, "type": "art_link", "label": "Links",
+             "links": links, "reverse_links": reverse_links},
+            {"field_id": 112, "type": "cross", "label": "Cross references", "value": references},
+            {"field_id": 113, "type": "file", "label": "Attachments", "file_descriptions": files},
+            {"field_id": 114, "type": "priority", "label": "Rank", "value": artifact_id},
+        ]
+    }
+
+
+def generate_pages(seed=0, page_size=PAGE_SIZE, page_count=DISTINCT_PAGES):
+    """
+    Generate pages of artifacts
+
+    :return: list of pages (lists of artifacts)
+    :rtype: list[list[dict]]
+    """
+    generator = random.Random(seed)
+
+    return [[generate_artifact(generator, page_index * page_size + index + 1)
+             for index in range(page_size)]
+            for page_index in range(page_count)]
+
+
+def load_fixture_pages(page_size=PAGE_SIZE):
+    """
+    Build pages from the recorded artifacts of the test fixtures
+
+    :return: list of pages (lists of artifacts)
+    :rtype: list[list[dict]]
+    """
+    items = []
+
+    for file_name in FIXTURES:
+        fixture_file = open(os.path.join(os.path.dirname(os.path.abspath(__file__)), file_name),
+                            "r")
+        items.append(json.loads(fixture_file.read()))
+        fixture_file.close()
+
+    return [[items[index % len(items)] for index in range(page_size)]]
+
+
+def cycle_pages(pages, item_count, raw=False):
+    """
+    Yield pages (cycling over the distinct pages) until the requested number of items is reached.
+    Raw (JSON encoded) pages always contain PAGE_SIZE items, so they are not truncated.
+    """
+    yielded = 0
+    page_index = 0
+
+    while yielded < item_count:
+        page = pages[page_index % len(pages)]
+
+        if raw:
+            yielded += PAGE_SIZE
+        else:
+            if yielded + len(page) > item_count:
+                page = page[:item_count - yielded]
+
+            yielded += len(page)
+
+        yield page
+        page_index += 1
+
+
+def tracker_structure(page):
+    """
+    Tracker structure with the fields of the artifacts of the page (for the recorded artifacts the
+    tracker structure is not available)
+    """
+    fields = dict()
+
+    for item in page:
+        for value_item in item["values"]:
+            fields.setdefault(value_item["field_id"], {"field_id": value_item["field_id"],
+                                                       "type": value_item["type"],
+                                                       "label": value_item["label"]})
+
+    return {"id": page[0]["tracker"]["id"], "fields": list(fields.values())}
+
+
+def summary(item):
+    """
+    Flat summary of an artifact (input of the filter query benchmarks)
+    """
+    values = dict((value["field_id"], value) for value in item["values"])
+
+    return {"id": item["id"],
+            "status": values[104]["values"][0]["label"],
+            "summary": values[102]["value"],
+            "points": values[106]["value"] or 0,
+            "effort": values[107]["value"]}
+
+
+def make_filter_query():
+    """
+    Typical filter query: open stories with some points or with an interesting summary
+    """
+    return FilterQuery([StringFilterItem("status",
+                                         StringComparisonOperation.NotEqualTo,
+                                         "Closed"),
+                        FilterQuery([NumericFilterItem("points",
+                                                       ComparisonOperation.GreaterThanOrEqualTo,
+                                                       5),
+                                     NumericInRangeFilterItem("effort", 10.0, True, 20.0, False),
+                                     StringFilterItem("summary",
+                                                      StringComparisonOperation.Contains,
+                                                      "ERROR",
+                                                      CaseSensitivity.CaseInsensitive)],
+                                    LogicalOperation.Or)],
+                       LogicalOperation.And)
+
+
+# Benchmarks: name -> (input kind, function(inputs, results) -> number of processed items)
+# The input kind is "raw" (JSON encoded pages), "pages" (decoded pages) or "summaries" (pages of
+# flat artifact summaries)
+
+
+def _bench_json_decode(pages, results):
+    count = 0
+
+    for page in pages:
+        page = json.loads(page)
+        results.append(page)
+        count += len(page)
+
+    return count
+
+
+def _bench_value_parser(pages, results):
+    count = 0
+
+    for page in pages:
+        for item in page:
+            for value_item in item["values"]:
+                results.append(ValueParser(value_item))
+                count += 1
+
+    return count
+
+
+def _artifact_parser_bench(**kwargs):
+    def bench(pages, results):
+        count = 0
+
+        for page in pages:
+            for item in page:
+                results.append(ArtifactParser(item, **kwargs))
+                count += 1
+
+        return count
+
+    return bench
+
+
+def _bench_lazy_links_only(pages, results):
+    count = 0
+
+    for page in pages:
+        for item in page:
+            artifact = ArtifactParser(item, lazy=True)
+            artifact.get_links()
+            results.append(artifact)
+            count += 1
+
+    return count
+
+
+def _bench_compact_artifact(pages, results):
+    count = 0
+
+    for page in pages:
+        for item in page:
+            results.append(CompactArtifact(item))
+            count += 1
+
+    return count
+
+
+def _bench_tracker_schema_parser(pages, results):
+    schema = None
+    count = 0
+
+    for page in pages:
+        if schema is None:
+            schema = TrackerSchemaParser(tracker_structure(page),
+                                         skipped_types=["text", "file"],
+                                         typed=True)
+
+        for item in page:
+            results.append(schema.parse(item))
+            count += 1
+
+    return count
+
+
+def _bench_artifact_table(pages, results):
+    count = 0
+
+    for page in pages:
+        results.append(parse_artifact_page(page))
+        count += len(page)
+
+    return count
+
+
+def _bench_filter_query(pages, results):
+    query = make_filter_query()
+    count = 0
+
+    for page in pages:
+        for item in page:
+            if query.execute(item):
+                results.append(item)
+            count += 1
+
+    return count
+
+
+def _bench_filter_query_compiled(pages, results):
+    predicate = make_filter_query().compile()
+    count = 0
+
+    for page in pages:
+        for item in page:
+            if predicate(item):
+                results.append(item)
+            count += 1
+
+    return count
+
+
+BENCHMARKS = [
+    ("json_decode", "raw", _bench_json_decode),
+    ("value_parser", "pages", _bench_value_parser),
+    ("artifact_parser", "pages", _artifact_parser_bench()),
+    ("artifact_parser_typed", "pages", _artifact_parser_bench(typed=True)),
+    ("artifact_parser_lazy", "pages", _artifact_parser_bench(lazy=True)),
+    ("artifact_parser_lazy_links", "pages", _bench_lazy_links_only),
+    ("compact_artifact", "pages", _bench_compact_artifact),
+    ("tracker_schema_parser", "pages", _bench_tracker_schema_parser),
+    ("artifact_table", "pages", _bench_artifact_table),
+    ("filter_query", "summaries", _bench_filter_query),
+    ("filter_query_compiled", "summaries", _bench_filter_query_compiled),
+]
+
+
+def run_benchmark(function, inputs, item_count, raw, measure_memory):
+    """
+    Run one benchmark
+
+    :return: (number of processed items, duration in seconds, peak memory in bytes or None)
+    """
+    results = []
+    gc.collect()
+
+    if measure_memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    count = function(cycle_pages(inputs, item_count, raw), results)
+    duration = time.perf_counter() - start
+    peak = None
+
+    if measure_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    del results
+    gc.collect()
+
+    return count, duration, peak
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Benchmarks of the artifact parsers")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma separated numbers of artifacts (e.g. 1000,10000,1000000)")
+    parser.add_argument("--only", action="append",
+                        help="run only the named benchmark (can be used multiple times)")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="do not measure the peak memory (faster)")
+    parser.add_argument("--fixtures", action="store_true",
+                        help="use the recorded artifacts of the test fixtures")
+    options = parser.parse_args(arguments)
+
+    generated_pages = generate_pages()
+    pages = load_fixture_pages() if options.fixtures else generated_pages
+    inputs = {"pages": pages,
+              "raw": [json.dumps(page) for page in pages],
+              "summaries": [[summary(item) for item in page] for page in generated_pages]}
+
+    print("{:<28} {:>9} {:>10} {:>14} {:>12}".format("benchmark", "artifacts", "seconds",
+                                                      "items/sec", "peak MiB"))
+
+    for size in [int(size) for size in options.sizes.split(",")]:
+        for name, input_kind, function in BENCHMARKS:
+            if options.only and (name not in options.only):
+                continue
+
+            raw = (input_kind == "raw")
+            count, duration, _ = run_benchmark(function, inputs[input_kind], size, raw, False)
+            peak = None
+
+            if not options.no_memory:
+                _, _, peak = run_benchmark(function, inputs[input_kind], size, raw, True)
+
+            print("{:<28} {:>9} {:>10.3f} {:>14.0f} {:>12}".format(
+                name,
+                size,
+                duration,
+                count / duration if duration > 0 else 0.0,
+                "{:.1f}".format(peak / (1024.0 * 1024.0)) if peak is not None else "-"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import unittest
+
+from Tuleap.RestClient.AdaptiveFilter import AdaptiveFilterQuery
+from Tuleap.RestClient.Filter import CaseSensitivity, ComparisonOperation, FilterQuery, \
+    LogicalOperation, Negation, NumericFilterItem, StringComparisonOperation, StringFilterItem
+
+
+class AdaptiveFilterQueryTest(unittest.TestCase):
+    def setUp(self):
+        self.items = [{"id": index,
+                       "summary": "Display error in field {:}".format(index),
+                       "status": "Closed" if index % 50 == 0 else "Open"}
+                      for index in range(2000)]
+        self.query = FilterQuery([StringFilterItem("summary",
+                                                   StringComparisonOperation.Contains,
+                                                   "ERROR",
+                                                   CaseSensitivity.CaseInsensitive),
+                                  FilterQuery([NumericFilterItem("id",
+                                                                 ComparisonOperation.GreaterThan,
+                                                                 1000000),
+                                               StringFilterItem("status",
+                                                                StringComparisonOperation.EqualTo,
+                                                                "Closed")],
+                                              LogicalOperation.Or),
+                                  FilterQuery([NumericFilterItem("id",
+                                                                 ComparisonOperation.LessThan,
+                                                                 100)],
+                                              LogicalOperation.And,
+                                              Negation.Enabled)],
+                                 LogicalOperation.And)
+
+    def test_same_results(self):
+        adaptive = AdaptiveFilterQuery(self.query, reorder_interval=100, sample_interval=4)
+        self.assertEqual([item["id"] for item in adaptive.filter(self.items)],
+                         [item["id"] for item in self.items if self.query.execute(item)])
+
+    def test_reordering(self):
+        adaptive = AdaptiveFilterQuery(self.query, reorder_interval=100, sample_interval=1)
+
+        for item in self.items:
+            adaptive.execute(item)
+
+        statistics = adaptive.get_statistics()
+        self.assertEqual(statistics[0].evaluations, len(self.items))
+        self.assertEqual(statistics[0].depth, 0)
+
+        # The rarely passing "or" sub-query decides the "and" query, so it is executed first, and
+        # the string comparison that always passes is executed last
+        self.assertEqual(statistics[1].description, "Or")
+        self.assertEqual(statistics[-1].description, "summary Contains 'ERROR'")
+        self.assertLess(statistics[-1].evaluations, len(self.items) / 2)
+
+        reordered = adaptive.to_filter_query()
+        self.assertIsInstance(reordered.get_query_items()[0], FilterQuery)
+        self.assertEqual([reordered.execute(item) for item in self.items],
+                         [self.query.execute(item) for item in self.items])
+
+        self.assertIn("evaluations", adaptive.format_statistics())
+        adaptive.reset_statistics()
+        self.assertEqual(adaptive.get_statistics()[0].evaluations, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import json
+import threading
+import unittest
+
+from Tuleap.RestClient.ArtifactCloner import ArtifactCloner
+from Tuleap.RestClient.ArtifactGraph import ArtifactGraph
+from Tuleap.RestClient.test.test_artifact_graph import make_artifact
+
+
+class FakeResponse(object):
+    def __init__(self, data, status_code=200):
+        self.text = json.dumps(data)
+        self.headers = {}
+        self.status_code = status_code
+
+
+class FakeServer(object):
+    def __init__(self, artifacts, link_field=True):
+        self.artifacts = artifacts
+        self.fields = [{"field_id": 10, "type": "art_link"}] if link_field else []
+        self.failing = set()
+        self.created = []
+        self.updates = dict()
+        self.lock = threading.Lock()
+
+
+class FakeConnection(object):
+    def __init__(self, server):
+        self.server = server
+        self._lastResponseMessage = None
+
+    def is_logged_in(self):
+        return True
+
+    def clone(self):
+        return FakeConnection(self.server)
+
+    def call_get_method(self, relative_url, parameters=None):
+        resource, identifier = relative_url.strip("/").split("/")
+        identifier = int(identifier)
+
+        if resource == "trackers":
+            self._lastResponseMessage = FakeResponse({"id": identifier,
+                                                      "fields": self.server.fields})
+            return True
+
+        if (identifier not in self.server.artifacts) or (identifier in self.server.failing):
+            return False
+
+        self._lastResponseMessage = FakeResponse(self.server.artifacts[identifier])
+        return True
+
+    def call_post_method(self, relative_url, data=None):
+        with self.server.lock:
+            clone_id = 100 + len(self.server.created)
+            self.server.created.append(data["from_artifact"]["id"])
+
+        self._lastResponseMessage = FakeResponse({"id": clone_id})
+        return True
+
+    def call_put_method(self, relative_url, data=None, headers=None):
+        with self.server.lock:
+            self.server.updates[int(relative_url.split("/")[-1])] = data["values"]
+
+        self._lastResponseMessage = FakeResponse({})
+        return True
+
+    def get_last_response_message(self):
+        return self._lastResponseMessage
+
+
+class ArtifactClonerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeServer({1: make_artifact(1, [(2, "_is_child"), (9, None)]),
+                                  2: make_artifact(2, [(3, "_is_child")]),
+                                  3: make_artifact(3, [(9, "_is_child")])})
+
+    def links_of_copy(self, cloner, artifact_id):
+        values = self.server.updates[cloner.get_data()[artifact_id]]
+        self.assertEqual([value["field_id"] for value in values], [10])
+        return values[0]["links"]
+
+    def test_remap_links(self):
+        cloner = ArtifactCloner(FakeConnection(self.server), max_workers=2, batch_size=1)
+        self.assertTrue(cloner.clone_artifacts(5, [1, 2, 3]))
+        mapping = cloner.get_data()
+        self.assertEqual(sorted(mapping), [1, 2, 3])
+        self.assertEqual(sorted(mapping.values()), [100, 101, 102])
+
+        # Links to artifacts that were not cloned (9) are kept
+        self.assertEqual(self.links_of_copy(cloner, 1),
+                         [{"id": mapping[2], "type": "_is_child"}, {"id": 9}])
+        self.assertEqual(self.links_of_copy(cloner, 2), [{"id": mapping[3], "type": "_is_child"}])
+
+        # Artifact 3 does not link to any cloned artifact
+        self.assertEqual(len(self.server.updates), 2)
+
+    def test_graph_keeps_other_links(self):
+        graph = ArtifactGraph([(1, 2, "_is_child")])
+        cloner = ArtifactCloner(FakeConnection(self.server))
+        self.assertTrue(cloner.clone_artifacts(5, graph=graph))
+        self.assertEqual(self.links_of_copy(cloner, 1),
+                         [{"id": cloner.get_data()[2], "type": "_is_child"}, {"id": 9}])
+
+    def test_failed_link_request(self):
+        self.server.failing.add(2)
+        cloner = ArtifactCloner(FakeConnection(self.server))
+        self.assertFalse(cloner.clone_artifacts(5, [1, 2, 3]))
+        self.assertEqual(cloner.get_failed_artifact_ids(), [2])
+        self.assertEqual(sorted(self.server.created), [1, 3])
+        self.assertEqual(self.server.updates, dict())
+
+    def test_missing_link_field(self):
+        self.server.fields = []
+        cloner = ArtifactCloner(FakeConnection(self.server))
+
+        with self.assertRaises(Exception):
+            cloner.clone_artifacts(5, [1, 2])
+
+        self.assertEqual(self.server.created, [])
+
+        # Nothing to rewrite, the link field is not needed
+        self.assertTrue(cloner.clone_artifacts(5, [1, 3]))
+        self.assertEqual(sorted(self.server.created), [1, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import json
+import unittest
+
+from Tuleap.RestClient.ArtifactGraph import ArtifactGraph, ArtifactGraphCrawler
+
+
+def make_artifact(artifact_id, links):
+    return {"id": artifact_id,
+            "xref": "story #{:}".format(artifact_id),
+            "project": {"id": 1},
+            "tracker": {"id": 2},
+            "values": [{"field_id": 10,
+                        "type": "art_link",
+                        "label": "Links",
+                        "links": [{"id": target_id, "type": link_type}
+                                  for target_id, link_type in links],
+                        "reverse_links": []}]}
+
+
+class FakeResponse(object):
+    def __init__(self, text):
+        self.text = text
+        self.headers = {}
+
+
+class FakeConnection(object):
+    def __init__(self, artifacts):
+        self.artifacts = artifacts
+        self.requested = []
+        self._lastResponseMessage = None
+
+    def is_logged_in(self):
+        return True
+
+    def clone(self):
+        connection = FakeConnection(self.artifacts)
+        connection.requested = self.requested
+        return connection
+
+    def call_get_method(self, relative_url, parameters=None):
+        artifact_id = int(relative_url.split("/")[-1])
+        self.requested.append(artifact_id)
+
+        if artifact_id not in self.artifacts:
+            return False
+
+        self._lastResponseMessage = FakeResponse(json.dumps(self.artifacts[artifact_id]))
+        return True
+
+    def get_last_response_message(self):
+        return self._lastResponseMessage
+
+
+class ArtifactGraphTest(unittest.TestCase):
+    def setUp(self):
+        self.graph = ArtifactGraph([(1, 2, "_is_child"),
+                                    (1, 3, "_is_child"),
+                                    (2, 4, "_is_child"),
+                                    (4, 1, None),
+                                    (3, 5, "")])
+
+    def test_links(self):
+        self.assertEqual(self.graph.get_artifact_ids(), [1, 2, 3, 4, 5])
+        self.assertEqual(self.graph.get_edge_count(), 5)
+        self.assertEqual(self.graph.get_links(1), [(2, "_is_child"), (3, "_is_child")])
+        self.assertEqual(self.graph.get_reverse_links(1), [(4, None)])
+        self.assertEqual(self.graph.get_links(3), [(5, None)])
+        self.assertEqual(self.graph.get_links(42), [])
+
+    def test_descendants_and_ancestors(self):
+        self.assertEqual(self.graph.get_descendants(1), [2, 3, 4, 5])
+        self.assertEqual(self.graph.get_descendants(1, link_types=["_is_child"]), [2, 3, 4])
+        self.assertEqual(self.graph.get_descendants(1, max_depth=1), [2, 3])
+        self.assertEqual(self.graph.get_ancestors(4), [2, 1])
+        self.assertEqual(self.graph.get_ancestors(4, link_types=["_is_child"]), [2, 1])
+
+    def test_subtree(self):
+        subtree = self.graph.get_subtree(2, link_types=["_is_child"])
+        self.assertEqual(subtree.get_artifact_ids(), [2, 4])
+        self.assertEqual(subtree.get_edges(), [(2, 4, "_is_child")])
+
+
+class ArtifactGraphCrawlerTest(unittest.TestCase):
+    def setUp(self):
+        self.connection = FakeConnection({1: make_artifact(1, [(2, "_is_child"), (3, None)]),
+                                          2: make_artifact(2, [(4, "_is_child")]),
+                                          3: make_artifact(3, []),
+                                          4: make_artifact(4, [(1, "_is_child")])})
+
+    def test_crawl(self):
+        crawler = ArtifactGraphCrawler(self.connection, max_workers=2)
+        self.assertTrue(crawler.crawl([1]))
+        graph = crawler.get_data()
+        self.assertEqual(graph.get_artifact_ids(), [1, 2, 3, 4])
+        self.assertEqual(graph.get_edge_count(), 4)
+        self.assertEqual(sorted(self.connection.requested), [1, 2, 3, 4])
+
+    def test_crawl_with_filters(self):
+        crawler = ArtifactGraphCrawler(self.connection)
+        self.assertTrue(crawler.crawl([1], max_depth=1, link_types=["_is_child"]))
+        self.assertEqual(crawler.get_data().get_edges(), [(1, 2, "_is_child")])
+        self.assertEqual(self.connection.requested, [1])
+
+    def test_crawl_failure(self):
+        crawler = ArtifactGraphCrawler(self.connection)
+        self.assertFalse(crawler.crawl([3, 7]))
+        self.assertEqual(crawler.get_failed_artifact_ids(), [7])
+
+
+if __name__ == '__main__':
+    unittest.main()
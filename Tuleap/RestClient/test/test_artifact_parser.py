@@ -30,5 +30,41 @@ class ArtifactParserTest(unittest.TestCase):
         self.assertEqual(self.artifact.get_name(), "bugs #42")
 
 
+class LazyArtifactParserTest(unittest.TestCase):
+    def setUp(self):
+        self.items = []
+
+        for file_name in ["request_artifact_response.txt", "artifact_response_crossrefs.txt"]:
+            request_file = open("Tuleap/RestClient/test/" + file_name, "r")
+            self.items.append(json.loads(request_file.read()))
+            request_file.close()
+
+    def test_same_results_as_eager(self):
+        for item in self.items:
+            eager = ArtifactParser(item)
+            lazy = ArtifactParser(item, lazy=True)
+            self.assertEqual(lazy.is_valid(), eager.is_valid())
+            self.assertEqual(lazy.get_name(), eager.get_name())
+            self.assertEqual(lazy.get_links(), eager.get_links())
+            self.assertEqual(lazy.get_links_types(), eager.get_links_types())
+            self.assertEqual(lazy.get_reverse_links_types(), eager.get_reverse_links_types())
+            self.assertEqual(lazy.get_in_git_references(), eager.get_in_git_references())
+            self.assertEqual(lazy.get_out_git_references(), eager.get_out_git_references())
+            self.assertEqual(lazy.get_values(), eager.get_values())
+
+    def test_get_value(self):
+        lazy = ArtifactParser(self.items[0], lazy=True)
+        self.assertEqual(lazy.get_value(142),
+                         {'id': 142, 'value': '42', 'type': 'INTEGER', 'label': 'Artifact ID'})
+        self.assertEqual(lazy.get_value(1), None)
+        self.assertEqual(ArtifactParser(self.items[0]).get_value(142), lazy.get_value(142))
+
+    def test_invalid_item(self):
+        lazy = ArtifactParser({"values": self.items[0]["values"]}, lazy=True)
+        self.assertFalse(lazy.is_valid())
+        self.assertEqual(lazy.get_values(), [])
+        self.assertEqual(lazy.get_links(), [])
+
+
 if __name__ == '__main__':
     unittest.main()
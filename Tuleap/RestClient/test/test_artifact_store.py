@@ -0,0 +1,79 @@
+import json
+import unittest
+
+from Tuleap.RestClient.ArtifactStore import ArtifactStore
+
+
+class FakeTracker(object):
+    def __init__(self, artifacts):
+        self.artifacts = artifacts
+        self.expert_queries = []
+        self._data = None
+
+    def request_artifact_list(self, tracker_id, field_values, limit, offset, expert_query=None):
+        self.expert_queries.append(expert_query)
+        self._data = self.artifacts[offset:offset + limit]
+        return True
+
+    def get_data(self):
+        return self._data
+
+    def get_count(self):
+        return len(self.artifacts)
+
+
+class ArtifactStoreTest(unittest.TestCase):
+    def setUp(self):
+        request_file = open("Tuleap/RestClient/test/request_artifact_response.txt", "r")
+        self.artifact = json.loads(request_file.read())
+        request_file.close()
+        request_file = open("Tuleap/RestClient/test/artifact_response_crossrefs.txt", "r")
+        self.crossrefs_artifact = json.loads(request_file.read())
+        request_file.close()
+        self.store = ArtifactStore()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_upsert_artifact(self):
+        self.assertTrue(self.store.upsert_artifact(self.artifact))
+        self.assertEqual(self.store.get_artifact(42), self.artifact)
+        self.assertEqual(self.store.get_artifact_ids(tracker_id=6), [42])
+        self.assertEqual(self.store.get_artifact_ids(project_id=8), [])
+        self.assertEqual(self.store.get_values(42),
+                         [{'id': 153, 'value': 'Display error on name field', 'type': 'TEXT',
+                           'label': 'Summary'},
+                          {'id': 142, 'value': '42', 'type': 'INTEGER', 'label': 'Artifact ID'}])
+        self.assertEqual(self.store.find_artifact_ids_by_value(142, "42"), [42])
+        self.assertEqual(self.store.get_artifact(1), None)
+
+    def test_upsert_replaces_previous_data(self):
+        self.store.upsert_artifact(self.artifact)
+        self.store.upsert_artifact(self.artifact)
+        self.assertEqual(len(self.store.get_values(42)), 2)
+        self.assertEqual(self.store.execute("SELECT COUNT(*) FROM artifact_links"), [(3,)])
+
+    def test_links(self):
+        self.store.upsert_artifacts([self.artifact, self.crossrefs_artifact])
+        self.assertEqual([link[0] for link in self.store.get_links(42)], [101, 102])
+        self.assertEqual(self.store.get_reverse_links(26808), [(25714, None),
+                                                               (26754, "_is_child")])
+        self.assertEqual(self.store.get_links(25714), [(26808, None)])
+
+    def test_git_references(self):
+        self.store.upsert_artifact(self.crossrefs_artifact)
+        reference = "git #tuleap/stable/8e6896fa659ad7bea33a042fe3d5e0c395c10dc8"
+        self.assertEqual(self.store.find_artifact_ids_by_git_reference(reference), [26808])
+        self.assertEqual(len(self.store.get_git_references(26808)), 3)
+
+    def test_mirror_and_sync_tracker(self):
+        tracker = FakeTracker([self.artifact])
+        self.assertEqual(self.store.mirror_tracker(tracker, 6), 1)
+        self.assertEqual(self.store.sync_tracker(tracker, 6), 1)
+        self.assertEqual(tracker.expert_queries,
+                         [None, '@last_update_date >= "{:}"'.format(
+                             self.artifact["last_modified_date"][:10])])
+
+
+if __name__ == '__main__':
+    unittest.main()
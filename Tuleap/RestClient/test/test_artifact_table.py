@@ -0,0 +1,72 @@
+import json
+import pickle
+import unittest
+
+from Tuleap.RestClient.ArtifactTable import parse_artifact_page
+
+
+class ArtifactTableTest(unittest.TestCase):
+    def setUp(self):
+        items = []
+
+        for file_name in ["request_artifact_response.txt", "artifact_response_crossrefs.txt"]:
+            request_file = open("Tuleap/RestClient/test/" + file_name, "r")
+            items.append(json.loads(request_file.read()))
+            request_file.close()
+
+        self.items = items
+        self.table = parse_artifact_page(items)
+
+    def test_rows(self):
+        self.assertEqual(self.table.get_row_count(), 2)
+        self.assertEqual(self.table.get_artifact_ids().tolist(), [42, 26808])
+        self.assertEqual(self.table.get_project_ids().tolist(), [7, 101])
+
+    def test_columns(self):
+        column = self.table.get_column(1245)
+        self.assertEqual(column.get_type(), "ID")
+        self.assertEqual(column.get_values().tolist(), [0, 1338])
+        self.assertEqual(list(column.get_mask()), [0, 1])
+        self.assertEqual(column.to_list(), [None, 1338])
+        self.assertEqual(self.table.get_column(153).to_list(), ["Display error on name field", None])
+        self.assertEqual(self.table.get_column_names()[142], "Artifact ID (142)")
+
+    def test_links_and_git_references(self):
+        sources, targets, types = self.table.get_link_edges()
+        self.assertEqual((sources.tolist(), targets.tolist()), ([42, 42], [101, 102]))
+        sources, targets, types = self.table.get_reverse_link_edges()
+        self.assertEqual(sources.tolist(), [21, 25714, 26754])
+        self.assertEqual([self.table.get_link_type_name(code) for code in types],
+                         [None, None, "_is_child"])
+        artifact_ids, directions, references = self.table.get_git_references()
+        self.assertEqual(artifact_ids.tolist(), [26808, 26808, 26808])
+        self.assertEqual(list(directions), [0, 0, 0])
+
+    def test_pickle(self):
+        table = pickle.loads(pickle.dumps(self.table))
+        self.assertEqual(table.get_column(1221).to_list(), [None, 26808])
+        self.assertEqual([table.get_link_type_name(code)
+                          for code in table.get_reverse_link_edges()[2]],
+                         [None, None, "_is_child"])
+
+    def test_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+
+        arrays = self.table.to_numpy()
+        self.assertEqual(arrays["artifact_id"].tolist(), [42, 26808])
+        self.assertIsInstance(arrays["Artifact ID (142)"], numpy.ma.MaskedArray)
+        self.assertEqual(arrays["Artifact ID (142)"].tolist(), [42, None])
+
+        # The table can still be extended, the exported arrays do not change
+        self.table.add_page(self.items)
+        self.table.add_artifact(self.items[0])
+        self.assertEqual(self.table.get_artifact_ids().tolist(), [42, 26808, 42, 26808, 42])
+        self.assertEqual(arrays["artifact_id"].tolist(), [42, 26808])
+        self.assertEqual(len(self.table.to_numpy()["Artifact ID (142)"]), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
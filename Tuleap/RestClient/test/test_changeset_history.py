@@ -0,0 +1,119 @@
+import json
+import os
+import unittest
+
+from Tuleap.RestClient.ChangesetHistory import ChangesetHistory, ChangesetTimeline
+from Tuleap.RestClient.Commons import FieldsToFetch
+
+
+def load_changesets():
+    with open(os.path.join(os.path.dirname(__file__), "changesets_response.txt"), "r") as file:
+        return json.load(file)
+
+
+T1 = "2026-01-05T10:00:00+01:00"
+T2 = "2026-01-06T09:30:00+01:00"
+T3 = "2026-01-08T16:45:00+01:00"
+
+EXPECTED_ROWS = [(T1, 101, None, "Initial"),
+                 (T1, 102, None, "New"),
+                 (T1, 103, None, "3"),
+                 (T2, 102, "New", "Open"),
+                 (T2, None, None, "Started"),
+                 (T3, 101, "Initial", "Final title"),
+                 (T3, 103, "3", "5"),
+                 (T3, None, None, "Done")]
+
+
+class FakeResponse(object):
+    def __init__(self, text, count):
+        self.text = text
+        self.headers = {"X-PAGINATION-SIZE": str(count)}
+
+
+class FakeConnection(object):
+    """
+    Serves the fixture changesets page by page for every artifact, except for the failing ones
+    """
+
+    def __init__(self, changesets, failing=(), error=None):
+        self.changesets = changesets
+        self.failing = failing
+        self.error = error
+        self.requests = []
+        self._lastResponseMessage = None
+
+    def is_logged_in(self):
+        return True
+
+    def clone(self):
+        connection = FakeConnection(self.changesets, self.failing, self.error)
+        connection.requests = self.requests
+        return connection
+
+    def call_get_method(self, relative_url, parameters=None):
+        artifact_id = int(relative_url.split("/")[2])
+        self.requests.append((artifact_id, parameters["offset"], parameters["limit"]))
+
+        if self.error is not None:
+            raise self.error
+
+        if artifact_id in self.failing:
+            return False
+
+        page = self.changesets[parameters["offset"]:parameters["offset"] + parameters["limit"]]
+        self._lastResponseMessage = FakeResponse(json.dumps(page), len(self.changesets))
+        return True
+
+    def get_last_response_message(self):
+        return self._lastResponseMessage
+
+
+class ChangesetTimelineTest(unittest.TestCase):
+    def test_rows(self):
+        timeline = ChangesetTimeline()
+
+        for changeset in load_changesets():
+            timeline.add_changeset(changeset)
+
+        self.assertEqual(timeline.get_rows(), EXPECTED_ROWS)
+        self.assertEqual(timeline.get_field_rows(102), [(T1, 102, None, "New"),
+                                                        (T2, 102, "New", "Open")])
+        self.assertEqual(timeline.get_field_rows(None), [(T2, None, None, "Started"),
+                                                         (T3, None, None, "Done")])
+        self.assertEqual(timeline.get_current_values(), {101: "Final title",
+                                                         102: "Open",
+                                                         103: "5"})
+
+    def test_comments_only(self):
+        timeline = ChangesetTimeline(comments_only=True)
+
+        for changeset in load_changesets():
+            timeline.add_changeset(changeset)
+
+        self.assertEqual(timeline.get_rows(), [(T2, None, None, "Started"),
+                                               (T3, None, None, "Done")])
+        self.assertEqual(timeline.get_current_values(), dict())
+
+
+class ChangesetHistoryTest(unittest.TestCase):
+    def test_request_timelines(self):
+        connection = FakeConnection(load_changesets(), failing=(2,))
+        history = ChangesetHistory(connection, max_workers=2)
+        self.assertFalse(history.request_timelines([1, 2, 3], limit=2))
+        self.assertEqual(history.get_failed_artifact_ids(), [2])
+        self.assertEqual(sorted(history.get_data()), [1, 3])
+        self.assertEqual(history.get_data()[3].get_rows(), EXPECTED_ROWS)
+        self.assertEqual(sorted(request for request in connection.requests if request[0] == 1),
+                         [(1, 0, 2), (1, 2, 2)])
+
+    def test_programming_errors_are_raised(self):
+        connection = FakeConnection(load_changesets(), error=KeyError("offset"))
+        history = ChangesetHistory(connection)
+
+        with self.assertRaises(KeyError):
+            history.request_timelines([1], fields_to_fetch=FieldsToFetch.Comments)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+from array import array
+
+from Tuleap.RestClient import ColumnFilter
+from Tuleap.RestClient.ArtifactTable import parse_artifact_page
+from Tuleap.RestClient.ColumnFilter import RowMask, get_table_columns
+from Tuleap.RestClient.Filter import CaseSensitivity, ComparisonOperation, FilterQuery, \
+    LogicalOperation, MissingValue, Negation, NumericFilterItem, NumericInRangeFilterItem, \
+    NumericOutOfRangeFilterItem, StringComparisonOperation, StringFilterItem
+
+
+def make_query():
+    return FilterQuery([FilterQuery([NumericFilterItem("points",
+                                                       ComparisonOperation.GreaterThanOrEqualTo,
+                                                       3),
+                                     StringFilterItem("status",
+                                                      StringComparisonOperation.StartsWith,
+                                                      "open",
+                                                      CaseSensitivity.CaseInsensitive)],
+                                    LogicalOperation.Or),
+                        NumericOutOfRangeFilterItem("effort", 2.0, True, 4.0, False),
+                        FilterQuery([StringFilterItem("status",
+                                                      StringComparisonOperation.EqualTo,
+                                                      "Closed")],
+                                    LogicalOperation.And,
+                                    Negation.Enabled)],
+                       LogicalOperation.And)
+
+
+class ColumnFilterTest(unittest.TestCase):
+    def setUp(self):
+        self.rows = [{"points": index % 6,
+                      "effort": (index * 0.7) % 5,
+                      "status": ["Open", "Closed", "opened", "New"][index % 4]}
+                     for index in range(50)]
+        self.columns = {"points": array('q', [row["points"] for row in self.rows]),
+                        "effort": [row["effort"] for row in self.rows],
+                        "status": [row["status"] for row in self.rows]}
+        self.numpy_module = list(ColumnFilter._NUMPY_MODULE)
+
+    def tearDown(self):
+        ColumnFilter._NUMPY_MODULE[:] = self.numpy_module
+
+    def backends(self):
+        backends = [None]
+
+        try:
+            import numpy
+            backends.append(numpy)
+        except ImportError:
+            pass
+
+        for numpy in backends:
+            ColumnFilter._NUMPY_MODULE[:] = [numpy]
+            yield numpy
+
+    def test_same_results_as_execute(self):
+        query = make_query()
+        expected = [query.execute(row) for row in self.rows]
+
+        for numpy in self.backends():
+            mask = query.execute_columns(self.columns)
+            self.assertEqual(mask.is_numpy(), numpy is not None)
+            self.assertEqual(mask.to_list(), expected)
+            self.assertEqual(mask.count(), sum(expected))
+            self.assertEqual(mask.get_indices(),
+                             [index for index, value in enumerate(expected) if value])
+
+    def test_numpy_string_columns(self):
+        query = make_query()
+        expected = [query.execute(row) for row in self.rows]
+
+        for numpy in self.backends():
+            if numpy is None:
+                continue
+
+            columns = dict(self.columns)
+            columns["status"] = numpy.array(columns["status"])
+            columns["effort"] = numpy.array(columns["effort"])
+            self.assertEqual(query.execute_columns(columns).to_list(), expected)
+
+    def test_missing_values(self):
+        columns = {"points": [1, None, 5], "status": ["a", None, "b"]}
+
+        for _ in self.backends():
+            not_equal = NumericFilterItem("points", ComparisonOperation.NotEqualTo, 1)
+            self.assertEqual(not_equal.match_columns(columns).to_list(), [False, True, True])
+            greater = NumericFilterItem("points", ComparisonOperation.GreaterThan, 0)
+            self.assertEqual(greater.match_columns(columns).to_list(), [True, False, True])
+            in_range = NumericInRangeFilterItem("points", 0, True, 9, True)
+            self.assertEqual((~in_range.match_columns(columns)).to_list(), [False, True, False])
+            self.assertEqual(NumericInRangeFilterItem("other", 0, True, 1, True)
+                             .match_columns(columns).count(), 0)
+            contains = StringFilterItem("status", StringComparisonOperation.Contains, "A",
+                                        CaseSensitivity.CaseInsensitive)
+            self.assertEqual(contains.match_columns(columns).to_list(), [True, False, False])
+
+    def test_out_of_range_parity(self):
+        values = [None, "x", 5, 20, -1, 0, 10, float("nan"), [1]]
+        rows = [{"k": value} for value in values]
+
+        for missing_value in MissingValue:
+            query_item = NumericOutOfRangeFilterItem("k", 0, True, 10, False, missing_value)
+            expected = []
+
+            # Rows for which "match" raises an exception do not match
+            for row in rows:
+                try:
+                    expected.append(query_item.match(row))
+                except (KeyError, TypeError):
+                    expected.append(False)
+
+            for numpy in self.backends():
+                self.assertEqual(query_item.match_columns({"k": values}).to_list(), expected)
+
+                if numpy is not None:
+                    numeric = numpy.array([5, 20, -1, 0, 10, float("nan")])
+                    self.assertEqual(query_item.match_columns({"k": numeric}).to_list(),
+                                     expected[2:8])
+
+        query_item = NumericOutOfRangeFilterItem("k", 0, True, 10, True, MissingValue.Raise)
+
+        for _ in self.backends():
+            self.assertEqual(query_item.match_columns({"k": [None, "x", 5, 20]}).to_list(),
+                             [False, False, False, True])
+
+    def test_artifact_table(self):
+        items = [{"id": index,
+                  "project": {"id": 1},
+                  "tracker": {"id": 2},
+                  "values": [{"field_id": 10, "type": "int", "label": "Points",
+                              "value": index if index % 3 else None}]}
+                 for index in range(12)]
+        table = parse_artifact_page(items)
+        query = FilterQuery([NumericFilterItem("Points", ComparisonOperation.LessThan, 7),
+                             NumericFilterItem("artifact_id", ComparisonOperation.GreaterThan,
+                                               1)],
+                            LogicalOperation.And)
+
+        for _ in self.backends():
+            mask = query.execute_columns(get_table_columns(table))
+            self.assertEqual(mask.get_indices(), [2, 4, 5])
+
+    def test_mixed_masks(self):
+        for numpy in self.backends():
+            if numpy is None:
+                continue
+
+            bitset = RowMask(4, 0b0101)
+            self.assertEqual((RowMask.from_bools([True, True, False, False]) & bitset).to_list(),
+                             [True, False, False, False])
+            self.assertEqual((bitset | RowMask.full(4, False)).get_indices(), [0, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import json
+import pickle
+import unittest
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.CompactArtifact import CompactArtifact
+
+
+class CompactArtifactTest(unittest.TestCase):
+    def setUp(self):
+        self.items = []
+
+        for file_name in ["request_artifact_response.txt", "artifact_response_crossrefs.txt"]:
+            request_file = open("Tuleap/RestClient/test/" + file_name, "r")
+            self.items.append(json.loads(request_file.read()))
+            request_file.close()
+
+    def assert_same_as_artifact_parser(self, artifact, item):
+        expected = ArtifactParser(item)
+
+        for accessor in ["is_valid", "get_name", "get_project_id", "get_tracker_id", "get_values",
+                         "get_links", "get_links_types", "get_reverse_links",
+                         "get_reverse_links_types", "get_in_git_references",
+                         "get_out_git_references"]:
+            self.assertEqual(getattr(artifact, accessor)(), getattr(expected, accessor)(), accessor)
+
+    def test_accessor_compatibility(self):
+        for item in self.items:
+            self.assert_same_as_artifact_parser(CompactArtifact(item), item)
+
+    def test_values(self):
+        value = CompactArtifact(self.items[0]).get_values()[0]
+        self.assertEqual(value['label'], "Summary")
+        self.assertEqual(value.label, "Summary")
+        self.assertEqual(value.get('unknown'), None)
+        self.assertEqual(dict(value), {'id': 153, 'value': 'Display error on name field',
+                                       'type': 'TEXT', 'label': 'Summary'})
+
+    def test_pickle(self):
+        for item in self.items:
+            self.assert_same_as_artifact_parser(pickle.loads(pickle.dumps(CompactArtifact(item))),
+                                                item)
+
+
+if __name__ == '__main__':
+    unittest.main()
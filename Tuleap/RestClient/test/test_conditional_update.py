@@ -0,0 +1,127 @@
+import json
+import unittest
+from unittest import mock
+
+from Tuleap.RestClient.Artifacts import Artifacts
+from Tuleap.RestClient.Commons import ConflictResolution
+from Tuleap.RestClient.Connection import Connection
+
+
+class FakeResponse(object):
+    def __init__(self, data=None, status_code=200, headers=None):
+        self.text = json.dumps(data if data is not None else {})
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+
+
+class FakeConnection(object):
+    """
+    Artifact whose version changes on every read, the PUT responses are taken from a list of status
+    codes
+    """
+
+    def __init__(self, put_status_codes, etag=True):
+        self.put_status_codes = list(put_status_codes)
+        self.etag = etag
+        self.version = 0
+        self.puts = []
+        self._lastResponseMessage = None
+
+    def is_logged_in(self):
+        return True
+
+    def call_get_method(self, relative_url, parameters=None):
+        self.version += 1
+        headers = {"ETag": "v{:}".format(self.version)} if self.etag else {}
+        self._lastResponseMessage = FakeResponse({"id": 1, "version": self.version},
+                                                 headers=headers)
+        return True
+
+    def call_put_method(self, relative_url, data=None, headers=None):
+        status_code = self.put_status_codes.pop(0)
+        self.puts.append((headers, data["values"]))
+        self._lastResponseMessage = FakeResponse(status_code=status_code)
+        return status_code == 200
+
+    def get_last_response_message(self):
+        return self._lastResponseMessage
+
+
+VALUES = [{"field_id": 5, "value": "new"}]
+
+
+class ConditionalUpdateTest(unittest.TestCase):
+    def test_update(self):
+        connection = FakeConnection([200])
+        artifacts = Artifacts(connection)
+        self.assertTrue(artifacts.update_artifact_conditionally(1, VALUES))
+        self.assertFalse(artifacts.has_conflict())
+        self.assertEqual(connection.puts, [({"If-Match": "v1"}, VALUES)])
+
+    def test_report_conflict(self):
+        connection = FakeConnection([412])
+        artifacts = Artifacts(connection)
+        self.assertFalse(artifacts.update_artifact_conditionally(
+            1, VALUES, conflict_resolution=ConflictResolution.Report))
+        self.assertTrue(artifacts.has_conflict())
+        self.assertEqual(len(connection.puts), 1)
+
+    def test_retry(self):
+        connection = FakeConnection([412, 200])
+        artifacts = Artifacts(connection)
+        self.assertTrue(artifacts.update_artifact_conditionally(1, VALUES))
+        self.assertFalse(artifacts.has_conflict())
+        self.assertEqual([headers for headers, _ in connection.puts],
+                         [{"If-Match": "v1"}, {"If-Match": "v2"}])
+
+    def test_retry_limit(self):
+        connection = FakeConnection([412, 412, 412])
+        artifacts = Artifacts(connection)
+        self.assertFalse(artifacts.update_artifact_conditionally(1, VALUES, max_retries=2))
+        self.assertTrue(artifacts.has_conflict())
+        self.assertEqual(len(connection.puts), 3)
+
+    def test_reapply_values(self):
+        connection = FakeConnection([412, 200, 412])
+        artifacts = Artifacts(connection)
+
+        def reapply_values(artifact, values):
+            return [{"field_id": 5, "value": "new {:}".format(artifact["version"])}]
+
+        self.assertTrue(artifacts.update_artifact_conditionally(1, VALUES,
+                                                                reapply_values=reapply_values))
+        self.assertEqual(connection.puts[1], ({"If-Match": "v2"},
+                                              [{"field_id": 5, "value": "new 2"}]))
+
+        # Nothing left to change after the conflict
+        self.assertTrue(artifacts.update_artifact_conditionally(1, VALUES,
+                                                                reapply_values=lambda a, v: []))
+        self.assertEqual(len(connection.puts), 3)
+
+    def test_missing_version_token(self):
+        connection = FakeConnection([200], etag=False)
+        artifacts = Artifacts(connection)
+
+        with self.assertRaises(Exception):
+            artifacts.update_artifact_conditionally(1, VALUES)
+
+        self.assertEqual(connection.puts, [])
+
+    def test_put_headers(self):
+        connection = Connection()
+        connection.set_access_key("https://tuleap.example.com/api", "key")
+
+        with mock.patch("Tuleap.RestClient.Connection.requests.put") as put:
+            put.return_value = FakeResponse(status_code=412)
+            self.assertFalse(connection.call_put_method("/artifacts/1",
+                                                        data={"values": VALUES},
+                                                        headers={"If-Match": "v1"}))
+
+        self.assertEqual(put.call_args[1]["headers"],
+                         {"X-Auth-AccessKey": "key", "If-Match": "v1"})
+        self.assertEqual(put.call_args[1]["json"], {"values": VALUES})
+        self.assertEqual(connection.get_last_response_message().status_code, 412)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from Tuleap.RestClient.ArtifactGraph import ArtifactGraphCrawler
+from Tuleap.RestClient.CrawlCheckpoint import CrawlCheckpoint
+from Tuleap.RestClient.Pagination import iterate_items, iterate_pages
+from Tuleap.RestClient.test.test_artifact_graph import FakeConnection, make_artifact
+from Tuleap.RestClient.test.test_pagination import FakeProjects
+
+
+class FakeList(object):
+    def __init__(self, items, fail_at=None):
+        self.items = items
+        self.fail_at = fail_at
+        self.offsets = []
+        self._data = None
+
+    def request_items(self, tracker_id, limit=10, offset=None):
+        if offset == self.fail_at:
+            return False
+
+        self.offsets.append(offset)
+        self._data = self.items[offset:offset + limit]
+        return True
+
+    def get_data(self):
+        return self._data
+
+    def get_count(self):
+        return len(self.items)
+
+
+class PaginationCheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "crawl.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_resume(self):
+        owner = FakeList(list(range(25)), fail_at=20)
+        checkpoint = CrawlCheckpoint(self.path)
+        result = []
+
+        with self.assertRaises(Exception):
+            for item in iterate_items(owner.request_items, 7, limit=10, checkpoint=checkpoint):
+                result.append(item)
+
+        checkpoint.close()
+        self.assertEqual(result, list(range(20)))
+
+        # Continue with a new checkpoint object on the same file
+        owner = FakeList(list(range(25)))
+        checkpoint = CrawlCheckpoint(self.path)
+        result = list(iterate_items(owner.request_items, 7, limit=10, checkpoint=checkpoint))
+        self.assertEqual(result, list(range(20, 25)))
+        self.assertEqual(owner.offsets, [20])
+
+        # Completed crawl, other parameters are an independent crawl
+        self.assertEqual(list(iterate_pages(owner.request_items, 7, checkpoint=checkpoint)), [])
+        self.assertEqual(len(list(iterate_items(owner.request_items, 8, limit=10,
+                                                checkpoint=checkpoint))), 25)
+
+        checkpoint.clear()
+        self.assertEqual(len(list(iterate_items(owner.request_items, 7, limit=10,
+                                                checkpoint=checkpoint))), 25)
+        checkpoint.close()
+
+    def test_unfinished_page_is_repeated(self):
+        owner = FakeList(list(range(25)))
+        checkpoint = CrawlCheckpoint()
+        pages = iterate_pages(owner.request_items, 7, limit=10, checkpoint=checkpoint)
+        self.assertEqual(next(pages)[0], 0)
+        self.assertEqual(next(pages)[0], 10)
+        pages.close()
+
+        self.assertEqual([offset for offset, _ in iterate_pages(owner.request_items, 7, limit=10,
+                                                               checkpoint=checkpoint)],
+                         [10, 20])
+        self.assertTrue(checkpoint.is_complete(
+            CrawlCheckpoint.make_page_key(owner.request_items, (7,), {"limit": 10})))
+
+    def test_nested_walk_on_same_owner(self):
+        owner = FakeProjects(10, 2)
+        checkpoint = CrawlCheckpoint()
+        projects = []
+        trackers = []
+
+        def crawl(stop_at=None):
+            for project_id in iterate_items(owner.request_projects, limit=3,
+                                            checkpoint=checkpoint):
+                projects.append(project_id)
+                trackers.extend(iterate_items(owner.request_trackers, project_id, limit=3,
+                                              checkpoint=checkpoint))
+
+                if project_id == stop_at:
+                    raise KeyboardInterrupt()
+
+        with self.assertRaises(KeyboardInterrupt):
+            crawl(stop_at=4)
+
+        self.assertEqual(projects, [0, 1, 2, 3, 4])
+
+        # The unfinished page (3, 4, 5) is repeated, the completed tracker walks are not
+        crawl()
+        self.assertEqual(projects, [0, 1, 2, 3, 4, 3, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(sorted(trackers), sorted("{:}-{:}".format(project_id, index)
+                                                  for project_id in range(10)
+                                                  for index in range(2)))
+
+        crawl()
+        self.assertEqual(len(projects), 12)
+
+
+class CrawlerCheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self.artifacts = {1: make_artifact(1, [(2, "_is_child"), (3, None)]),
+                          2: make_artifact(2, [(4, "_is_child")]),
+                          3: make_artifact(3, []),
+                          4: make_artifact(4, [(1, "_is_child"), (5, None)]),
+                          5: make_artifact(5, [])}
+
+    def test_resume(self):
+        checkpoint = CrawlCheckpoint()
+        available = dict(self.artifacts)
+        del available[4]
+        connection = FakeConnection(available)
+        crawler = ArtifactGraphCrawler(connection, max_workers=2)
+        self.assertFalse(crawler.crawl([1], checkpoint=checkpoint, checkpoint_interval=1))
+        self.assertEqual(crawler.get_failed_artifact_ids(), [4])
+
+        connection = FakeConnection(self.artifacts)
+        crawler = ArtifactGraphCrawler(connection, max_workers=2)
+        self.assertTrue(crawler.crawl([1], checkpoint=checkpoint))
+        self.assertEqual(sorted(connection.requested), [4, 5])
+        graph = crawler.get_data()
+        self.assertEqual(graph.get_artifact_ids(), [1, 2, 3, 4, 5])
+        self.assertEqual(graph.get_edge_count(), 5)
+
+        # Completed crawl is rebuilt from the checkpoint
+        connection = FakeConnection(self.artifacts)
+        crawler = ArtifactGraphCrawler(connection)
+        self.assertTrue(crawler.crawl([1], checkpoint=checkpoint))
+        self.assertEqual(connection.requested, [])
+        self.assertEqual(crawler.get_data().get_edges(), graph.get_edges())
+
+    def test_max_depth(self):
+        checkpoint = CrawlCheckpoint()
+        connection = FakeConnection(self.artifacts)
+        crawler = ArtifactGraphCrawler(connection)
+        self.assertTrue(crawler.crawl([1], max_depth=1, checkpoint=checkpoint))
+        self.assertEqual(connection.requested, [1])
+        self.assertEqual(crawler.get_data().get_artifact_ids(), [1, 2, 3])
+
+        # Other parameters are a new crawl
+        self.assertTrue(crawler.crawl([1], max_depth=2, checkpoint=checkpoint))
+        self.assertEqual(sorted(connection.requested), [1, 1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import datetime
+import unittest
+
+from Tuleap.RestClient.Filter import CaseSensitivity, ComparisonOperation, FilterQuery, \
+    LogicalOperation, MissingValue, Negation, NumericFilterItem, NumericInRangeFilterItem, \
+    NumericOutOfRangeFilterItem, StringComparisonOperation, StringFilterItem
+from Tuleap.RestClient.FilterPushdown import plan_pushdown
+
+FIELD_MAP = {"points": "story_points", "effort": "remaining_effort", "status": ("status", "sb"),
+             "summary": ("title", "string"), "due": "due_date"}
+
+
+class FakeTracker(object):
+    def __init__(self, items):
+        self.items = items
+        self.expert_queries = []
+        self.data = []
+
+    def request_artifact_list(self, tracker_id, limit=None, offset=None, expert_query=None, **_):
+        self.expert_queries.append(expert_query)
+        self.data = self.items[offset:offset + limit]
+        return True
+
+    def get_data(self):
+        return self.data
+
+    def get_count(self):
+        return len(self.items)
+
+
+class FilterPushdownTest(unittest.TestCase):
+    def test_exact_query(self):
+        plan = plan_pushdown(FilterQuery([NumericFilterItem("points",
+                                                            ComparisonOperation.GreaterThan, 3),
+                                          NumericInRangeFilterItem("effort", 1, True, 5.5, True)],
+                                         LogicalOperation.And),
+                             FIELD_MAP)
+        self.assertEqual(plan.get_expert_query(),
+                         "story_points > 3 AND remaining_effort BETWEEN(1, 5.5)")
+        self.assertTrue(plan.is_exact())
+        self.assertTrue(plan.matches({}))
+
+    def test_residual_query(self):
+        string_item = StringFilterItem("summary", StringComparisonOperation.EqualTo, 'say "hi"')
+        local_item = NumericFilterItem("unmapped", ComparisonOperation.EqualTo, 1)
+        out_of_range = NumericOutOfRangeFilterItem("points", 1, True, 3, True)
+        query = FilterQuery([string_item,
+                             local_item,
+                             out_of_range,
+                             FilterQuery([NumericFilterItem("points",
+                                                            ComparisonOperation.LessThan, 2),
+                                          NumericInRangeFilterItem("effort", 1, False, 2, True)],
+                                         LogicalOperation.Or)],
+                            LogicalOperation.And)
+        plan = plan_pushdown(query, FIELD_MAP)
+        self.assertEqual(plan.get_expert_query(),
+                         'title = "say \\"hi\\"" AND (story_points < 2 OR '
+                         '(remaining_effort > 1 AND remaining_effort <= 2))')
+        self.assertFalse(plan.is_exact())
+        self.assertEqual(plan.get_residual_query().get_query_items(),
+                         [string_item, local_item, out_of_range])
+
+        item = {"summary": 'say "hi"', "unmapped": 1, "points": 0, "effort": 0}
+        self.assertEqual(plan.matches(item), query.execute(item))
+
+    def test_not_pushed(self):
+        query = FilterQuery([NumericFilterItem("points", ComparisonOperation.NotEqualTo, 3)],
+                            LogicalOperation.And,
+                            Negation.Enabled)
+        plan = plan_pushdown(query, FIELD_MAP)
+        self.assertEqual(plan.get_expert_query(), None)
+        self.assertIs(plan.get_residual_query(), query)
+
+        plan = plan_pushdown(FilterQuery([StringFilterItem("status",
+                                                           StringComparisonOperation.Contains,
+                                                           "Open"),
+                                          StringFilterItem("summary",
+                                                           StringComparisonOperation.NotEqualTo,
+                                                           "x",
+                                                           CaseSensitivity.CaseInsensitive)],
+                                         LogicalOperation.Or),
+                             FIELD_MAP)
+        self.assertEqual(plan.get_expert_query(), None)
+
+        plan = plan_pushdown(FilterQuery([NumericFilterItem("points", ComparisonOperation.LessThan,
+                                                            3, MissingValue.Match)],
+                                         LogicalOperation.And),
+                             FIELD_MAP)
+        self.assertEqual(plan.get_expert_query(), None)
+
+    def test_string_fields(self):
+        for key, operation, value in (("status", StringComparisonOperation.EqualTo, "Open"),
+                                      ("status", StringComparisonOperation.Contains, "Open"),
+                                      ("summary", StringComparisonOperation.EqualTo, ""),
+                                      ("summary", StringComparisonOperation.Contains, "")):
+            string_item = StringFilterItem(key, operation, value)
+            plan = plan_pushdown(FilterQuery([string_item], LogicalOperation.And), FIELD_MAP)
+            self.assertEqual(plan.get_expert_query(), None)
+            self.assertEqual(plan.get_residual_query().get_query_items(), [string_item])
+
+        # Without a field type the key is not known as a text field
+        plan = plan_pushdown(FilterQuery([StringFilterItem("summary",
+                                                           StringComparisonOperation.StartsWith,
+                                                           "Fix")],
+                                         LogicalOperation.And),
+                             {"summary": "title"})
+        self.assertEqual(plan.get_expert_query(), None)
+
+        plan = plan_pushdown(FilterQuery([StringFilterItem("summary",
+                                                           StringComparisonOperation.StartsWith,
+                                                           "Fix")],
+                                         LogicalOperation.And),
+                             {"summary": ("title", "text")})
+        self.assertEqual(plan.get_expert_query(), 'title = "Fix"')
+        self.assertFalse(plan.is_exact())
+
+    def test_dates(self):
+        plan = plan_pushdown(FilterQuery([NumericFilterItem("due",
+                                                            ComparisonOperation.GreaterThan,
+                                                            datetime.datetime(2018, 1, 2, 10))],
+                                         LogicalOperation.And),
+                             FIELD_MAP)
+        self.assertEqual(plan.get_expert_query(), 'due_date >= "2018-01-02"')
+        self.assertFalse(plan.is_exact())
+
+    def test_iterate_artifacts(self):
+        # The server selects the artifacts with story_points > 4
+        tracker = FakeTracker([{"id": index, "points": index} for index in range(5, 9)])
+        plan = plan_pushdown(FilterQuery([NumericFilterItem("points",
+                                                            ComparisonOperation.GreaterThan, 4),
+                                          NumericFilterItem("id", ComparisonOperation.LessThan,
+                                                            6)],
+                                         LogicalOperation.And),
+                             FIELD_MAP)
+        self.assertEqual([item["id"] for item in plan.iterate_artifacts(tracker, 20, limit=3)],
+                         [5])
+        self.assertEqual(tracker.expert_queries, ["story_points > 4"] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
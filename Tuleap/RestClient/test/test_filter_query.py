@@ -0,0 +1,177 @@
+import pickle
+import unittest
+
+from Tuleap.RestClient.Filter import CaseSensitivity, ComparisonOperation, FilterQuery, KeyPath, \
+    LogicalOperation, MissingValue, Negation, NumericFilterItem, NumericInRangeFilterItem, \
+    NumericOutOfRangeFilterItem, StringComparisonOperation, StringFilterItem
+
+
+class FilterQueryCompileTest(unittest.TestCase):
+    def setUp(self):
+        self.items = [{"id": index,
+                       "points": index % 7,
+                       "effort": (index * 3) % 11 if index % 5 else None,
+                       "status": ["New", "Open", "closed", "CLOSED"][index % 4],
+                       "summary": ["Display error", "Fix link", "Error in report"][index % 3]}
+                      for index in range(60)]
+
+    def assert_same_results(self, query):
+        predicate = query.compile()
+        self.assertEqual([predicate(item) for item in self.items],
+                         [query.execute(item) for item in self.items])
+
+    def test_numeric_items(self):
+        for operation in ComparisonOperation:
+            self.assert_same_results(FilterQuery([NumericFilterItem("points", operation, 3)],
+                                                 LogicalOperation.And))
+
+        for included in [(False, False), (True, False), (False, True), (True, True)]:
+            self.assert_same_results(FilterQuery([NumericInRangeFilterItem("effort", 2, included[0],
+                                                                           8, included[1])],
+                                                 LogicalOperation.And))
+            self.assert_same_results(FilterQuery([NumericOutOfRangeFilterItem("effort", 2,
+                                                                              included[0], 8,
+                                                                              included[1])],
+                                                 LogicalOperation.Or))
+
+    def test_string_items(self):
+        for operation in StringComparisonOperation:
+            for case_sensitivity in [CaseSensitivity.CaseSensitive,
+                                     CaseSensitivity.CaseInsensitive]:
+                self.assert_same_results(FilterQuery([StringFilterItem("status", operation,
+                                                                       "Closed",
+                                                                       case_sensitivity)],
+                                                     LogicalOperation.And))
+
+    def test_nested_queries(self):
+        query = FilterQuery([StringFilterItem("summary",
+                                              StringComparisonOperation.Contains,
+                                              "ERROR",
+                                              CaseSensitivity.CaseInsensitive),
+                             FilterQuery([NumericFilterItem("points",
+                                                            ComparisonOperation.GreaterThan, 4),
+                                          NumericInRangeFilterItem("effort", 0, True, 3, True),
+                                          FilterQuery([StringFilterItem(
+                                              "status", StringComparisonOperation.EqualTo, "New")],
+                                              LogicalOperation.Or)],
+                                         LogicalOperation.Or),
+                             FilterQuery([NumericFilterItem("id", ComparisonOperation.LessThan,
+                                                            10)],
+                                         LogicalOperation.And,
+                                         Negation.Enabled)],
+                            LogicalOperation.And)
+        self.assert_same_results(query)
+        self.assert_same_results(FilterQuery([query], LogicalOperation.Or, Negation.Enabled))
+        self.assert_same_results(FilterQuery([], LogicalOperation.And))
+        self.assert_same_results(FilterQuery([], LogicalOperation.Or))
+
+    def test_missing_key(self):
+        predicate = FilterQuery([NumericFilterItem("missing", ComparisonOperation.EqualTo, 1)],
+                                LogicalOperation.And).compile()
+        self.assertRaises(KeyError, predicate, self.items[0])
+
+        predicate = FilterQuery([NumericInRangeFilterItem("missing", 0, True, 1, True)],
+                                LogicalOperation.And).compile()
+        self.assertFalse(predicate(self.items[0]))
+
+
+class MissingValueTest(unittest.TestCase):
+    def setUp(self):
+        self.items = [{"id": 1, "tracker": {"id": 20}, "status": "Open", "points": 3},
+                      {"id": 2, "tracker": {"id": 21}, "status": None, "points": "three"},
+                      {"id": 3, "status": 7},
+                      {"id": 4, "tracker": None, "tracker.id": 20, "values": [{"value": "a"}]}]
+
+    def assert_matches(self, query_item, expected_ids):
+        query = FilterQuery([query_item], LogicalOperation.And)
+        predicate = query.compile()
+        self.assertEqual([item["id"] for item in self.items if predicate(item)], expected_ids)
+        self.assertEqual([item["id"] for item in self.items if query.execute(item)], expected_ids)
+
+    def test_key_path(self):
+        self.assertEqual(KeyPath("tracker.id").get(self.items[0]), 20)
+        self.assertEqual(KeyPath("tracker.id").get(self.items[2], "none"), "none")
+        self.assertEqual(KeyPath("values.0.value").get(self.items[3]), "a")
+        self.assertIsNone(KeyPath("values.1.value").get(self.items[3]))
+
+        # A literal key takes precedence over the path
+        self.assertEqual(KeyPath("tracker.id").get(self.items[3]), 20)
+
+        key_path = pickle.loads(pickle.dumps(KeyPath("tracker.id")))
+        self.assertTrue(key_path.is_path())
+        self.assertEqual(key_path.get(self.items[1]), 21)
+
+    def test_numeric_items(self):
+        for missing_value, expected_ids in [(MissingValue.NoMatch, [1, 4]),
+                                            (MissingValue.Match, [1, 3, 4])]:
+            self.assert_matches(NumericFilterItem("tracker.id", ComparisonOperation.EqualTo, 20,
+                                                  missing_value),
+                                expected_ids)
+
+        # Type errors ("three" < 5) do not match, so they are out of range
+        self.assert_matches(NumericFilterItem("points", ComparisonOperation.LessThan, 5,
+                                              MissingValue.NoMatch),
+                            [1])
+        self.assert_matches(NumericInRangeFilterItem("points", 0, True, 5, True), [1])
+        self.assert_matches(NumericOutOfRangeFilterItem("points", 4, True, 5, True),
+                            [1, 2, 3, 4])
+        self.assert_matches(NumericOutOfRangeFilterItem("points", 4, True, 5, True,
+                                                        MissingValue.NoMatch),
+                            [1, 2])
+
+        item = NumericFilterItem("tracker.id", ComparisonOperation.EqualTo, 20)
+        self.assertRaises(KeyError, item.match, self.items[2])
+        self.assertRaises(KeyError, item.compile(), self.items[2])
+
+    def test_default_semantics(self):
+        # Same results as before the missing value semantics were added
+        items = [{"a": "abc"}, {"a": None}, {}, {"a": 3}, {"a": [1]}, {"a": 7}]
+
+        for query_item, expected in [
+                (NumericInRangeFilterItem("a", 1, True, 5, True),
+                 [False, False, False, True, False, False]),
+                (NumericOutOfRangeFilterItem("a", 1, True, 5, True),
+                 [True, True, True, False, True, True])]:
+            predicate = query_item.compile()
+            query = FilterQuery([query_item], LogicalOperation.And)
+            self.assertEqual([query_item.match(item) for item in items], expected)
+            self.assertEqual([predicate(item) for item in items], expected)
+            self.assertEqual([query.execute(item) for item in items], expected)
+
+        query_item = NumericOutOfRangeFilterItem("a", 1, True, 5, True)
+        self.assertEqual(query_item.match_columns({"a": ["abc", None, 3, 7]}).to_list(),
+                         [True, True, False, True])
+        self.assertEqual(query_item.match_columns({"b": [1, 2]}).to_list(), [True, True])
+
+        for query_item in [NumericFilterItem("a", ComparisonOperation.LessThan, 5),
+                           StringFilterItem("a", StringComparisonOperation.Contains, "b")]:
+            self.assertRaises(KeyError, query_item.match, {})
+            self.assertRaises(KeyError, query_item.compile(), {})
+
+    def test_string_items(self):
+        for missing_value, expected_ids in [(MissingValue.NoMatch, [1]),
+                                            (MissingValue.Match, [1, 2, 4])]:
+            self.assert_matches(StringFilterItem("status", StringComparisonOperation.StartsWith,
+                                                 "OP", CaseSensitivity.CaseInsensitive,
+                                                 missing_value),
+                                expected_ids)
+
+        item = StringFilterItem("status", StringComparisonOperation.EqualTo, "open",
+                                CaseSensitivity.CaseInsensitive)
+        self.assertRaises(AttributeError, item.compile(), self.items[2])
+
+    def test_match_columns(self):
+        columns = {"points": [3, None, 8]}
+        item = NumericFilterItem("points", ComparisonOperation.LessThan, 5, MissingValue.Match)
+        self.assertEqual(item.match_columns(columns).to_list(), [True, True, False])
+
+        item = StringFilterItem("status", StringComparisonOperation.EqualTo, "Open",
+                                missing_value=MissingValue.Match)
+        self.assertEqual(item.match_columns(columns).to_list(), [True, True, True])
+        self.assertRaises(KeyError, NumericFilterItem("status", ComparisonOperation.EqualTo,
+                                                      1).match_columns,
+                          columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
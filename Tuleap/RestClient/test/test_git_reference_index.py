@@ -0,0 +1,56 @@
+import json
+import unittest
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.GitReferenceIndex import GitReferenceIndex, parse_git_reference
+
+SHA_1 = "8e6896fa659ad7bea33a042fe3d5e0c395c10dc8"
+SHA_2 = "8cc1b6d8251e4b4d77e8ff128ab41f15ff3c022e"
+
+
+class GitReferenceIndexTest(unittest.TestCase):
+    def setUp(self):
+        request_file = open("Tuleap/RestClient/test/artifact_response_crossrefs.txt", "r")
+        self.item = json.loads(request_file.read())
+        request_file.close()
+
+    def test_parse_git_reference(self):
+        repository, sha = parse_git_reference("git #tuleap/stable/" + SHA_1)
+        self.assertEqual(repository, "tuleap/stable")
+        self.assertEqual(len(sha), 20)
+        self.assertEqual(parse_git_reference("gerrit #26009"), None)
+        self.assertEqual(parse_git_reference("git #tuleap/stable/xyz"), None)
+
+    def test_index_item(self):
+        index = GitReferenceIndex()
+        index.add_item(self.item)
+        artifact_id = self.item["id"]
+        self.assertEqual(index.get_commit_count(), 3)
+        self.assertEqual(index.get_artifact_ids(SHA_1), [artifact_id])
+        self.assertEqual(index.get_artifact_ids("git #tuleap/stable/" + SHA_2), [artifact_id])
+        self.assertEqual(index.get_artifact_ids(SHA_1, repository="other"), [])
+        self.assertIn(("tuleap/stable", SHA_1), index.get_commits(artifact_id))
+        self.assertEqual(index.get_repository_artifact_ids("tuleap/stable"), [artifact_id])
+
+        parsed_index = GitReferenceIndex()
+        parsed_index.add_parsed_artifact(artifact_id, ArtifactParser(self.item))
+        self.assertEqual(parsed_index.get_commits(artifact_id), index.get_commits(artifact_id))
+
+    def test_incremental_updates(self):
+        index = GitReferenceIndex()
+        index.set_references(1, ["git #repo/" + SHA_1, "git #repo/" + SHA_2, "git #repo/bad"])
+        index.set_references(2, ["git #repo/" + SHA_1])
+        self.assertEqual(index.get_artifact_ids(SHA_1), [1, 2])
+        self.assertEqual(index.get_invalid_reference_count(), 1)
+
+        index.set_references(1, ["git #repo/" + SHA_2])
+        self.assertEqual(index.get_artifact_ids(SHA_1), [2])
+        self.assertEqual(index.get_commits([1, 2]), [("repo", SHA_2), ("repo", SHA_1)])
+
+        index.remove_artifact(2)
+        self.assertEqual(index.get_artifact_ids(SHA_1), [])
+        self.assertEqual((index.get_artifact_count(), index.get_commit_count()), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from Tuleap.RestClient.Filter import CaseSensitivity, ComparisonOperation, FilterQuery, \
+    LogicalOperation, MissingValue, Negation, NumericFilterItem, NumericInRangeFilterItem, \
+    NumericOutOfRangeFilterItem, StringComparisonOperation, StringFilterItem
+from Tuleap.RestClient.IndexedCollection import IndexedCollection
+
+
+class IndexedCollectionTest(unittest.TestCase):
+    def setUp(self):
+        self.items = [{"id": index,
+                       "points": index % 7,
+                       "status": ["Open", "opened", "Closed", "New"][index % 4],
+                       "summary": "Display error {:}".format(index),
+                       "optional": index if index % 2 else None}
+                      for index in range(200)]
+        self.collection = IndexedCollection(self.items)
+
+    def assert_same_results(self, query):
+        self.assertEqual(self.collection.execute(query),
+                         [item for item in self.items if query.execute(item)])
+
+    def test_numeric_items(self):
+        for operation in ComparisonOperation:
+            self.assert_same_results(FilterQuery([NumericFilterItem("points", operation, 3)],
+                                                 LogicalOperation.And))
+
+        for included in [(False, False), (True, True), (True, False)]:
+            self.assert_same_results(FilterQuery([NumericInRangeFilterItem("id", 10, included[0],
+                                                                           50, included[1])],
+                                                 LogicalOperation.Or))
+            self.assert_same_results(FilterQuery([NumericOutOfRangeFilterItem("points", 2,
+                                                                              included[0], 4,
+                                                                              included[1])],
+                                                 LogicalOperation.And))
+
+    def test_string_items(self):
+        for operation in StringComparisonOperation:
+            for case_sensitivity in CaseSensitivity:
+                self.assert_same_results(FilterQuery([StringFilterItem("status", operation,
+                                                                       "Open",
+                                                                       case_sensitivity)],
+                                                     LogicalOperation.And))
+
+    def test_nested_query(self):
+        query = FilterQuery([NumericInRangeFilterItem("points", 1, True, 5, True),
+                             StringFilterItem("summary", StringComparisonOperation.EndsWith, "7"),
+                             FilterQuery([StringFilterItem("status",
+                                                           StringComparisonOperation.StartsWith,
+                                                           "OPEN",
+                                                           CaseSensitivity.CaseInsensitive),
+                                          NumericFilterItem("id", ComparisonOperation.GreaterThan,
+                                                            150)],
+                                         LogicalOperation.Or),
+                             FilterQuery([NumericFilterItem("points",
+                                                            ComparisonOperation.EqualTo, 3)],
+                                         LogicalOperation.And,
+                                         Negation.Enabled)],
+                            LogicalOperation.And)
+        self.assert_same_results(query)
+        self.assert_same_results(FilterQuery([query], LogicalOperation.Or, Negation.Enabled))
+        self.assertEqual(self.collection.explain(query)[2], "  summary EndsWith '7': scan")
+
+    def test_unindexable_values(self):
+        query = FilterQuery([NumericInRangeFilterItem("optional", 10, True, 20, True)],
+                            LogicalOperation.And)
+        self.assert_same_results(query)
+        self.assertEqual(self.collection.explain(query)[1], "  optional in [10, 20]: scan")
+
+        self.assert_same_results(FilterQuery([NumericFilterItem("optional",
+                                                                ComparisonOperation.EqualTo,
+                                                                None)],
+                                             LogicalOperation.And))
+
+    def test_missing_values(self):
+        for missing_value in (MissingValue.NoMatch, MissingValue.Match):
+            for operation in (ComparisonOperation.EqualTo, ComparisonOperation.NotEqualTo):
+                query = FilterQuery([NumericFilterItem("optional", operation, 3, missing_value)],
+                                    LogicalOperation.And)
+                self.assert_same_results(query)
+                self.assertEqual(self.collection.explain(query)[1][-5:], "index")
+
+    def test_add_items(self):
+        query = FilterQuery([NumericFilterItem("points", ComparisonOperation.EqualTo, 3)],
+                            LogicalOperation.And)
+        count = len(self.collection.execute(query))
+        self.assertEqual(self.collection.get_index_count(), 1)
+        self.collection.add_items([{"id": 1000, "points": 3}])
+        self.assertEqual(self.collection.get_index_count(), 0)
+        self.assertEqual(len(self.collection.execute(query)), count + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import json
+import unittest
+from unittest import mock
+
+from Tuleap.RestClient.Pagination import PageRequestError, iterate_items, iterate_pages, \
+    iterate_raw_pages
+
+
+class FakeProjects(object):
+    """
+    Owner of two list methods that share the data and count of the last request (like the REST API
+    classes)
+    """
+
+    def __init__(self, project_count, tracker_count, fail_at=None):
+        self.projects = list(range(project_count))
+        self.tracker_count = tracker_count
+        self.fail_at = fail_at
+        self._data = None
+        self._count = None
+
+    def request_projects(self, limit=10, offset=None):
+        if offset == self.fail_at:
+            return False
+
+        self._data = self.projects[offset:offset + limit]
+        self._count = len(self.projects)
+        return True
+
+    def request_trackers(self, project_id, limit=10, offset=None):
+        trackers = ["{:}-{:}".format(project_id, index) for index in range(self.tracker_count)]
+        self._data = trackers[offset:offset + limit]
+        self._count = len(trackers)
+        return True
+
+    def get_data(self):
+        return self._data
+
+    def get_count(self):
+        return self._count
+
+
+class FakeResponse(object):
+    def __init__(self, content, headers):
+        self.content = content
+        self.headers = headers
+
+
+class FakeConnection(object):
+    """
+    Returns at most "max_limit" items per page (announced in "X-PAGINATION-LIMIT-MAX"), with or
+    without the total number of items
+    """
+
+    def __init__(self, item_count, max_limit, send_total=True):
+        self.items = [{"id": index} for index in range(item_count)]
+        self.max_limit = max_limit
+        self.send_total = send_total
+        self.offsets = []
+        self._lastResponseMessage = None
+
+    def call_get_method(self, relative_url, parameters=None):
+        offset = parameters["offset"]
+        self.offsets.append(offset)
+        page = self.items[offset:offset + min(parameters["limit"], self.max_limit)]
+        headers = {"X-PAGINATION-LIMIT-MAX": str(self.max_limit)}
+
+        if self.send_total:
+            headers["X-PAGINATION-SIZE"] = str(len(self.items))
+
+        self._lastResponseMessage = FakeResponse(json.dumps(page).encode(), headers)
+        return True
+
+    def get_last_response_message(self):
+        return self._lastResponseMessage
+
+
+class PaginationTest(unittest.TestCase):
+    def test_pages(self):
+        owner = FakeProjects(25, 0)
+        self.assertEqual([(offset, len(page))
+                          for offset, page in iterate_pages(owner.request_projects, limit=10)],
+                         [(0, 10), (10, 10), (20, 5)])
+        self.assertEqual(list(iterate_items(owner.request_projects, limit=10, offset=20)),
+                         list(range(20, 25)))
+
+    def test_nested_walk_on_same_owner(self):
+        owner = FakeProjects(10, 2)
+        projects = []
+        trackers = []
+
+        for project_id in iterate_items(owner.request_projects, limit=3):
+            projects.append(project_id)
+            trackers.extend(iterate_items(owner.request_trackers, project_id, limit=3))
+
+        self.assertEqual(projects, list(range(10)))
+        self.assertEqual(len(trackers), 20)
+
+    def test_failed_request(self):
+        owner = FakeProjects(25, 0, fail_at=10)
+
+        with self.assertRaises(PageRequestError):
+            list(iterate_items(owner.request_projects, limit=10))
+
+    def test_raw_pages(self):
+        for send_total in (True, False):
+            connection = FakeConnection(10, max_limit=4, send_total=send_total)
+
+            # The pages are passed on without being decoded
+            with mock.patch("json.loads", side_effect=AssertionError("page decoded")):
+                pages = list(iterate_raw_pages(connection, "/trackers/1/artifacts", limit=10))
+
+            self.assertEqual([offset for offset, _ in pages], [0, 4, 8])
+            self.assertEqual([item["id"] for _, page in pages for item in json.loads(page)],
+                             list(range(10)))
+
+            # Without the total the walk stops on the empty page (the offset is advanced by the
+            # maximum page size)
+            self.assertEqual(connection.offsets, [0, 4, 8] if send_total else [0, 4, 8, 12])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+from Tuleap.RestClient import ParallelFilter
+from Tuleap.RestClient.ArtifactTable import parse_artifact_page
+from Tuleap.RestClient.ColumnFilter import get_table_columns
+from Tuleap.RestClient.Filter import CaseSensitivity, ComparisonOperation, FilterQuery, \
+    LogicalOperation, MissingValue, NumericFilterItem, StringComparisonOperation, StringFilterItem
+from Tuleap.RestClient.ParallelFilter import filter_columns_many, filter_many
+
+
+class ParallelFilterTest(unittest.TestCase):
+    def setUp(self):
+        self.items = [{"id": index,
+                       "points": index % 7,
+                       "status": ["Open", "Closed", "New"][index % 3],
+                       "effort": None if index % 5 == 0 else index % 11}
+                      for index in range(1000)]
+        self.query = FilterQuery([StringFilterItem("status",
+                                                   StringComparisonOperation.NotEqualTo,
+                                                   "closed",
+                                                   CaseSensitivity.CaseInsensitive),
+                                  FilterQuery([NumericFilterItem("points",
+                                                                 ComparisonOperation.GreaterThan,
+                                                                 4),
+                                               NumericFilterItem("effort",
+                                                                 ComparisonOperation.LessThan,
+                                                                 3,
+                                                                 MissingValue.NoMatch)],
+                                              LogicalOperation.Or)],
+                                 LogicalOperation.And)
+        self.expected = [item for item in self.items if self.query.execute(item)]
+
+    def test_in_process(self):
+        self.assertEqual(filter_many(self.query, self.items), self.expected)
+        self.assertEqual(filter_many(self.query, iter(self.items), processes=4, indices=True),
+                         [item["id"] for item in self.expected])
+
+    def test_parallel(self):
+        self.assertEqual(filter_many(self.query, self.items, processes=3, chunk_size=70,
+                                     min_parallel_items=0),
+                         self.expected)
+
+        # Without the "fork" start method the chunks are pickled
+        with mock.patch.object(ParallelFilter, "_fork_context", return_value=None):
+            self.assertEqual(filter_many(self.query, self.items, processes=2,
+                                         min_parallel_items=0, indices=True),
+                             [item["id"] for item in self.expected])
+
+    def test_columns(self):
+        columns = {"points": [item["points"] for item in self.items],
+                   "status": [item["status"] for item in self.items],
+                   "effort": [item["effort"] for item in self.items]}
+        expected = self.query.execute_columns(columns).get_indices()
+        self.assertEqual(filter_columns_many(self.query, columns, processes=3, chunk_size=90,
+                                             min_parallel_items=0),
+                         expected)
+        self.assertEqual(expected, [item["id"] for item in self.expected])
+
+        table = parse_artifact_page([{"id": index,
+                                      "project": {"id": 1},
+                                      "tracker": {"id": 2},
+                                      "values": [{"field_id": 10, "type": "int", "label": "Points",
+                                                  "value": index % 9 if index % 4 else None}]}
+                                     for index in range(300)])
+        query = FilterQuery([NumericFilterItem("Points", ComparisonOperation.LessThan, 3)],
+                            LogicalOperation.And)
+        table_columns = get_table_columns(table)
+        self.assertEqual(filter_columns_many(query, table_columns, processes=2,
+                                             min_parallel_items=0),
+                         query.execute_columns(table_columns).get_indices())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import json
+import unittest
+
+from Tuleap.RestClient.ArtifactTable import ArtifactTable
+from Tuleap.RestClient.ParallelParser import ParallelParser, ParseOutput
+
+
+def make_page(first_id, count):
+    return json.dumps([{"id": artifact_id,
+                        "xref": "story #{:}".format(artifact_id),
+                        "project": {"id": 1},
+                        "tracker": {"id": 2},
+                        "values": [{"field_id": 10, "type": "int", "label": "Points",
+                                    "value": artifact_id},
+                                   {"field_id": 11, "type": "art_link", "label": "Links",
+                                    "links": [{"id": artifact_id + 1, "type": "_is_child"}],
+                                    "reverse_links": []}]}
+                       for artifact_id in range(first_id, first_id + count)]).encode("utf-8")
+
+
+class ParallelParserTest(unittest.TestCase):
+    def setUp(self):
+        self.pages = [(offset, make_page(offset, 5)) for offset in range(0, 40, 5)]
+
+    def test_ordered(self):
+        parser = ParallelParser(processes=2, max_pending=2)
+        results = list(parser.parse_pages(self.pages))
+        self.assertEqual([offset for offset, _ in results], list(range(0, 40, 5)))
+
+        artifacts = [artifact for _, page in results for artifact in page]
+        self.assertEqual([artifact.get_id() for artifact in artifacts], list(range(40)))
+        self.assertEqual(artifacts[3].get_values()[0]["value"], "3")
+        self.assertEqual(artifacts[3].get_links(), [4])
+        self.assertEqual(artifacts[3].get_links_types(), ["_is_child"])
+
+    def test_unordered_table(self):
+        parser = ParallelParser(output=ParseOutput.ArtifactTable, typed=True, processes=2)
+        results = dict(parser.parse_pages((page for _, page in self.pages), ordered=False))
+        self.assertEqual(sorted(results.keys()), list(range(8)))
+        self.assertIsInstance(results[1], ArtifactTable)
+        self.assertEqual(results[1].get_artifact_ids().tolist(), [5, 6, 7, 8, 9])
+        self.assertEqual(results[1].get_column(10).to_list(), [5, 6, 7, 8, 9])
+
+    def test_serial(self):
+        tracker = {"id": 2, "fields": [{"field_id": 10, "type": "int", "label": "Points"}]}
+        parser = ParallelParser(typed=True, tracker=tracker)
+        results = list(parser.parse_pages_serially(self.pages[:1]))
+        self.assertEqual([artifact.get_values()[0]["value"] for artifact in results[0][1]],
+                         [0, 1, 2, 3, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
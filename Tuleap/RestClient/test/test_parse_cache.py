@@ -0,0 +1,72 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.ParseCache import ParseCache
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        request_file = open("Tuleap/RestClient/test/request_artifact_response.txt", "r")
+        self.item = json.loads(request_file.read())
+        request_file.close()
+        self.item["last_modified_date"] = "2017-05-19T11:46:21+02:00"
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_item(self, artifact_id, version):
+        item = dict(self.item)
+        item["id"] = artifact_id
+        item["last_modified_date"] = version
+        return item
+
+    def test_hits_and_versions(self):
+        cache = ParseCache()
+        parsed = cache.parse(self.item)
+        self.assertIsInstance(parsed, ArtifactParser)
+        self.assertIs(cache.parse(self.item), parsed)
+        self.assertIsNot(cache.parse(self.make_item(self.item["id"], "2018-01-01")), parsed)
+
+        item = dict(self.item)
+        del item["last_modified_date"]
+        cache.parse(item)
+
+        metrics = cache.get_metrics()
+        self.assertEqual((metrics["hits"], metrics["misses"], metrics["uncached"]), (1, 2, 1))
+        self.assertEqual(metrics["hit_ratio"], 0.25)
+        self.assertEqual(cache.get_size(), 1)
+
+    def test_eviction(self):
+        cache = ParseCache(max_entries=2)
+        first = cache.parse(self.make_item(1, "a"))
+        cache.parse(self.make_item(2, "a"))
+        cache.parse(self.make_item(1, "a"))
+        cache.parse(self.make_item(3, "a"))
+        self.assertIs(cache.parse(self.make_item(1, "a")), first)
+        self.assertEqual(cache.get_metrics()["evictions"], 1)
+        self.assertEqual(cache.get_size(), 2)
+
+    def test_disk_tier(self):
+        path = os.path.join(self.directory, "cache.sqlite")
+        cache = ParseCache(path=path)
+        cache.parse(self.item)
+        cache.close()
+
+        cache = ParseCache(path=path)
+        parsed = cache.parse(self.item)
+        self.assertEqual(parsed.get_links(), [101, 102])
+        self.assertEqual(cache.get_metrics()["disk_hits"], 1)
+
+        cache.invalidate(self.item["id"])
+        cache.parse(self.item)
+        self.assertEqual(cache.get_metrics()["misses"], 1)
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import pickle
+import unittest
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.ArtifactTable import parse_artifact_page
+from Tuleap.RestClient.CompactArtifact import CompactArtifact
+from Tuleap.RestClient.GitReferenceIndex import GitReferenceIndex
+from Tuleap.RestClient.ParseDiagnostics import ParseDiagnostics, ParseProblem
+from Tuleap.RestClient.TrackerSchemaParser import TrackerSchemaParser
+from Tuleap.RestClient.ValueParser import ValueParser
+
+
+class ParseDiagnosticsTest(unittest.TestCase):
+    def test_value_parser(self):
+        diagnostics = ParseDiagnostics()
+        self.assertFalse(ValueParser({"type": "int", "field_id": 1}, False, diagnostics).is_valid())
+        self.assertFalse(ValueParser({"field_id": 2, "label": "L", "value": 1}, False,
+                                     diagnostics).is_valid())
+        self.assertFalse(ValueParser("garbage", False, diagnostics).is_valid())
+        self.assertFalse(ValueParser({"type": "int", "field_id": 3, "label": "L", "value": "x"},
+                                     True, diagnostics).is_valid())
+        self.assertFalse(ValueParser({"type": "sb", "field_id": 4, "label": "L", "values": None},
+                                     False, diagnostics).is_valid())
+
+        unknown = ValueParser({"type": "priority", "field_id": 5, "label": "L"}, False, diagnostics)
+        self.assertEqual(unknown.get_value(), "Unknown_priority")
+        self.assertIs(unknown.get_value(), ValueParser({"type": "priority"}).get_value())
+
+        self.assertEqual(diagnostics.get_count(), 6)
+        self.assertEqual(diagnostics.get_count(ParseProblem.MissingLabel), 1)
+        self.assertEqual(diagnostics.get_count(ParseProblem.MissingType), 1)
+        self.assertEqual(diagnostics.get_count(ParseProblem.MalformedItem), 1)
+        self.assertEqual(diagnostics.get_count(ParseProblem.MalformedValue), 2)
+        self.assertEqual(diagnostics.get_count(ParseProblem.UnknownType), 1)
+
+    def test_artifact_parser(self):
+        item = {"xref": "story #1",
+                "project": {"id": 1},
+                "tracker": {"id": 2},
+                "values": [{"type": "art_link", "field_id": 10, "label": "Links",
+                            "links": [{"type": None}, {"id": 3, "type": None}]},
+                           {"type": "cross", "field_id": 11, "label": "Cross",
+                            "value": [{"url": "http://x"},
+                                      {"ref": "git #repo/abcd", "direction": "out"}]}]}
+
+        for lazy in [False, True]:
+            diagnostics = ParseDiagnostics()
+            artifact = ArtifactParser(item, lazy=lazy, diagnostics=diagnostics)
+            self.assertEqual(artifact.get_links(), [3])
+            self.assertEqual(artifact.get_out_git_references(), ["git #repo/abcd"])
+
+            summary = diagnostics.get_summary()
+            self.assertIn((ParseProblem.MalformedLink, "art_link", 1, [10]), summary)
+            self.assertIn((ParseProblem.MalformedReference, "cross", 1, [11]), summary)
+
+    def test_malformed_entries(self):
+        def make_item(values):
+            return {"id": 1, "xref": "story #1", "project": {"id": 1}, "tracker": {"id": 2},
+                    "values": values}
+
+        links = {"type": "art_link", "field_id": 10, "label": "Links",
+                 "links": [None, 5, {"id": 3, "type": "_is_child"}],
+                 "reverse_links": 5}
+        references = {"type": "cross", "field_id": 11, "label": "Cross",
+                      "value": ["abc", None, {"ref": "git #repo/abcd", "direction": "out"}]}
+        item = make_item([links, references])
+        tracker = {"id": 2, "fields": [{"field_id": 10, "type": "art_link"},
+                                       {"field_id": 11, "type": "cross"}]}
+
+        for lazy in [False, True]:
+            diagnostics = ParseDiagnostics()
+            artifact = ArtifactParser(item, lazy=lazy, diagnostics=diagnostics)
+            self.assertEqual(artifact.get_links(), [3])
+            self.assertEqual(artifact.get_links_types(), ["_is_child"])
+            self.assertEqual(artifact.get_reverse_links(), [])
+            self.assertEqual(artifact.get_out_git_references(), ["git #repo/abcd"])
+            self.assertEqual(diagnostics.get_summary(),
+                             [(ParseProblem.MalformedItem, "art_link", 3, [10]),
+                              (ParseProblem.MalformedItem, "cross", 2, [11])])
+
+        for artifact in [CompactArtifact(item), TrackerSchemaParser(tracker).parse(item)]:
+            self.assertEqual(artifact.get_links(), [3])
+            self.assertEqual(artifact.get_reverse_links(), [])
+            self.assertEqual(artifact.get_out_git_references(), ["git #repo/abcd"])
+
+        table = parse_artifact_page([item])
+        self.assertEqual(table.get_link_edges()[1].tolist(), [3])
+        self.assertEqual(table.get_git_references()[2], ["git #repo/abcd"])
+
+        index = GitReferenceIndex()
+        index.add_item(make_item([None, references, {"type": "cross", "value": {"ref": "x"}}]))
+        self.assertEqual(index.get_artifact_ids("git #repo/abcd"), [1])
+
+        # Values that are not a list are a single malformed item
+        for values in ["notalist", {"field_id": 1}]:
+            diagnostics = ParseDiagnostics()
+            self.assertEqual(ArtifactParser(make_item(values), diagnostics=diagnostics)
+                             .get_values(), [])
+            self.assertEqual(diagnostics.get_summary(), [(ParseProblem.MalformedItem, None, 1, [])])
+            self.assertEqual(CompactArtifact(make_item(values)).get_values(), [])
+            self.assertEqual(TrackerSchemaParser(tracker).extract_values(make_item(values)),
+                             dict())
+            self.assertEqual(parse_artifact_page([make_item(values)]).get_row_count(), 1)
+
+    def test_merge_and_pickle(self):
+        diagnostics = ParseDiagnostics()
+        diagnostics.record(ParseProblem.UnknownType, "perm", 7)
+        copy = pickle.loads(pickle.dumps(diagnostics))
+        copy.merge(diagnostics)
+        self.assertEqual(copy.get_summary(), [(ParseProblem.UnknownType, "perm", 2, [7])])
+        self.assertEqual(str(copy), "UnknownType: 2 (type: perm) (fields: 7)")
+
+
+if __name__ == '__main__':
+    unittest.main()
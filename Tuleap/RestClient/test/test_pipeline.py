@@ -0,0 +1,137 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from Tuleap.RestClient.ArtifactStore import ArtifactStore
+from Tuleap.RestClient.Filter import ComparisonOperation, FilterQuery, LogicalOperation, \
+    NumericFilterItem
+from Tuleap.RestClient.Pipeline import Pipeline, Parallelism, artifact_to_dict
+
+
+def square(value):
+    return value * value
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+class FakeTracker(object):
+    def __init__(self, items):
+        self.items = items
+        self.data = None
+        self.requested_offsets = []
+
+    def request_artifact_list(self, tracker_id, limit=None, offset=None):
+        self.requested_offsets.append(offset)
+        self.data = self.items[offset:offset + limit]
+        return True
+
+    def get_data(self):
+        return self.data
+
+    def get_count(self):
+        return len(self.items)
+
+
+class PipelineTest(unittest.TestCase):
+    def setUp(self):
+        request_file = open("Tuleap/RestClient/test/request_artifact_response.txt", "r")
+        self.item = json.loads(request_file.read())
+        request_file.close()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def make_items(self, count):
+        items = []
+
+        for artifact_id in range(count):
+            item = dict(self.item)
+            item["id"] = artifact_id
+            item["xref"] = "story #{:}".format(artifact_id)
+            items.append(item)
+
+        return items
+
+    def test_serial_stages(self):
+        result = Pipeline(range(10)).map(square).filter(is_even).to_list()
+        self.assertEqual(result, [0, 4, 16, 36, 64])
+
+    def test_parallel_stages_keep_order(self):
+        for parallelism in (Parallelism.Threads, Parallelism.Processes):
+            result = Pipeline(range(200)) \
+                .map(square, workers=2, parallelism=parallelism, buffer_size=3, chunk_size=7) \
+                .filter(is_even, workers=2, parallelism=parallelism, chunk_size=5) \
+                .to_list()
+            self.assertEqual(result, [value * value for value in range(200) if value % 2 == 0])
+
+    def test_stages_are_lazy(self):
+        consumed = []
+
+        def source():
+            for value in range(1000):
+                consumed.append(value)
+                yield value
+
+        pipeline = Pipeline(source()).map(square, workers=2, buffer_size=4).prefetch(buffer_size=2)
+        self.assertEqual(consumed, [])
+
+        iterator = iter(pipeline)
+        self.assertEqual(next(iterator), 0)
+        self.assertLess(len(consumed), 20)
+
+    def test_prefetch_propagates_errors(self):
+        def source():
+            yield 1
+            raise ValueError("broken page")
+
+        with self.assertRaises(ValueError):
+            Pipeline(source()).prefetch().to_list()
+
+    def test_parse_filter_project(self):
+        tracker = FakeTracker(self.make_items(25))
+        query = FilterQuery([NumericFilterItem("project_id",
+                                               ComparisonOperation.EqualTo,
+                                               self.item["project"]["id"])],
+                            LogicalOperation.And)
+
+        rows = Pipeline.from_request(tracker.request_artifact_list, tracker_id=20, limit=10) \
+            .parse(workers=2) \
+            .map(artifact_to_dict) \
+            .filter(query) \
+            .project({"artifact": "name", "tracker": "tracker_id"}) \
+            .to_list()
+
+        self.assertEqual(tracker.requested_offsets, [0, 10, 20])
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[3], {"artifact": "story #3", "tracker": self.item["tracker"]["id"]})
+
+    def test_sinks(self):
+        rows = [{"name": "a", "links": [1, 2]}, {"name": "b", "links": []}]
+
+        jsonl_path = os.path.join(self.directory, "rows.jsonl")
+        self.assertEqual(Pipeline(rows).to_jsonl(jsonl_path), 2)
+
+        with open(jsonl_path, "r") as jsonl_file:
+            self.assertEqual([json.loads(line) for line in jsonl_file], rows)
+
+        csv_path = os.path.join(self.directory, "rows.csv")
+        self.assertEqual(Pipeline(rows).to_csv(csv_path), 2)
+
+        with open(csv_path, "r", newline="") as csv_file:
+            self.assertEqual(list(csv.DictReader(csv_file)),
+                             [{"name": "a", "links": "1, 2"}, {"name": "b", "links": ""}])
+
+        store = ArtifactStore()
+        self.assertEqual(Pipeline(self.make_items(7)).to_artifact_store(store, batch_size=3), 7)
+        self.assertEqual(sorted(store.get_artifact_ids()), list(range(7)))
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from Tuleap.RestClient.TrackerExporter import ExportFormat, TrackerExporter
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+TRACKER = {"id": 20,
+           "fields": [{"field_id": 1, "type": "string", "label": "Title"},
+                      {"field_id": 2, "type": "int", "label": "Points"},
+                      {"field_id": 3, "type": "lud", "label": "Updated"},
+                      {"field_id": 4, "type": "msb", "label": "Teams"},
+                      {"field_id": 5, "type": "art_link", "label": "Links"}]}
+
+
+def make_artifact(artifact_id):
+    return {"id": artifact_id,
+            "xref": "story #{:}".format(artifact_id),
+            "project": {"id": 1},
+            "tracker": {"id": 20},
+            "values": [{"field_id": 1, "type": "string", "label": "Title",
+                        "value": "Story {:}".format(artifact_id)},
+                       {"field_id": 2, "type": "int", "label": "Points",
+                        "value": artifact_id % 5 if artifact_id % 4 else None},
+                       {"field_id": 3, "type": "lud", "label": "Updated",
+                        "value": "2018-01-{:02d}T10:00:00+02:00".format(artifact_id % 28 + 1)},
+                       {"field_id": 4, "type": "msb", "label": "Teams",
+                        "values": [{"id": 7, "label": "A"}, {"id": artifact_id, "label": "B"}],
+                        "bind_value_ids": [7, artifact_id]},
+                       {"field_id": 5, "type": "art_link", "label": "Links", "links": []}]}
+
+
+class FakeResponse(object):
+    def __init__(self, data, headers):
+        self.text = json.dumps(data)
+        self.headers = headers
+
+
+class FakeConnection(object):
+    """
+    Serves the tracker structure and the artifact pages (at most "max_limit" artifacts per page),
+    the requests fail after "fail_after" artifact pages
+    """
+
+    def __init__(self, artifacts, max_limit=100, fail_after=None):
+        self.artifacts = artifacts
+        self.max_limit = max_limit
+        self.fail_after = fail_after
+        self.requested_offsets = []
+        self.response = None
+
+    def clone(self):
+        return FakeConnectionCopy(self)
+
+    def is_logged_in(self):
+        return True
+
+    def call_get_method(self, relative_url, parameters=None):
+        if relative_url == "/trackers/20":
+            self.response = FakeResponse(TRACKER, {})
+            return True
+
+        if (self.fail_after is not None) and (len(self.requested_offsets) >= self.fail_after):
+            return False
+
+        self.requested_offsets.append(parameters["offset"])
+        offset = parameters["offset"]
+        limit = min(parameters["limit"], self.max_limit)
+        self.response = FakeResponse(self.artifacts[offset:offset + limit],
+                                     {"X-PAGINATION-SIZE": str(len(self.artifacts))})
+        return True
+
+    def get_last_response_message(self):
+        return self.response
+
+
+class FakeConnectionCopy(FakeConnection):
+    def __init__(self, original):
+        FakeConnection.__init__(self, original.artifacts, original.max_limit, original.fail_after)
+        self.requested_offsets = original.requested_offsets
+
+
+class TrackerExporterTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.artifacts = [make_artifact(artifact_id) for artifact_id in range(1, 254)]
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_csv(self):
+        path = os.path.join(self.directory, "stories.csv")
+        connection = FakeConnection(self.artifacts, max_limit=20)
+        reports = []
+        exporter = TrackerExporter(connection, 20, path, page_size=50, parallel_requests=3,
+                                   row_group_size=60)
+        result = exporter.export(progress=reports.append)
+
+        self.assertEqual((result.rows, result.pages, result.offset, result.total),
+                         (253, 13, 253, 253))
+        self.assertEqual(len(reports), 5)
+        self.assertEqual(sorted(connection.requested_offsets), list(range(0, 253, 20)))
+        self.assertFalse(os.path.exists(exporter.get_state_path()))
+
+        with open(path, "r", newline="") as csv_file:
+            rows = list(csv.reader(csv_file))
+
+        self.assertEqual(rows[0], ["artifact_id", "Title", "Points", "Updated", "Teams"])
+        self.assertEqual(rows[1], ["1", "Story 1", "1", "2018-01-02T10:00:00+02:00", "7, 1"])
+        self.assertEqual(rows[4][2], "")
+        self.assertEqual([row[0] for row in rows[1:]], [str(index) for index in range(1, 254)])
+
+    def test_resume(self):
+        path = os.path.join(self.directory, "stories.jsonl")
+        exporter = TrackerExporter(FakeConnection(self.artifacts, fail_after=7), 20, path,
+                                   ExportFormat.JsonLines, page_size=20, parallel_requests=1,
+                                   row_group_size=40)
+        self.assertRaises(Exception, exporter.export)
+
+        with open(exporter.get_state_path(), "r") as state_file:
+            self.assertEqual(json.load(state_file)["offset"], 120)
+
+        connection = FakeConnection(self.artifacts)
+        result = TrackerExporter(connection, 20, path, ExportFormat.JsonLines, page_size=20,
+                                 parallel_requests=2, row_group_size=40).export()
+        self.assertEqual(min(connection.requested_offsets), 120)
+        self.assertEqual(result.rows, 253)
+
+        with open(path, "r") as jsonl_file:
+            rows = [json.loads(line) for line in jsonl_file]
+
+        self.assertEqual([row["artifact_id"] for row in rows], list(range(1, 254)))
+        self.assertEqual(rows[0]["Teams"], [7, 1])
+        self.assertEqual(rows[0]["Updated"], "2018-01-02T10:00:00+02:00")
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+        path = os.path.join(self.directory, "stories")
+        exporter = TrackerExporter(FakeConnection(self.artifacts, fail_after=5), 20, path,
+                                   ExportFormat.Parquet, page_size=25, parallel_requests=1,
+                                   row_group_size=50, skipped_types=["lud"])
+        self.assertRaises(Exception, exporter.export)
+        self.assertEqual(sorted(os.listdir(path)), ["part-00000.parquet", "part-00001.parquet"])
+
+        exporter = TrackerExporter(FakeConnection(self.artifacts), 20, path, ExportFormat.Parquet,
+                                   page_size=25, row_group_size=50, skipped_types=["lud"])
+        self.assertEqual(exporter.export().rows, 253)
+
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.column_names, ["artifact_id", "Title", "Points", "Teams"])
+        self.assertEqual(table.column("artifact_id").to_pylist(), list(range(1, 254)))
+        self.assertEqual(table.column("Points").to_pylist()[:4], [1, 2, 3, None])
+        self.assertEqual(table.column("Teams").to_pylist()[2], [7, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import copy
+import json
+import unittest
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.ParseDiagnostics import ParseDiagnostics, ParseProblem
+from Tuleap.RestClient.TrackerSchemaParser import TrackerSchemaParser
+
+
+class TrackerSchemaParserTest(unittest.TestCase):
+    def setUp(self):
+        request_file = open("Tuleap/RestClient/test/artifact_response_crossrefs.txt", "r")
+        self.item = json.loads(request_file.read())
+        request_file.close()
+        self.tracker = {"id": 140,
+                        "fields": [{"field_id": value["field_id"],
+                                    "label": value["label"],
+                                    "type": value["type"]} for value in self.item["values"]]}
+
+    def test_parse(self):
+        artifact = TrackerSchemaParser(self.tracker).parse(self.item)
+        self.assertTrue(artifact.is_valid())
+        self.assertEqual(artifact.get_name(), "story #26808")
+        self.assertEqual(len(artifact.get_values()), 14)
+        self.assertEqual(artifact.get_reverse_links(), [25714, 26754])
+        self.assertEqual(len(artifact.get_in_git_references()), 3)
+
+    def test_selected_fields(self):
+        parser = TrackerSchemaParser(self.tracker, field_ids=[1245, 1227])
+        artifact = parser.parse(self.item)
+        self.assertEqual([value['label'] for value in artifact.get_values()], ["Status", "So that"])
+        self.assertEqual(artifact.get_reverse_links(), [])
+
+    def test_skipped_types(self):
+        parser = TrackerSchemaParser(self.tracker, skipped_types=["text", "file"], typed=True)
+        values = parser.extract_values(self.item)
+        self.assertNotIn(1227, values)
+        self.assertNotIn(1246, values)
+        self.assertEqual(values[1245], 1338)
+        self.assertEqual(parser.get_field_type(1221), "INTEGER")
+
+    def test_malformed_values(self):
+        item = copy.deepcopy(self.item)
+        value_items = dict((value["field_id"], value) for value in item["values"])
+        value_items[1245]["values"] = None
+        value_items[1245]["bind_value_ids"] = 5
+        del value_items[1227]["value"]
+        item["values"].append("not a value item")
+
+        for typed in (False, True):
+            diagnostics = ParseDiagnostics()
+            parser = TrackerSchemaParser(self.tracker, typed=typed, diagnostics=diagnostics)
+            values = parser.extract_values(item)
+            self.assertNotIn(1245, values)
+            self.assertNotIn(1227, values)
+            self.assertEqual(diagnostics.get_count(ParseProblem.MalformedValue), 1)
+            self.assertEqual(diagnostics.get_count(ParseProblem.MissingValue), 1)
+            self.assertEqual(diagnostics.get_count(ParseProblem.MalformedItem), 1)
+
+            # Same values as the ArtifactParser (without the items of unknown types)
+            artifact = parser.parse(item)
+            self.assertTrue(artifact.is_valid())
+            self.assertEqual(sorted(value["id"] for value in artifact.get_values()),
+                             sorted(value["id"]
+                                    for value in ArtifactParser(item, typed).get_values()
+                                    if not str(value["value"]).startswith("Unknown_")))
+            self.assertEqual(diagnostics.get_count(), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from Tuleap.RestClient.ArtifactParser import ArtifactParser
+from Tuleap.RestClient.ValueParser import ValueParser, parse_date
+
+
+class ValueParserTest(unittest.TestCase):
+    def setUp(self):
+        request_file = open("Tuleap/RestClient/test/artifact_response_crossrefs.txt", "r")
+        self.values = dict((value["field_id"], value)
+                           for value in json.loads(request_file.read())["values"])
+        request_file.close()
+
+    def test_string_values(self):
+        value = ValueParser(self.values[1221])
+        self.assertTrue(value.is_valid())
+        self.assertEqual(value.get_value(), "26808")
+        self.assertEqual(value.get_type(), "INTEGER")
+        self.assertEqual(ValueParser(self.values[1245]).get_value(), "Done")
+        self.assertEqual(ValueParser(self.values[1222]).get_value(), "Manuel Vacelet (vaceletm)")
+        self.assertEqual(ValueParser(self.values[3139]).get_value(), "Unknown_priority")
+
+    def test_typed_values(self):
+        value = ValueParser(self.values[1221], typed=True)
+        self.assertEqual(value.get_value(), 26808)
+        self.assertEqual(value.get_type(), "INTEGER")
+
+        value = ValueParser(self.values[1245], typed=True)
+        self.assertEqual(value.get_value(), 1338)
+        self.assertEqual(value.get_type(), "ID")
+
+        value = ValueParser(self.values[1224], typed=True)
+        self.assertEqual(value.get_value(), parse_date("2022-05-18T13:37:55+02:00"))
+        self.assertEqual(value.get_type(), "DATE")
+
+        self.assertEqual(ValueParser(self.values[1222], typed=True).get_value(), 105)
+        self.assertEqual(ValueParser(self.values[1827], typed=True).get_value(), [])
+
+    def test_invalid_values(self):
+        self.assertFalse(ValueParser({"type": "int", "field_id": 1}).is_valid())
+        self.assertFalse(ValueParser({"field_id": 1, "label": "Label", "value": 1}).is_valid())
+
+    def test_parse_date(self):
+        date = parse_date("2017-05-19T11:46:21+02:00")
+        self.assertEqual((date.year, date.month, date.day, date.hour), (2017, 5, 19, 11))
+        self.assertEqual(parse_date("2017-05-19").day, 19)
+        self.assertEqual(parse_date(""), None)
+        self.assertEqual(parse_date("yesterday"), None)
+
+    def test_typed_artifact_parser(self):
+        artifact = ArtifactParser({"xref": "story #1",
+                                   "project": {"id": 1},
+                                   "tracker": {"id": 2},
+                                   "values": [self.values[1221], self.values[1245]]},
+                                  typed=True)
+        self.assertEqual([value['value'] for value in artifact.get_values()], [26808, 1338])
+
+
+if __name__ == '__main__':
+    unittest.main()